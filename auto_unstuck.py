@@ -169,6 +169,37 @@ class UnstuckDisplay:
         else:
             return "red"
     
+    @staticmethod
+    def get_display_state():
+        """Get (text, color) for the unstuck countdown label"""
+        # Check if auto unstuck is enabled
+        if not config.auto_change_target_enabled:
+            return "Unstuck: Disabled", "gray"
+        
+        if (config.enemy_hp_stagnant_time == 0 or 
+            config.last_enemy_hp_before_stagnant is None):
+            # Not initialized or no target
+            return "Unstuck: ---", "gray"
+        
+        # Get remaining time
+        _, remaining_time = UnstuckTimer.get_remaining_time(config.unstuck_timeout)
+        
+        # Get color based on remaining time
+        color = UnstuckDisplay.get_color_for_remaining_time(
+            remaining_time, config.unstuck_timeout
+        )
+        
+        # Use ceil to round up so countdown doesn't jump
+        # (e.g., 9.9s shows as 10s until it hits 9.0s)
+        display_seconds = math.ceil(remaining_time)
+        
+        # Show "(no target)" indicator when there's no target but timer is running
+        target_indicator = (
+            " (no target)" if config.enemy_target_time == 0 else ""
+        )
+        
+        return f"Unstuck: {display_seconds}s{target_indicator}", color
+    
     @staticmethod
     def update_display(current_time):
         """Update the unstuck countdown display in the GUI"""
@@ -180,46 +211,14 @@ class UnstuckDisplay:
                 return
             
             gui = BotGUI._instance
-            if not hasattr(gui, 'unstuck_countdown_label'):
-                return
-            
-            # Check if auto unstuck is enabled
-            if not config.auto_change_target_enabled:
-                safe_update_gui(lambda: gui.unstuck_countdown_label.configure(
-                    text="Unstuck: Disabled", 
-                    text_color="gray"
-                ))
+            if getattr(gui, 'unstuck_countdown_label', None) is None:
                 return
             
-            # Get remaining time
-            _, remaining_time = UnstuckTimer.get_remaining_time(config.unstuck_timeout)
-            
-            if (config.enemy_hp_stagnant_time == 0 or 
-                config.last_enemy_hp_before_stagnant is None):
-                # Not initialized or no target
-                safe_update_gui(lambda: gui.unstuck_countdown_label.configure(
-                    text="Unstuck: ---", 
-                    text_color="gray"
-                ))
-            else:
-                # Get color based on remaining time
-                color = UnstuckDisplay.get_color_for_remaining_time(
-                    remaining_time, config.unstuck_timeout
-                )
-                
-                # Use ceil to round up so countdown doesn't jump
-                # (e.g., 9.9s shows as 10s until it hits 9.0s)
-                display_seconds = math.ceil(remaining_time)
-                
-                # Show "(no target)" indicator when there's no target but timer is running
-                target_indicator = (
-                    " (no target)" if config.enemy_target_time == 0 else ""
-                )
-                
-                safe_update_gui(lambda: gui.unstuck_countdown_label.configure(
-                    text=f"Unstuck: {display_seconds}s{target_indicator}",
-                    text_color=color
-                ))
+            text, color = UnstuckDisplay.get_display_state()
+            safe_update_gui(lambda: gui._set_ui(
+                'unstuck', gui.unstuck_countdown_label, 'configure', text,
+                text_color=color
+            ), dedup_key='unstuck_countdown')
         except Exception:
             pass  # Silently fail if GUI not available
 
@@ -236,6 +235,14 @@ def get_unstuck_remaining_time(unstuck_timeout):
     return UnstuckTimer.get_remaining_time(unstuck_timeout)
 
 
+def get_unstuck_countdown_display():
+    """
+    Get unstuck countdown label state
+    Returns (text, color)
+    """
+    return UnstuckDisplay.get_display_state()
+
+
 def update_unstuck_countdown_display(current_time):
     """Update the unstuck countdown display in the GUI"""
     UnstuckDisplay.update_display(current_time)
@@ -107,12 +107,8 @@ def check_buffs():
     if not config.buffs_manager or not config.calibrator:
         return
     
-    # Check if any enabled buffs are configured (have image paths and are enabled)
-    buffs_configured = any(
-        config.buffs_config[i]['image_path'] and config.buffs_config[i]['enabled'] 
-        for i in range(8)
-    )
-    if not buffs_configured:
+    # Check if any enabled buffs are configured (flag is kept current by config.update_buffs_configured)
+    if not config.buffs_configured:
         return
     
     # Need both:
@@ -144,8 +140,9 @@ def check_buffs():
         else:
             hwnd = config.connected_window
         
-        # Capture screen
-        screen = config.calibrator.capture_window(hwnd)
+        # Capture screen (reuse the previous frame buffer when the window size is unchanged)
+        screen = config.calibrator.capture_window(hwnd, out=getattr(check_buffs, 'frame_buf', None))
+        check_buffs.frame_buf = screen
         if screen is not None:
             # Extract area_skills from stored coordinates
             x1, y1, x2, y2 = config.area_skills
@@ -288,15 +285,10 @@ def bot_loop():
                     config.force_initial_target = False
                     print("[Bot Start] Forced initial auto-targeting")
                 
-                # High priority: Auto pots and buffs (buffs should be checked early for combat effectiveness)
+                # High priority: Auto pots (buffs are checked in buff_loop on their own thread)
                 # Only check if features are enabled to avoid unnecessary work
                 if config.auto_hp_enabled or config.auto_mp_enabled:
                     autopots.check_auto_pots()
-                # Only check buffs if any are enabled and configured
-                if (config.buffs_manager and 
-                    any(config.buffs_config[i]['image_path'] and config.buffs_config[i]['enabled'] 
-                        for i in range(8))):
-                    check_buffs()  # High priority - check buffs early (has internal throttling)
                 # Skill sequence is now executed inside check_auto_attack when enemy is found
                 # Also call check_auto_attack when assist_only is enabled (needs to monitor HP for assist logic)
                 if config.auto_attack_enabled or config.assist_only_enabled:
@@ -320,3 +312,18 @@ def bot_loop():
     
     # Clean up when bot stops
     print("Bot loop stopped")
+
+
+def buff_loop():
+    """Buff capture loop that runs in its own thread so screen capture doesn't stall the bot loop"""
+    while config.bot_running:
+        # Same calibration gate bot_loop uses (HP and MP bars both found)
+        if (config.connected_window and config.buffs_configured and config.buffs_manager and
+                config.calibrator and config.calibrator.hp_position is not None and
+                config.is_calibrated()):
+            # Capture and buff matching run back to back on this thread, so every
+            # scan uses the frame it just grabbed (no frame queue, nothing goes stale)
+            check_buffs()  # Has internal throttling
+        time.sleep(0.1)
+    
+    print("Buff loop stopped")
@@ -33,6 +33,14 @@ class BuffsManager:
             self.buffs[idx] = None
             print(f'[BuffsManager] Buff {idx + 1} cleared')
     
+    def set_bulk(self, image_paths):
+        """Replace all buff slots at once (one relative path or None per slot)"""
+        buffs = list(image_paths[:len(self.buffs)])
+        buffs += [None] * (len(self.buffs) - len(buffs))
+        # Swap in a new list so the bot thread never iterates a half-updated one
+        self.buffs = buffs
+        print(f'[BuffsManager] Buffs set: {[i + 1 for i, path in enumerate(buffs) if path]}')
+    
     def set_ui_reference(self, ui):
         """Set reference to UI (kept for compatibility; keys are no longer used)"""
         self.ui_reference = ui
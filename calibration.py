@@ -51,11 +51,12 @@ class Calibrator:
             print(f'[Calibration] Error saving debug image: {e}')
             return None
     
-    def capture_window(self, hwnd):
+    def capture_window(self, hwnd, out=None):
         """
         Capture the screen of a specific window
         Args:
             hwnd: Window handle to capture
+            out: Optional preallocated BGR buffer to write into (reused if its shape matches)
         Returns:
             numpy.array: Image in BGR format
         """
@@ -80,6 +81,9 @@ class Calibrator:
             signedIntsArray = saveBitMap.GetBitmapBits(True)
             img = np.frombuffer(signedIntsArray, dtype='uint8')
             img.shape = (height, width, 4)
+            if out is not None and out.shape == (height, width, 3):
+                cv2.cvtColor(img, cv2.COLOR_BGRA2BGR, dst=out)
+                return out
             result = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
             return result
         except Exception as e:
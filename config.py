@@ -6,6 +6,7 @@ Contains all global variables, constants, and default settings
 # Bot state
 bot_running = False
 bot_thread = None
+buff_thread = None  # Background thread for buff screen capture/activation
 selected_window = None
 connected_window = None  # Store the connected window reference
 force_initial_target = False  # Flag to force auto-target on bot start
@@ -66,6 +67,7 @@ action_slots = {
 
 # Mob detection system
 mob_target_list = []  # List of mob names to target (only attack mobs in this list)
+_mob_target_list_lower = set()  # Lowercased mirror of mob_target_list for fast duplicate checks
 mob_avoid_list = ["Avara Kara", "Dadati", "Patura", "Kamisya", "Kudd"]  # List of mob names to avoid/skip (will not attack these mobs)
 mob_detection_enabled = False
 target_name_area = {'x': 381, 'y': 161, 'width': 0, 'height': 0}
@@ -168,6 +170,7 @@ buffs_config = {
         'key': ''
     } for i in range(8)
 }
+buffs_configured = False  # True if any buff is enabled with an image (see update_buffs_configured)
 
 # Skills area (set during calibration) - (x_min, y_min, x_max, y_max)
 area_skills = None
@@ -204,27 +207,42 @@ _assist_only_previous_mob_detection = None
 _assist_only_previous_auto_change_target = None
 
 
-def safe_update_gui(update_func):
-    """Thread-safe GUI update - queue the update to be processed by GUI thread"""
+def safe_update_gui(update_func, dedup_key=None):
+    """Thread-safe GUI update - queue the update to be processed by GUI thread
+    
+    Updates sharing a dedup_key are coalesced so only the latest one runs per drain.
+    The queue holds (dedup_key, update_func) pairs; dedup_key None never coalesces.
+    """
     try:
-        gui_update_queue.put(update_func, block=False)
+        gui_update_queue.put((dedup_key, update_func), block=False)
     except queue.Full:
         pass  # Skip update if queue is full to prevent blocking
 
 
-def resolve_resource_path(relative_path):
+def update_buffs_configured():
+    """Recompute buffs_configured - call after changing buffs_config enabled/image_path"""
+    global buffs_configured
+    buffs_configured = any(
+        buffs_config[i]['image_path'] and buffs_config[i]['enabled']
+        for i in range(8)
+    )
+
+
+def is_calibrated():
+    """True once a calibrator exists and has found the MP bar position"""
+    return calibrator is not None and calibrator.mp_position is not None
+
+
+def resource_path(relative_path):
     """
-    Resolve a relative resource path that works in both development and PyInstaller builds.
+    Build the absolute path of a bundled resource without checking that it exists.
     
     Args:
         relative_path: Relative path string (e.g., "jobs/Nakayuda/1.BMP")
         
     Returns:
-        Resolved absolute path, or None if path doesn't exist
+        Absolute path inside the app folder (or the PyInstaller bundle)
     """
-    if not relative_path:
-        return None
-    
     import os
     import sys
     
@@ -241,7 +259,25 @@ def resolve_resource_path(relative_path):
     
     # Join base path with relative path
     resolved_path = os.path.join(base_path, relative_path)
-    resolved_path = os.path.normpath(resolved_path)
+    return os.path.normpath(resolved_path)
+
+
+def resolve_resource_path(relative_path):
+    """
+    Resolve a relative resource path that works in both development and PyInstaller builds.
+    
+    Args:
+        relative_path: Relative path string (e.g., "jobs/Nakayuda/1.BMP")
+        
+    Returns:
+        Resolved absolute path, or None if path doesn't exist
+    """
+    if not relative_path:
+        return None
+    
+    import os
+    
+    resolved_path = resource_path(relative_path)
     
     # Return path if it exists, otherwise None
     return resolved_path if os.path.exists(resolved_path) else None
@@ -7,30 +7,161 @@ from tkinter import messagebox, simpledialog
 import customtkinter as ctk
 import threading
 import time
+import atexit
+import concurrent.futures
 import win32gui
 import queue
 import os
 import sys
+import traceback
+from collections import deque, namedtuple
+from functools import lru_cache, partial
+from datetime import datetime
 import config
 import window_utils
 import settings_manager
 import bot_logic
 import input_handler
 import auto_attack
+import auto_unstuck
 import ocr_utils
 import calibration
+import buffs_manager
+import skill_sequence_manager
 from license_manager import get_license_manager
 import debug_utils
 
+# GUI scheduler rate (ticks per second); queued updates are drained every tick
+GUI_TICK_HZ = 20
+
+# Status display refresh rates (ticks per second). The minimized view only
+# shows a few small bars, so it refreshes at half the rate of the main window.
+STATUS_TARGET_HZ = 10
+STATUS_TARGET_HZ_MINIMIZED = 5
+
+# Preformatted "N%" strings for the status bars
+_PCT_STR = tuple(f"{i}%" for i in range(101))
+
+
+def _pct_text(percent):
+    """Format a percentage as "N%" using the preformatted table when in range"""
+    value = int(percent)
+    if 0 <= value <= 100:
+        return _PCT_STR[value]
+    return f"{value}%"
+
+
+# Shared CTkFont instances, created on first use (Tk must exist first)
+_FONTS = {}
+
+
+def _fonts():
+    """Get the shared font table, creating the fonts on first call"""
+    if not _FONTS:
+        _FONTS.update({
+            'title': ctk.CTkFont(size=20, weight="bold"),
+            'label': ctk.CTkFont(size=12, weight="bold"),
+            'body': ctk.CTkFont(size=12),
+            'small_bold': ctk.CTkFont(size=11, weight="bold"),
+            'small': ctk.CTkFont(size=11),
+            'mono': ctk.CTkFont(size=10, family="Courier"),
+            'tiny': ctk.CTkFont(size=10),
+            'hint': ctk.CTkFont(size=9),
+            'tiny_bold': ctk.CTkFont(size=10, weight="bold"),
+            'section': ctk.CTkFont(size=14, weight="bold"),
+            'heading': ctk.CTkFont(size=16, weight="bold"),
+            'icon': ctk.CTkFont(size=16),
+        })
+    return _FONTS
+
+
+# Skill Interval tab slots: (slot, row within its section, column, label)
+_NUMERIC_SLOT_SPECS = tuple((i, (i - 1) % 5, (i - 1) // 5, f"S{i}") for i in range(1, 10)) + ((0, 4, 1, "S0"),)
+_FUNCTION_SLOT_SPECS = tuple((f'f{i}', (i - 1) % 5, (i - 1) // 5, f"F{i}") for i in range(1, 11))
+# Outer (left, right) padding of a slot by grid column: skill interval rows, buff/skill sequence cards
+_SKILL_SLOT_PADX = ((15, 5), (5, 15))
+_SLOT_CARD_PADX = ((10, 5), (5, 10))
+# (row, column) of the 8 buff/skill sequence cards: slots 1-4 then 5-8, below the info frame at row 0
+_SLOT_CARD_GRID = tuple((i % 4 + 1, i // 4) for i in range(8))
+
+
+# Formatted license fields shown in the Status tab and license messagebox
+LicenseDisplay = namedtuple(
+    'LicenseDisplay',
+    ['valid', 'user_name', 'expiry_info', 'issued_str', 'status_color', 'days_left', 'machine_bound']
+)
+
+# Expiry color by days left: first entry whose limit is >= days_left wins, else green
+_LICENSE_EXPIRY_COLORS = ((-1, "red"), (7, "orange"), (30, "yellow"))
+
+
+# Machine ID never changes within a process, so it is looked up once
+_machine_id = None
+
+
+def _get_machine_id():
+    """Get this machine's license ID (cached after the first call)"""
+    global _machine_id
+    if _machine_id is None:
+        _machine_id = get_license_manager().get_machine_id()
+    return _machine_id
+
+
+@lru_cache(maxsize=64)
+def _decode_slot_image_version(image_path, mtime_ns):
+    """Decode one version of a slot image; mtime_ns is only part of the cache key"""
+    from PIL import Image
+    pil_image = Image.open(image_path)
+    return pil_image.resize((40, 40), Image.Resampling.LANCZOS)
+
+
+def _decode_slot_image(image_path):
+    """Open a buff/skill image and scale it to the 40x40 slot canvas (no Tk calls, thread-safe)
+    
+    The result is reused until the file's modification time changes; the 64 most
+    recently used images are kept.
+    """
+    return _decode_slot_image_version(image_path, os.stat(image_path).st_mtime_ns)
+
+
+def _safe_grab_set(dialog, timeout_ms=3000):
+    """Make dialog modal, retrying while another window still holds the grab
+    
+    grab_set raises TclError if the pointer is grabbed elsewhere (common on Linux
+    right after the window maps); retries are rescheduled with after() so the
+    event loop keeps running in the meantime.
+    """
+    deadline = time.monotonic() + timeout_ms / 1000.0
+    
+    def attempt():
+        try:
+            if dialog.winfo_exists():
+                dialog.grab_set()
+        except tk.TclError:
+            if time.monotonic() < deadline:
+                dialog.after(100, attempt)
+            else:
+                print(f"[GUI] Could not grab input for {dialog}; continuing without modal grab")
+    
+    attempt()
+
 
 class ToolTip:
-    """Create a tooltip for a given widget"""
+    """Create a tooltip for a given widget
+    
+    All tooltips share one pending timer and one hidden tip window, so hovering
+    across many widgets only moves/retexts the same Toplevel.
+    """
+    _pending = None  # after() id of the scheduled showtip
+    _pending_owner = None  # ToolTip that scheduled it
+    _tipwindow = None  # Shared tip Toplevel (created on first show)
+    _tiplabel = None
+    _tiptext = None  # Text currently on the shared label
+    _shown_owner = None  # ToolTip currently displayed
+    
     def __init__(self, widget, text='widget info'):
         self.widget = widget
         self.text = text
-        self.tipwindow = None
-        self.id = None
-        self.x = self.y = 0
         self.widget.bind('<Enter>', self.enter)
         self.widget.bind('<Leave>', self.leave)
         self.widget.bind('<ButtonPress>', self.leave)
@@ -43,35 +174,60 @@ class ToolTip:
         self.hidetip()
 
     def schedule(self):
-        self.unschedule()
-        self.id = self.widget.after(500, self.showtip)
+        # Entering any tooltip widget replaces whatever was pending
+        ToolTip._cancel_pending()
+        ToolTip._pending = self.widget.after(500, self.showtip)
+        ToolTip._pending_owner = self
 
     def unschedule(self):
-        id = self.id
-        self.id = None
-        if id:
-            self.widget.after_cancel(id)
+        if ToolTip._pending_owner is self:
+            ToolTip._cancel_pending()
+
+    @staticmethod
+    def _cancel_pending():
+        pending_id = ToolTip._pending
+        owner = ToolTip._pending_owner
+        ToolTip._pending = None
+        ToolTip._pending_owner = None
+        if pending_id:
+            try:
+                owner.widget.after_cancel(pending_id)
+            except tk.TclError:
+                pass  # Owner widget already destroyed
 
     def showtip(self, event=None):
+        ToolTip._pending = None
+        ToolTip._pending_owner = None
         x = y = 0
         x, y, cx, cy = self.widget.bbox("insert") if hasattr(self.widget, 'bbox') else (0, 0, 0, 0)
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 20
-        # Creates a toplevel window
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        # Leaves only the label and removes the app window
-        tw.wm_overrideredirect(True)
+        tw = ToolTip._tipwindow
+        if tw is None or not tw.winfo_exists():
+            # Creates a toplevel window on the app root so it outlives any single dialog
+            ToolTip._tipwindow = tw = tk.Toplevel(self.widget._root())
+            # Leaves only the label and removes the app window
+            tw.wm_overrideredirect(True)
+            ToolTip._tiplabel = tk.Label(tw, justify=tk.LEFT,
+                          background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                          font=("tahoma", "8", "normal"), wraplength=250)
+            ToolTip._tiplabel.pack(ipadx=1)
+            ToolTip._tiptext = None
+        if ToolTip._tiptext != self.text:
+            ToolTip._tiplabel.configure(text=self.text)
+            ToolTip._tiptext = self.text
         tw.wm_geometry("+%d+%d" % (x, y))
-        label = tk.Label(tw, text=self.text, justify=tk.LEFT,
-                      background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                      font=("tahoma", "8", "normal"), wraplength=250)
-        label.pack(ipadx=1)
+        tw.wm_deiconify()
+        tw.lift()
+        ToolTip._shown_owner = self
 
     def hidetip(self):
-        tw = self.tipwindow
-        self.tipwindow = None
-        if tw:
-            tw.destroy()
+        if ToolTip._shown_owner is not self:
+            return
+        ToolTip._shown_owner = None
+        tw = ToolTip._tipwindow
+        if tw is not None and tw.winfo_exists():
+            tw.wm_withdraw()
 
 
 def create_tooltip(widget, text):
@@ -81,10 +237,12 @@ def create_tooltip(widget, text):
 
 class BotGUI:
     _instance = None
+    _icon_path = None  # icon.ico location, resolved once at startup (None if missing)
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(BotGUI, cls).__new__(cls)
+            cls._instance._initialized = False
         return cls._instance
     
     def check_ocr_on_startup(self):
@@ -101,7 +259,7 @@ class BotGUI:
             # Update GUI in main thread
             def update_gui():
                 # Update OCR status display if it exists
-                if hasattr(self, 'ocr_status_text'):
+                if self._gui_ready:
                     self.update_ocr_status_display()
                 
                 if not is_available:
@@ -115,16 +273,56 @@ class BotGUI:
                         f"{troubleshooting_text}\n\n"
                         "You can re-check OCR availability from the Settings tab after fixing the issue."
                     )
-                    messagebox.showwarning("OCR Not Available", warning_message)
+                    self._show_async_notification("OCR Not Available", warning_message, level="warning")
                     print("WARNING: OCR is not available - OCR features will be disabled")
                 else:
                     print(f"OCR check passed - Available in {mode.upper()} mode")
             
-            # Schedule GUI update in main thread
-            self.root.after(0, update_gui)
+            # Hand the update to the GUI thread via the update queue (Tk calls are not thread-safe).
+            # Blocking put so this one-shot result is never dropped when the queue is full.
+            config.gui_update_queue.put((None, update_gui))
         
-        # Start background thread
-        threading.Thread(target=check_thread, daemon=True).start()
+        # Start background thread once the event loop is idle, so the check never
+        # races GUI construction on slow startups
+        self.root.after_idle(lambda: self._executor.submit(check_thread))
+    
+    def _show_async_notification(self, title, message, level="info", timeout_ms=15000):
+        """Show a non-modal notification in the bottom-right corner that closes itself"""
+        colors = {"info": "lightgreen", "warning": "orange", "error": "red"}
+        fonts = _fonts()
+        
+        notification = ctk.CTkToplevel(self.root)
+        notification.title(title)
+        notification.resizable(False, False)
+        notification.attributes('-topmost', True)
+        
+        frame = ctk.CTkFrame(notification)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+        ctk.CTkLabel(frame, text=title, font=fonts['label'],
+                     text_color=colors.get(level, "white")).pack(anchor="w", padx=10, pady=(10, 5))
+        ctk.CTkLabel(frame, text=message, font=fonts['body'], justify="left",
+                     wraplength=380).pack(anchor="w", padx=10, pady=5)
+        ctk.CTkButton(frame, text="Close", width=80, command=notification.destroy).pack(anchor="e", padx=10, pady=(5, 10))
+        
+        # Park it in the bottom-right corner, clear of the main window
+        notification.update_idletasks()
+        width = notification.winfo_reqwidth()
+        height = notification.winfo_reqheight()
+        notification.geometry(f"+{self._screen_w - width - 40}+{self._screen_h - height - 80}")
+        
+        def auto_dismiss():
+            if notification.winfo_exists():
+                notification.destroy()
+        notification.after(timeout_ms, auto_dismiss)
+        return notification
+    
+    def _apply_icon(self, window):
+        """Give a secondary window the application icon resolved at startup"""
+        if self._icon_path:
+            try:
+                window.iconbitmap(self._icon_path)
+            except tk.TclError:
+                pass  # Icon is cosmetic; never fail window creation over it
     
     def _on_license_activated(self, license_dialog):
         """Called when license is successfully activated"""
@@ -134,155 +332,166 @@ class BotGUI:
         self.root.lift()
         self.root.focus_force()
     
-    def show_license_dialog_blocking(self):
-        """Show license entry dialog that blocks until valid license is entered"""
+    def _build_license_dialog(self, required, on_success=None, on_cancel=None):
+        """Build the license entry dialog shared by the startup and Settings-tab variants
+        
+        Returns (license_dialog, license_entry, status_label)
+        """
+        if required:
+            title = "License Activation Required"
+            instructions_text = "Please enter your license key to continue using Kathana Helper."
+            dialog_height = 530
+        else:
+            title = "License Activation"
+            instructions_text = "Please enter your license key to activate Kathana Helper."
+            dialog_height = 500
+        
+        fonts = _fonts()
         license_dialog = ctk.CTkToplevel(self.root)
-        license_dialog.title("License Activation Required")
-        license_dialog.geometry("600x530")
+        license_dialog.title(title)
+        license_dialog.geometry(f"600x{dialog_height}")
         license_dialog.resizable(False, False)
         license_dialog.transient(self.root)
-        license_dialog.grab_set()  # Make dialog modal
-        
-        # Make it a top-level window (not dependent on hidden root)
-        license_dialog.attributes('-topmost', True)
-        
-        # Center the dialog
-        license_dialog.update_idletasks()
-        x = (license_dialog.winfo_screenwidth() // 2) - (600 // 2)
-        y = (license_dialog.winfo_screenheight() // 2) - (530 // 2)
-        license_dialog.geometry(f"600x530+{x}+{y}")
-        
-        # Prevent closing without valid license
-        def on_closing():
-            """Exit app if user tries to close without license"""
-            self.root.quit()
-            self.root.destroy()
-        
-        license_dialog.protocol("WM_DELETE_WINDOW", on_closing)
+        _safe_grab_set(license_dialog)  # Make dialog modal
+        
+        if required:
+            # Make it a top-level window (not dependent on hidden root)
+            license_dialog.attributes('-topmost', True)
+        
+        # Center the dialog (size is fixed, so no update_idletasks needed)
+        x = (self._screen_w // 2) - (600 // 2)
+        y = (self._screen_h // 2) - (dialog_height // 2)
+        license_dialog.geometry(f"600x{dialog_height}+{x}+{y}")
+        
+        def cancel_activation():
+            """Close the dialog and let the caller decide what happens next"""
+            license_dialog.destroy()
+            if on_cancel:
+                on_cancel()
+        
+        if required:
+            # Closing without a valid license hands control back to the caller
+            license_dialog.protocol("WM_DELETE_WINDOW", cancel_activation)
+            close_dialog = cancel_activation
+        else:
+            # Just close dialog, don't exit app
+            close_dialog = license_dialog.destroy
         
-        # Main frame
+        # Main frame - every widget is gridded straight into it (no nested frames).
+        # Column 0 stretches; column 1 only holds the Copy button.
         main_frame = ctk.CTkFrame(license_dialog, corner_radius=10)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        main_frame.columnconfigure(0, weight=1)
         
         # Title
         title_label = ctk.CTkLabel(
             main_frame,
-            text="License Activation Required",
-            font=ctk.CTkFont(size=20, weight="bold")
+            text=title,
+            font=fonts['title']
         )
-        title_label.pack(pady=(20, 10))
+        title_label.grid(row=0, column=0, columnspan=2, pady=(20, 10))
         
         # Instructions
         instructions = ctk.CTkLabel(
             main_frame,
-            text="Please enter your license key to continue using Kathana Helper.",
-            font=ctk.CTkFont(size=12),
+            text=instructions_text,
+            font=fonts['body'],
             wraplength=550
         )
-        instructions.pack(pady=(0, 10))
+        instructions.grid(row=1, column=0, columnspan=2, pady=(0, 10))
         
         # Machine ID section (for machine-bound licenses)
-        machine_id_frame = ctk.CTkFrame(main_frame, corner_radius=8)
-        machine_id_frame.pack(fill="x", padx=20, pady=(0, 10))
-        machine_id_frame.columnconfigure(0, weight=1)
-        
         machine_id_label = ctk.CTkLabel(
-            machine_id_frame,
+            main_frame,
             text="Your Machine ID:",
-            font=ctk.CTkFont(size=11, weight="bold")
+            font=fonts['small_bold']
         )
-        machine_id_label.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
+        machine_id_label.grid(row=2, column=0, columnspan=2, sticky="w", padx=20, pady=(0, 5))
         
         license_manager = get_license_manager()
-        machine_id = license_manager.get_machine_id()
+        machine_id = _get_machine_id()
         
-        machine_id_value_frame = ctk.CTkFrame(machine_id_frame, fg_color="transparent")
-        machine_id_value_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 5))
-        machine_id_value_frame.columnconfigure(0, weight=1)
-        
-        machine_id_entry = ctk.CTkEntry(
-            machine_id_value_frame,
+        # The ID never changes, so a plain label replaces the readonly entry
+        machine_id_display = ctk.CTkLabel(
+            main_frame,
+            text=machine_id,
             width=400,
             height=30,
-            font=ctk.CTkFont(size=10, family="Courier"),
-            state="readonly"
+            font=fonts['mono'],
+            anchor="w"
         )
-        machine_id_entry.grid(row=0, column=0, sticky="ew", padx=(0, 5))
-        # Need to temporarily change state to insert text in readonly entry
-        machine_id_entry.configure(state="normal")
-        machine_id_entry.insert(0, machine_id)
-        machine_id_entry.configure(state="readonly")
+        machine_id_display.grid(row=3, column=0, sticky="ew", padx=(20, 5), pady=(0, 5))
         
         def copy_machine_id():
             """Copy machine ID to clipboard"""
             license_dialog.clipboard_clear()
             license_dialog.clipboard_append(machine_id)
             license_dialog.update()
-            status_label.configure(text="Machine ID copied to clipboard!", text_color="green")
-            license_dialog.after(2000, lambda: status_label.configure(text=""))
+            self._flash_status(status_label, "Machine ID copied to clipboard!", "green")
         
         copy_machine_id_btn = ctk.CTkButton(
-            machine_id_value_frame,
+            main_frame,
             text="Copy",
             command=copy_machine_id,
             width=80,
             height=30,
-            font=ctk.CTkFont(size=10)
+            font=fonts['tiny']
         )
-        copy_machine_id_btn.grid(row=0, column=1)
+        copy_machine_id_btn.grid(row=3, column=1, padx=(0, 20), pady=(0, 5))
+        # Labels can't be selected, so clicking the ID copies it as well
+        machine_id_display.bind("<Button-1>", lambda e: copy_machine_id())
         
         machine_id_help = ctk.CTkLabel(
-            machine_id_frame,
+            main_frame,
             text="If you need a machine-bound license, provide this Machine ID to the license issuer.",
-            font=ctk.CTkFont(size=9),
+            font=fonts['hint'],
             text_color="gray",
             wraplength=540
         )
-        machine_id_help.grid(row=2, column=0, sticky="w", padx=10, pady=(0, 10))
+        machine_id_help.grid(row=4, column=0, columnspan=2, sticky="w", padx=20, pady=(0, 10))
         
-        # License key entry
+        # License key entry (text area)
         license_label = ctk.CTkLabel(
             main_frame,
             text="License Key:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=fonts['label']
         )
-        license_label.pack(anchor="w", padx=20, pady=(10, 5))
+        license_label.grid(row=5, column=0, columnspan=2, sticky="w", padx=20, pady=(10, 5))
         
         license_entry = ctk.CTkTextbox(
             main_frame,
             width=540,
             height=100,
-            font=ctk.CTkFont(size=11),
+            font=fonts['small'],
             wrap="word"
         )
-        license_entry.pack(padx=20, pady=(0, 10))
+        license_entry.grid(row=6, column=0, columnspan=2, padx=20, pady=(0, 10))
         license_entry.focus()
         
         # Status label
         status_label = ctk.CTkLabel(
             main_frame,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=fonts['small'],
             wraplength=540
         )
-        status_label.pack(pady=(0, 10))
+        status_label.grid(row=7, column=0, columnspan=2, pady=(0, 10))
         
         # License info display (if license exists but is invalid)
-        license_info = license_manager.get_license_info()
+        license_info = self._get_license_info()
         
         if license_info:
             info_text = f"Current License: {license_info['data'].get('user_name', 'Unknown')}\n"
             if 'expires' in license_info['data']:
-                from datetime import datetime
                 expires = datetime.fromisoformat(license_info['data']['expires'])
                 info_text += f"{expires.strftime('%Y-%m-%d')}"
             info_label = ctk.CTkLabel(
                 main_frame,
                 text=info_text,
-                font=ctk.CTkFont(size=10),
+                font=fonts['tiny'],
                 text_color="gray"
             )
-            info_label.pack(pady=(0, 10))
+            info_label.grid(row=8, column=0, columnspan=2, pady=(0, 10))
         
         def validate_and_save():
             """Validate and save the license key"""
@@ -299,269 +508,185 @@ class BotGUI:
                 # Save license
                 success, save_message = license_manager.save_license(license_key)
                 if success:
-                    status_label.configure(text="License activated successfully! Closing...", text_color="green")
-                    
+                    self._license_info_dirty = True
                     # Update license status info immediately
                     self.update_license_status_info()
                     
                     # Give user a moment to see the success message, then close dialog
-                    license_dialog.after(1000, lambda: self._on_license_activated_blocking(license_dialog))
+                    if required:
+                        status_label.configure(text="License activated successfully! Closing...", text_color="green")
+                        license_dialog.after(1000, lambda: self._on_license_activated_async(license_dialog, on_success))
+                    else:
+                        status_label.configure(text="License activated successfully!", text_color="green")
+                        license_dialog.after(1000, lambda: [license_dialog.destroy(), self.refresh_license_status()])
                 else:
                     status_label.configure(text=f"Error saving license: {save_message}", text_color="red")
             else:
                 status_label.configure(text=message, text_color="red")
         
-        # Buttons frame
-        button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        button_frame.pack(pady=20)
-        
+        # Buttons share the last row: both span the full width and asymmetric
+        # padding pushes them apart, which keeps the pair centered.
         # Activate button
         activate_button = ctk.CTkButton(
-            button_frame,
+            main_frame,
             text="Activate License",
             command=validate_and_save,
             width=150,
             height=35,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=fonts['label']
         )
-        activate_button.pack(side="left", padx=10)
+        activate_button.grid(row=9, column=0, columnspan=2, padx=(0, 170), pady=20)
         
         # Cancel/Exit button
-        def exit_app():
-            """Exit the application"""
-            self.root.quit()
-            self.root.destroy()
-        
         cancel_button = ctk.CTkButton(
-            button_frame,
-            text="Exit",
-            command=exit_app,
+            main_frame,
+            text="Exit" if required else "Cancel",
+            command=close_dialog,
             width=150,
             height=35,
-            font=ctk.CTkFont(size=12),
+            font=fonts['body'],
             fg_color="gray",
             hover_color="darkgray"
         )
-        cancel_button.pack(side="left", padx=10)
+        cancel_button.grid(row=9, column=0, columnspan=2, padx=(170, 0), pady=20)
         
         # Bind Ctrl+Enter to activate (since it's a text area now)
         license_entry.bind("<Control-Return>", lambda e: validate_and_save())
         
         # Make dialog close on Escape
-        license_dialog.bind("<Escape>", lambda e: exit_app())
+        license_dialog.bind("<Escape>", lambda e: close_dialog())
+        
+        return license_dialog, license_entry, status_label
+    
+    def _flash_status(self, label, text, color, duration=2000):
+        """Show text on a status label and clear it after duration ms
+        
+        A new flash on the same label replaces the previous pending clear, so
+        repeated clicks never stack up timers.
+        """
+        key = id(label)
+        pending = self._status_clears.pop(key, None)
+        if pending is not None:
+            label.after_cancel(pending)
+        label.configure(text=text, text_color=color)
+        
+        def clear():
+            self._status_clears.pop(key, None)
+            if label.winfo_exists():
+                label.configure(text="")
+        self._status_clears[key] = label.after(duration, clear)
+    
+    def _make_checkbox(self, parent, text, variable, command):
+        """Create a settings checkbox in the standard small font"""
+        return ctk.CTkCheckBox(parent, text=text, variable=variable, command=command,
+                               font=_fonts()['small'])
+    
+    def _debounce(self, key, func, ms=250):
+        """Run func once ms after the last call with the same key"""
+        pending = self._debounce_ids.pop(key, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        
+        def fire():
+            self._debounce_ids.pop(key, None)
+            func()
+        self._debounce_ids[key] = self.root.after(ms, fire)
+    
+    def _flush_debounce(self, key, func):
+        """Cancel a pending debounced call for key and run func right away"""
+        pending = self._debounce_ids.pop(key, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        func()
+    
+    def show_license_dialog_async(self, on_success=None, on_cancel=None):
+        """Show the startup license dialog without blocking the caller
         
-        # Wait for dialog to close
-        license_dialog.wait_window()
+        on_success runs (from the event loop) after a valid license is saved,
+        on_cancel runs when the user exits or closes the dialog instead.
+        """
+        self._build_license_dialog(required=True, on_success=on_success, on_cancel=on_cancel)
     
-    def _on_license_activated_blocking(self, license_dialog):
-        """Called when license is successfully activated from blocking dialog"""
-        # Close the dialog - this will cause wait_window() to return
+    def _on_license_activated_async(self, license_dialog, on_success):
+        """Called when license is successfully activated from the startup dialog"""
         license_dialog.destroy()
-        # Ensure the dialog is fully closed
-        license_dialog.update()
+        if on_success:
+            self.root.after_idle(on_success)
     
     def show_license_dialog(self):
         """Show license entry dialog (non-blocking, for Settings tab)"""
-        license_dialog = ctk.CTkToplevel(self.root)
-        license_dialog.title("License Activation")
-        license_dialog.geometry("600x500")
-        license_dialog.resizable(False, False)
-        license_dialog.transient(self.root)
-        license_dialog.grab_set()  # Make dialog modal
-        
-        # Center the dialog
-        license_dialog.update_idletasks()
-        x = (license_dialog.winfo_screenwidth() // 2) - (600 // 2)
-        y = (license_dialog.winfo_screenheight() // 2) - (500 // 2)
-        license_dialog.geometry(f"600x500+{x}+{y}")
-        
-        # Main frame
-        main_frame = ctk.CTkFrame(license_dialog, corner_radius=10)
-        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        # Title
-        title_label = ctk.CTkLabel(
-            main_frame,
-            text="License Activation",
-            font=ctk.CTkFont(size=20, weight="bold")
-        )
-        title_label.pack(pady=(20, 10))
-        
-        # Instructions
-        instructions = ctk.CTkLabel(
-            main_frame,
-            text="Please enter your license key to activate Kathana Helper.",
-            font=ctk.CTkFont(size=12),
-            wraplength=550
-        )
-        instructions.pack(pady=(0, 10))
-        
-        # Machine ID section (for machine-bound licenses)
-        machine_id_frame = ctk.CTkFrame(main_frame, corner_radius=8)
-        machine_id_frame.pack(fill="x", padx=20, pady=(0, 10))
-        machine_id_frame.columnconfigure(0, weight=1)
-        
-        machine_id_label = ctk.CTkLabel(
-            machine_id_frame,
-            text="Your Machine ID:",
-            font=ctk.CTkFont(size=11, weight="bold")
-        )
-        machine_id_label.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
-        
-        license_manager = get_license_manager()
-        machine_id = license_manager.get_machine_id()
-        
-        machine_id_value_frame = ctk.CTkFrame(machine_id_frame, fg_color="transparent")
-        machine_id_value_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 5))
-        machine_id_value_frame.columnconfigure(0, weight=1)
-        
-        machine_id_entry = ctk.CTkEntry(
-            machine_id_value_frame,
-            width=400,
-            height=30,
-            font=ctk.CTkFont(size=10, family="Courier"),
-            state="readonly"
-        )
-        machine_id_entry.grid(row=0, column=0, sticky="ew", padx=(0, 5))
-        # Need to temporarily change state to insert text in readonly entry
-        machine_id_entry.configure(state="normal")
-        machine_id_entry.insert(0, machine_id)
-        machine_id_entry.configure(state="readonly")
-        
-        def copy_machine_id():
-            """Copy machine ID to clipboard"""
-            license_dialog.clipboard_clear()
-            license_dialog.clipboard_append(machine_id)
-            license_dialog.update()
-            status_label.configure(text="Machine ID copied to clipboard!", text_color="green")
-            license_dialog.after(2000, lambda: status_label.configure(text=""))
-        
-        copy_machine_id_btn = ctk.CTkButton(
-            machine_id_value_frame,
-            text="Copy",
-            command=copy_machine_id,
-            width=80,
-            height=30,
-            font=ctk.CTkFont(size=10)
-        )
-        copy_machine_id_btn.grid(row=0, column=1)
-        
-        machine_id_help = ctk.CTkLabel(
-            machine_id_frame,
-            text="If you need a machine-bound license, provide this Machine ID to the license issuer.",
-            font=ctk.CTkFont(size=9),
-            text_color="gray",
-            wraplength=540
-        )
-        machine_id_help.grid(row=2, column=0, sticky="w", padx=10, pady=(0, 10))
-        
-        # License key entry (text area)
-        license_label = ctk.CTkLabel(
-            main_frame,
-            text="License Key:",
-            font=ctk.CTkFont(size=12, weight="bold")
-        )
-        license_label.pack(anchor="w", padx=20, pady=(10, 5))
-        
-        license_entry = ctk.CTkTextbox(
-            main_frame,
-            width=540,
-            height=100,
-            font=ctk.CTkFont(size=11),
-            wrap="word"
-        )
-        license_entry.pack(padx=20, pady=(0, 10))
-        license_entry.focus()
-        
-        # Status label
-        status_label = ctk.CTkLabel(
-            main_frame,
-            text="",
-            font=ctk.CTkFont(size=11),
-            wraplength=540
-        )
-        status_label.pack(pady=(0, 10))
-        
-        # License info display (if license exists but is invalid)
-        license_info = license_manager.get_license_info()
-        
-        if license_info:
-            info_text = f"Current License: {license_info['data'].get('user_name', 'Unknown')}\n"
-            if 'expires' in license_info['data']:
-                from datetime import datetime
-                expires = datetime.fromisoformat(license_info['data']['expires'])
-                info_text += f"{expires.strftime('%Y-%m-%d')}"
-            info_label = ctk.CTkLabel(
-                main_frame,
-                text=info_text,
-                font=ctk.CTkFont(size=10),
-                text_color="gray"
-            )
-            info_label.pack(pady=(0, 10))
+        self._build_license_dialog(required=False)
+    
+    def _format_license_dates(self, license_info):
+        """Format license fields for display (cached until the license info changes)"""
+        cached = self._license_display_cache
+        if cached is not None and cached[0] is license_info:
+            return cached[1]
         
-        def validate_and_save():
-            """Validate and save the license key"""
-            license_key = license_entry.get("1.0", "end-1c").strip()
-            
-            if not license_key:
-                status_label.configure(text="Please enter a license key.", text_color="red")
-                return
+        if license_info and license_info.get('valid'):
+            data = license_info['data']
+            user_name = data.get('user_name', 'Unknown')
+            expires = data.get('expires', 'Never')
+            issued = data.get('issued', 'Unknown')
+            machine_bound = data.get('machine_bound', False)
+            status_color = "green"
+            days_left = None
             
-            # Validate license
-            is_valid, message, license_data = license_manager.validate_license(license_key)
+            # Calculate days left if expiration exists
+            if expires != 'Never':
+                try:
+                    expires_date = datetime.fromisoformat(expires)
+                    expires_str = expires_date.strftime('%B %d, %Y')
+                    days_left = (expires_date - datetime.now()).days
+                    for limit, color in _LICENSE_EXPIRY_COLORS:
+                        if days_left <= limit:
+                            status_color = color
+                            break
+                    if days_left < 0:
+                        expiry_info = f"Expired: {expires_str}"
+                    elif days_left <= 30:
+                        expiry_info = f"{expires_str} ({days_left} day{'s' if days_left != 1 else ''} left)"
+                    else:
+                        expiry_info = f"{expires_str}"
+                except:
+                    expiry_info = f"{expires}"
+            else:
+                expiry_info = "No expiration"
             
-            if is_valid:
-                # Save license
-                success, save_message = license_manager.save_license(license_key)
-                if success:
-                    status_label.configure(text="License activated successfully!", text_color="green")
-                    
-                    # Close dialog and refresh license status
-                    self.update_license_status_info()  # Update status tab immediately
-                    license_dialog.after(1000, lambda: [license_dialog.destroy(), self.refresh_license_status()])
-                else:
-                    status_label.configure(text=f"Error saving license: {save_message}", text_color="red")
+            # Format issued date
+            if issued != 'Unknown':
+                try:
+                    issued_date = datetime.fromisoformat(issued)
+                    issued_str = issued_date.strftime('%B %d, %Y')
+                except:
+                    issued_str = issued
             else:
-                status_label.configure(text=message, text_color="red")
-        
-        # Buttons frame
-        button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        button_frame.pack(pady=20)
-        
-        # Activate button
-        activate_button = ctk.CTkButton(
-            button_frame,
-            text="Activate License",
-            command=validate_and_save,
-            width=150,
-            height=35,
-            font=ctk.CTkFont(size=12, weight="bold")
-        )
-        activate_button.pack(side="left", padx=10)
-        
-        # Cancel button (just close dialog, don't exit app)
-        cancel_button = ctk.CTkButton(
-            button_frame,
-            text="Cancel",
-            command=license_dialog.destroy,
-            width=150,
-            height=35,
-            font=ctk.CTkFont(size=12),
-            fg_color="gray",
-            hover_color="darkgray"
-        )
-        cancel_button.pack(side="left", padx=10)
-        
-        # Bind Ctrl+Enter to activate (since it's a text area now)
-        license_entry.bind("<Control-Return>", lambda e: validate_and_save())
+                issued_str = "Unknown"
+            
+            result = LicenseDisplay(True, user_name, expiry_info, issued_str, status_color, days_left, machine_bound)
+        else:
+            result = LicenseDisplay(False, "N/A", "No valid license found", "N/A", "red", None, False)
         
-        # Make dialog close on Escape
-        license_dialog.bind("<Escape>", lambda e: license_dialog.destroy())
+        self._license_display_cache = (license_info, result)
+        return result
+    
+    def _get_license_info(self):
+        """Get current license info, re-reading the license file only when marked dirty"""
+        if self._license_info_dirty:
+            self._license_info_cache = get_license_manager().get_license_info()
+            self._license_info_dirty = False
+        return self._license_info_cache
     
     def update_ocr_status_display(self):
-        """Update the OCR status display in the Settings tab"""
-        if not hasattr(self, 'ocr_status_text'):
+        """Update the OCR status display in the Settings tab (calls within 50 ms coalesce)"""
+        if not self._gui_ready:
             return  # GUI elements not created yet
+        if self._ocr_refresh_pending is None:
+            self._ocr_refresh_pending = self.root.after(50, self._do_update_ocr_status_display)
+    
+    def _do_update_ocr_status_display(self):
+        """Apply the OCR status to the Settings tab"""
+        self._ocr_refresh_pending = None
         
         # Check if OCR hasn't been checked yet (ocr_mode is None means not checked)
         if config.ocr_mode is None:
@@ -574,134 +699,82 @@ class BotGUI:
             status_text = "✗ Not Available"
             self.ocr_status_text.configure(text=status_text, text_color="red")
     
+    def _periodic_license_tick(self):
+        """Re-read the license off the GUI thread once a minute (reschedules itself)"""
+        def check_license_thread():
+            """Background thread to check license"""
+            # Re-read the license here (off the GUI thread) so expiry is picked up
+            self._license_info_dirty = True
+            self._get_license_info()
+            config.gui_update_queue.put((None, self._apply_periodic_license_check))
+        
+        self._executor.submit(check_license_thread)
+        self.root.after(60000, self._periodic_license_tick)
+    
+    def _apply_periodic_license_check(self):
+        """Refresh the license widgets only if the formatted license actually changed"""
+        display = self._format_license_dates(self._get_license_info())
+        if display != self._last_license_display:
+            self._last_license_display = display
+            self.refresh_license_status_display()
+    
     def update_license_status_info(self):
         """Update license status info in Status tab (now uses refresh_license_status_display)"""
         self.refresh_license_status_display()
     
     def refresh_license_status(self):
         """Refresh license status display (shows a messagebox; updates Status tab UI)"""
-        if not hasattr(self, 'license_expiry_label'):
+        if not self._gui_ready:
             return  # GUI elements not created yet
         
-        license_manager = get_license_manager()
-        license_info = license_manager.get_license_info()
+        license_info = self._get_license_info()
         
         # Build info text for messagebox
-        if license_info and license_info.get('valid'):
-            user_name = license_info['data'].get('user_name', 'Unknown')
-            expires = license_info['data'].get('expires', 'Never')
-            issued = license_info['data'].get('issued', 'Unknown')
-            machine_bound = license_info['data'].get('machine_bound', False)
-            
-            if expires != 'Never':
-                from datetime import datetime
-                try:
-                    expires_date = datetime.fromisoformat(expires)
-                    expires_str = expires_date.strftime('%B %d, %Y')
-                    days_left = (expires_date - datetime.now()).days
-                    if days_left < 0:
-                        expiry_info = f"{expires_str}"
-                    elif days_left <= 7:
-                        expiry_info = f"{expires_str} ({days_left} day{'s' if days_left != 1 else ''} left)"
-                    else:
-                        expiry_info = f"{expires_str}"
-                except:
-                    expiry_info = f"{expires}"
-            else:
-                expiry_info = "No expiration"
-            
-            if issued != 'Unknown':
-                try:
-                    from datetime import datetime
-                    issued_date = datetime.fromisoformat(issued)
-                    issued_str = issued_date.strftime('%B %d, %Y')
-                except:
-                    issued_str = issued
-            else:
-                issued_str = "Unknown"
-            
-            info_text = f"User: {user_name}\n"
-            info_text += f"Issued: {issued_str}\n"
-            info_text += f"{expiry_info}"
-            if machine_bound:
+        display = self._format_license_dates(license_info)
+        if display.valid:
+            info_text = f"User: {display.user_name}\n"
+            info_text += f"Issued: {display.issued_str}\n"
+            info_text += f"{display.expiry_info}"
+            if display.machine_bound:
                 info_text += "\nMachine Bound: Yes"
         else:
             info_text = "No valid license found. Please activate a license."
         
-        # Update all license displays
-        self.update_license_status_info()  # Update status tab
-        self.refresh_license_status_display()  # Update settings tab
+        # Update license displays
+        self.refresh_license_status_display()
         
         messagebox.showinfo("License Status", info_text)
     
     def refresh_license_status_display(self):
-        """Refresh license status display in Settings tab"""
+        """Refresh license status display in Settings tab (calls within 50 ms coalesce)"""
         # Status-tab "License Info" widgets may not exist yet during startup
-        if not hasattr(self, 'license_expiry_label'):
+        if not self._gui_ready:
             return  # GUI elements not created yet
+        if self._license_refresh_pending is None:
+            self._license_refresh_pending = self.root.after(50, self._do_refresh_license_status_display)
+    
+    def _do_refresh_license_status_display(self):
+        """Apply the current license info to the license widgets"""
+        self._license_refresh_pending = None
         
-        license_manager = get_license_manager()
-        license_info = license_manager.get_license_info()
-        
-        if license_info and license_info.get('valid'):
-            status_color = "green"
-            user_name = license_info['data'].get('user_name', 'Unknown')
-            expires = license_info['data'].get('expires', 'Never')
-            issued = license_info['data'].get('issued', 'Unknown')
-            machine_bound = license_info['data'].get('machine_bound', False)
-            
-            if expires != 'Never':
-                from datetime import datetime
-                try:
-                    expires_date = datetime.fromisoformat(expires)
-                    expires_str = expires_date.strftime('%B %d, %Y')
-                    days_left = (expires_date - datetime.now()).days
-                    if days_left < 0:
-                        status_color = "red"
-                        expiry_info = f"{expires_str}"
-                    elif days_left <= 7:
-                        status_color = "orange"
-                        expiry_info = f"{expires_str} ({days_left} day{'s' if days_left != 1 else ''} left)"
-                    elif days_left <= 30:
-                        status_color = "yellow"
-                        expiry_info = f"{expires_str} ({days_left} days left)"
-                    else:
-                        expiry_info = f"{expires_str}"
-                except:
-                    expiry_info = f"{expires}"
-            else:
-                expiry_info = "No expiration"
-            
-            if issued != 'Unknown':
-                try:
-                    from datetime import datetime
-                    issued_date = datetime.fromisoformat(issued)
-                    issued_str = issued_date.strftime('%B %d, %Y')
-                except:
-                    issued_str = issued
-            else:
-                issued_str = "Unknown"
-        else:
-            status_color = "red"
-            user_name = "N/A"
-            expiry_info = "No valid license found"
-            issued_str = "N/A"
-            machine_bound = False
+        license_info = self._get_license_info()
+        display = self._format_license_dates(license_info)
 
-        # Update status-tab "License Info" values
-        if hasattr(self, 'license_user_value'):
-            self.license_user_value.configure(text=user_name, text_color="white" if license_info and license_info.get('valid') else "gray")
-        if hasattr(self, 'license_expiry_label'):
-            self.license_expiry_label.configure(text=expiry_info, text_color=status_color if license_info and license_info.get('valid') else "gray")
-        if hasattr(self, 'license_issued_value'):
-            self.license_issued_value.configure(text=issued_str, text_color="gray")
-        if hasattr(self, 'license_binding_value'):
-            binding_text = "Machine Bound" if machine_bound else "—"
-            binding_color = "orange" if machine_bound else "gray"
-            self.license_binding_value.configure(text=binding_text, text_color=binding_color)
+        # Update status-tab "License Info" values (skipped when unchanged)
+        self._set_ui('license_user', self.license_user_value, 'configure', display.user_name,
+                     text_color="white" if display.valid else "gray")
+        self._set_ui('license_expiry', self.license_expiry_label, 'configure', display.expiry_info,
+                     text_color=display.status_color if display.valid else "gray")
+        self._set_ui('license_issued', self.license_issued_value, 'configure', display.issued_str, text_color="gray")
+        binding_text = "Machine Bound" if display.machine_bound else "—"
+        binding_color = "orange" if display.machine_bound else "gray"
+        self._set_ui('license_binding', self.license_binding_value, 'configure', binding_text, text_color=binding_color)
     
     def recheck_ocr_availability(self):
         """Re-check OCR availability (called from GUI button)"""
+        if self._ocr_future and not self._ocr_future.done():
+            return  # A check is already running
+        
         # Disable button during check
         self.recheck_ocr_button.configure(state="disabled", text="Checking...")
         self.ocr_status_text.configure(text="Checking...", text_color="gray")
@@ -717,26 +790,26 @@ class BotGUI:
                     self.recheck_ocr_button.configure(state="normal", text="Re-check OCR")
                     
                     if is_available:
-                        messagebox.showinfo("OCR Status", 
+                        self._show_async_notification("OCR Status", 
                             f"OCR is now available in {config.ocr_mode.upper()} mode!\n\n"
                             "OCR features are now enabled.")
                     else:
                         error_details = f"\n\nError: {error_msg}" if error_msg else ""
                         troubleshooting_text = f"\n\n{troubleshooting}" if troubleshooting else ""
-                        messagebox.showwarning("OCR Status", 
+                        self._show_async_notification("OCR Status", 
                             "OCR is still not available."
                             f"{error_details}"
-                            f"{troubleshooting_text}")
+                            f"{troubleshooting_text}", level="warning")
                 
-                # Schedule GUI update in main thread
-                self.root.after(0, update_gui)
+                # Hand the update to the GUI thread via the update queue
+                config.gui_update_queue.put((None, update_gui))
             except Exception as e:
                 def show_error():
                     self.recheck_ocr_button.configure(state="normal", text="Re-check OCR")
-                    messagebox.showerror("OCR Check Error", f"Error checking OCR: {e}")
-                self.root.after(0, show_error)
+                    self._show_async_notification("OCR Check Error", f"Error checking OCR: {e}", level="error")
+                config.gui_update_queue.put((None, show_error))
         
-        threading.Thread(target=check_thread, daemon=True).start()
+        self._ocr_future = self._executor.submit(check_thread)
     
     def save_settings_gui(self):
         """Save settings from GUI"""
@@ -748,204 +821,263 @@ class BotGUI:
             messagebox.showerror("Save Settings", "Failed to save settings!")
     
     def load_settings_gui(self):
-        """Load settings to GUI"""
+        """Load settings to GUI (the file is read on the worker pool, applied on the GUI thread)"""
+        # Ignore repeated clicks until the running load has been applied;
+        # two loads at once would both rewrite the config globals
+        if self._load_settings_future is not None:
+            return
         print("Loading settings...")
-        if settings_manager.load_settings():
+        
+        def load_thread():
+            try:
+                loaded = settings_manager.load_settings()
+            except Exception as e:
+                print(f"Error loading settings: {e}")
+                traceback.print_exc()
+                loaded = False
+            config.gui_update_queue.put((None, lambda: self._finish_load_settings(loaded)))
+        
+        self._load_settings_future = self._executor.submit(load_thread)
+    
+    def _finish_load_settings(self, loaded):
+        """Apply freshly loaded settings to the GUI and report the result"""
+        # Runs from the GUI tick; the modal messageboxes are deferred so the
+        # tick can reschedule itself instead of waiting for them to close
+        self._load_settings_future = None
+        if loaded:
             print("Settings loaded from file, applying to GUI...")
             self.apply_settings_to_gui()
             print("Settings loaded and applied successfully!")
-            messagebox.showinfo("Load Settings", "Settings loaded successfully!")
+            self.root.after_idle(messagebox.showinfo, "Load Settings", "Settings loaded successfully!")
         else:
             print("Failed to load settings!")
-            messagebox.showwarning("Load Settings", "No saved settings found or failed to load settings!")
+            self.root.after_idle(messagebox.showwarning, "Load Settings", "No saved settings found or failed to load settings!")
+    
+    def _set_tk_vars(self, updates):
+        """Set many Tk variables with a single Tcl call
+        
+        updates is a list of (tk_variable, value) pairs. The values go through
+        one foreach/set script instead of one Variable.set() round-trip each.
+        Variables that already hold the value are left alone: CTk widgets redraw
+        synchronously from their write traces, so only changed settings redraw.
+        """
+        flat = []
+        for var, value in updates:
+            flat.append(var._name)
+            flat.append(value)
+        if flat:
+            self.root.tk.call('foreach', ('name', 'value'), tuple(flat),
+                              'if {![info exists ::$name] || [set ::$name] ne $value} {set ::$name $value}')
     
     def apply_settings_to_gui(self):
         """Apply loaded settings to the GUI components"""
         try:
             print("Applying settings to GUI...")
+            # Per-setting details go to the debug log; skip formatting them when it is off
+            debug = debug_utils.get_debug_enabled()
+            # Variable writes are collected here and applied in one batch below
+            updates = []
+            
             # Apply skill slot settings
             for slot_key, slot_data in config.skill_slots.items():
                 if slot_key in self.skill_vars:
-                    self.skill_vars[slot_key].set(slot_data['enabled'])
-                    print(f"  Applied skill slot {slot_key}: enabled={slot_data['enabled']}")
+                    updates.append((self.skill_vars[slot_key], slot_data['enabled']))
+                    if debug:
+                        debug_utils.debug_print(f"Applied skill slot {slot_key}: enabled={slot_data['enabled']}", "Settings")
                 if slot_key in self.skill_intervals:
-                    self.skill_intervals[slot_key].set(str(slot_data['interval']))
-                    print(f"  Applied skill slot {slot_key}: interval={slot_data['interval']}")
+                    updates.append((self.skill_intervals[slot_key], str(slot_data['interval'])))
+                    if debug:
+                        debug_utils.debug_print(f"Applied skill slot {slot_key}: interval={slot_data['interval']}", "Settings")
             
             # Apply action slot settings
             for action_key, action_data in config.action_slots.items():
                 if action_key in self.action_vars:
-                    self.action_vars[action_key].set(action_data['enabled'])
-                    print(f"  Applied action {action_key}: enabled={action_data['enabled']}")
+                    updates.append((self.action_vars[action_key], action_data['enabled']))
+                    if debug:
+                        debug_utils.debug_print(f"Applied action {action_key}: enabled={action_data['enabled']}", "Settings")
                 if action_key in self.action_intervals:
-                    self.action_intervals[action_key].set(str(action_data['interval']))
-                    print(f"  Applied action {action_key}: interval={action_data['interval']}")
+                    updates.append((self.action_intervals[action_key], str(action_data['interval'])))
+                    if debug:
+                        debug_utils.debug_print(f"Applied action {action_key}: interval={action_data['interval']}", "Settings")
             
             # Apply mob detection settings
-            self.mob_detection_var.set(config.mob_detection_enabled)
-            self.mob_coords_var.set(f"{config.target_name_area['x']},{config.target_name_area['y']}")
-            print(f"  Applied mob detection: enabled={config.mob_detection_enabled}, coords={config.target_name_area['x']},{config.target_name_area['y']}")
-            
-            # Apply enemy HP bar settings
-            if hasattr(self, 'enemy_hp_coords_var'):
-                self.enemy_hp_coords_var.set(f"{config.target_hp_bar_area['x']},{config.target_hp_bar_area['y']}")
-                self.enemy_hp_x_var.set(str(config.target_hp_bar_area['x']))
-                self.enemy_hp_y_var.set(str(config.target_hp_bar_area['y']))
-                self.enemy_hp_width_var.set(str(config.target_hp_bar_area['width']))
-                self.enemy_hp_height_var.set(str(config.target_hp_bar_area['height']))
-                print(f"  Applied enemy HP bar area: {config.target_hp_bar_area}")
+            updates.append((self.mob_detection_var, config.mob_detection_enabled))
+            if debug:
+                debug_utils.debug_print(f"Applied mob detection: enabled={config.mob_detection_enabled}, coords={config.target_name_area['x']},{config.target_name_area['y']}", "Settings")
+            
+            # Enemy HP bar area is read from config directly
+            if debug:
+                debug_utils.debug_print(f"Applied enemy HP bar area: {config.target_hp_bar_area}", "Settings")
             
             # Apply Auto Attack settings
-            self.auto_attack_var.set(config.auto_attack_enabled)
-            print(f"  Applied auto attack: enabled={config.auto_attack_enabled}")
+            updates.append((self.auto_attack_var, config.auto_attack_enabled))
+            if debug:
+                debug_utils.debug_print(f"Applied auto attack: enabled={config.auto_attack_enabled}", "Settings")
             
             # Apply Auto Loot settings
-            if hasattr(self, 'looting_duration_var'):
-                self.looting_duration_var.set(str(config.LOOTING_DURATION))
-                print(f"  Applied looting duration: {config.LOOTING_DURATION} seconds")
+            updates.append((self.looting_duration_var, str(config.LOOTING_DURATION)))
+            if debug:
+                debug_utils.debug_print(f"Applied looting duration: {config.LOOTING_DURATION} seconds", "Settings")
             
             # Apply Auto Repair settings
-            if hasattr(self, 'auto_repair_var'):
-                self.auto_repair_var.set(config.auto_repair_enabled)
-                print(f"  Applied auto repair: enabled={config.auto_repair_enabled}")
+            updates.append((self.auto_repair_var, config.auto_repair_enabled))
+            if debug:
+                debug_utils.debug_print(f"Applied auto repair: enabled={config.auto_repair_enabled}", "Settings")
             # Apply Auto Change Target settings
-            if hasattr(self, 'auto_change_target_var'):
-                self.auto_change_target_var.set(config.auto_change_target_enabled)
-                print(f"  Applied auto change target: enabled={config.auto_change_target_enabled}")
-            if hasattr(self, 'unstuck_timeout_var'):
-                self.unstuck_timeout_var.set(str(config.unstuck_timeout))
-                print(f"  Applied unstuck timeout: {config.unstuck_timeout} seconds")
+            updates.append((self.auto_change_target_var, config.auto_change_target_enabled))
+            if debug:
+                debug_utils.debug_print(f"Applied auto change target: enabled={config.auto_change_target_enabled}", "Settings")
+            updates.append((self.unstuck_timeout_var, str(config.unstuck_timeout)))
+            if debug:
+                debug_utils.debug_print(f"Applied unstuck timeout: {config.unstuck_timeout} seconds", "Settings")
             
             # Apply Mage setting
-            if hasattr(self, 'is_mage_var'):
-                self.is_mage_var.set(config.is_mage)
-                print(f"  Applied mage: enabled={config.is_mage}")
+            updates.append((self.is_mage_var, config.is_mage))
+            if debug:
+                debug_utils.debug_print(f"Applied mage: enabled={config.is_mage}", "Settings")
             
             # Apply Assist Only setting
-            if hasattr(self, 'assist_only_var'):
-                self.assist_only_var.set(config.assist_only_enabled)
-                print(f"  Applied assist only: enabled={config.assist_only_enabled}")
-                # If assist_only is enabled, disable dependent features
-                if config.assist_only_enabled:
-                    self._set_assist_only_dependent_widgets_state('disabled')
+            updates.append((self.assist_only_var, config.assist_only_enabled))
+            if debug:
+                debug_utils.debug_print(f"Applied assist only: enabled={config.assist_only_enabled}", "Settings")
             
             # Apply HP settings
-            self.auto_hp_var.set(config.auto_hp_enabled)
-            print(f"  Applied auto HP: enabled={config.auto_hp_enabled}")
-            # Load HP settings from global variables
-            try:
-                self.hp_x_var.set(str(config.hp_bar_area['x']))
-                self.hp_y_var.set(str(config.hp_bar_area['y']))
-                self.hp_width_var.set(str(config.hp_bar_area['width']))
-                self.hp_height_var.set(str(config.hp_bar_area['height']))
-                self.hp_coords_var.set(f"{config.hp_bar_area['x']},{config.hp_bar_area['y']}")
+            updates.append((self.auto_hp_var, config.auto_hp_enabled))
+            if debug:
+                debug_utils.debug_print(f"Applied auto HP: enabled={config.auto_hp_enabled}", "Settings")
+            if debug:
                 thresholds_info = ", ".join([f"{t['threshold']}%={t['key']}" for t in config.hp_thresholds])
-                print(f"  Applied HP thresholds: {thresholds_info}, area: {config.hp_bar_area}")
-            except Exception as e:
-                print(f"  Error applying HP settings: {e}")
+                debug_utils.debug_print(f"Applied HP thresholds: {thresholds_info}, area: {config.hp_bar_area}", "Settings")
             
             # Apply MP settings
-            self.auto_mp_var.set(config.auto_mp_enabled)
-            print(f"  Applied auto MP: enabled={config.auto_mp_enabled}")
+            updates.append((self.auto_mp_var, config.auto_mp_enabled))
+            if debug:
+                debug_utils.debug_print(f"Applied auto MP: enabled={config.auto_mp_enabled}", "Settings")
             # Load MP settings from global variables
             try:
-                self.mp_threshold_var.set(str(config.mp_threshold))
-                if hasattr(self, 'mp_key_var'):
-                    self.mp_key_var.set(config.mp_key)
-                self.mp_x_var.set(str(config.mp_bar_area['x']))
-                self.mp_y_var.set(str(config.mp_bar_area['y']))
-                self.mp_width_var.set(str(config.mp_bar_area['width']))
-                self.mp_height_var.set(str(config.mp_bar_area['height']))
-                self.mp_coords_var.set(f"{config.mp_bar_area['x']},{config.mp_bar_area['y']}")
-                print(f"  Applied MP threshold: {config.mp_threshold}%, area: {config.mp_bar_area}")
+                updates.append((self.mp_threshold_var, str(config.mp_threshold)))
+                updates.append((self.mp_key_var, config.mp_key))
+                if debug:
+                    debug_utils.debug_print(f"Applied MP threshold: {config.mp_threshold}%, area: {config.mp_bar_area}", "Settings")
             except Exception as e:
                 print(f"  Error applying MP settings: {e}")
             
             # Apply mouse clicker settings
-            self.mouse_clicker_var.set(config.mouse_clicker_enabled)
-            print(f"  Applied mouse clicker: enabled={config.mouse_clicker_enabled}")
+            updates.append((self.mouse_clicker_var, config.mouse_clicker_enabled))
+            if debug:
+                debug_utils.debug_print(f"Applied mouse clicker: enabled={config.mouse_clicker_enabled}", "Settings")
+            try:
+                updates.append((self.mouse_clicker_interval_var, str(config.mouse_clicker_interval)))
+                updates.append((self.mouse_clicker_mode_var, "cursor" if config.mouse_clicker_use_cursor else "coords"))
+                updates.append((self.mouse_clicker_x_var, str(config.mouse_clicker_coords['x'])))
+                updates.append((self.mouse_clicker_y_var, str(config.mouse_clicker_coords['y'])))
+                if debug:
+                    debug_utils.debug_print(f"Applied mouse clicker: interval={config.mouse_clicker_interval}s, mode={'cursor' if config.mouse_clicker_use_cursor else 'coords'}, coords={config.mouse_clicker_coords}", "Settings")
+            except Exception as e:
+                print(f"  Error applying mouse clicker settings: {e}")
+            
+            # Buff / skill sequence enabled states (their images are applied further down)
+            for i, var in self.buffs_vars.items():
+                updates.append((var, config.buffs_config[i]['enabled']))
+            for i, var in self.skill_sequence_vars.items():
+                updates.append((var, config.skill_sequence_config[i]['enabled']))
+            
+            # Push every collected variable value to Tk in one call
+            self._set_tk_vars(updates)
+            self._refresh_mp_key_button()
+            
+            # If assist_only is enabled, disable dependent features
+            if config.assist_only_enabled:
+                self._set_assist_only_dependent_widgets_state('disabled')
+            
             try:
-                self.mouse_clicker_interval_var.set(str(config.mouse_clicker_interval))
-                self.mouse_clicker_mode_var.set("cursor" if config.mouse_clicker_use_cursor else "coords")
-                self.mouse_clicker_x_var.set(str(config.mouse_clicker_coords['x']))
-                self.mouse_clicker_y_var.set(str(config.mouse_clicker_coords['y']))
                 self.update_mouse_clicker_mode()  # Update visibility
-                print(f"  Applied mouse clicker: interval={config.mouse_clicker_interval}s, mode={'cursor' if config.mouse_clicker_use_cursor else 'coords'}, coords={config.mouse_clicker_coords}")
             except Exception as e:
                 print(f"  Error applying mouse clicker settings: {e}")
             
+            # Slot images are decoded in parallel; results from earlier loads are dropped
+            self._slot_image_generation += 1
+            # Check all slot image files up front, one listing per changed job folder
+            self._prime_resolved_paths(
+                [buff['image_path'] for buff in config.buffs_config.values()] +
+                [skill.get('image_path') for skill in config.skill_sequence_config.values()]
+            )
+            
             # Apply buffs settings
-            if hasattr(self, 'buffs_vars') and hasattr(self, 'buffs_canvases'):
-                for i in range(8):
-                    try:
-                        # Update enabled state
-                        self.buffs_vars[i].set(config.buffs_config[i]['enabled'])
-                        # Load image if exists - resolve relative path
-                        if config.buffs_config[i]['image_path']:
-                            image_path = self.convert_to_absolute_path(config.buffs_config[i]['image_path'])
-                            if image_path and os.path.exists(image_path):
+            buffs_manager = config.buffs_manager
+            built = bool(self.buffs_canvases)
+            buff_paths = [None] * 8  # Synced to the buffs manager in one call after the loop
+            for i in range(8):
+                try:
+                    # Read the slot's fields once (clear_buff_skill may reset image_path below)
+                    buff = config.buffs_config[i]
+                    relative_path = buff['image_path']
+                    # Load image if exists - resolve relative path
+                    if relative_path:
+                        image_path = self.convert_to_absolute_path(relative_path)
+                        if image_path:  # None when the file is missing
+                            # The tab builds its canvases from config when first opened
+                            if built:
                                 # Keep relative path in config, use absolute for loading
-                                self.buffs_state[i]['image_path'] = config.buffs_config[i]['image_path']
-                                # Load and display the image
-                                self.load_buff_image(i, image_path)
-                                # Sync with buffs manager (use relative path)
-                                if config.buffs_manager:
-                                    if config.buffs_config[i]['enabled']:
-                                        config.buffs_manager.set_buff(i, config.buffs_config[i]['image_path'])
-                                    else:
-                                        config.buffs_manager.clear_buff(i)
-                                print(f"  Applied buff {i+1}: enabled={config.buffs_config[i]['enabled']}, key={config.buffs_config[i]['key']}, path={config.buffs_config[i]['image_path']}")
-                            else:
-                                print(f"  Buff {i+1} image path not found: {config.buffs_config[i]['image_path']}")
-                                self.clear_buff_skill(i)
+                                self.buffs_state[i]['image_path'] = relative_path
+                                # Decode in the background and display once ready
+                                self._load_slot_image_async(self.load_buff_image, self.clear_buff_skill, i, image_path)
+                            # Sync with buffs manager (use relative path)
+                            if buff['enabled']:
+                                buff_paths[i] = relative_path
+                            if debug:
+                                debug_utils.debug_print(f"Applied buff {i+1}: enabled={buff['enabled']}, key={buff['key']}, path={relative_path}", "Settings")
                         else:
+                            print(f"  Buff {i+1} image path not found: {relative_path}")
                             self.clear_buff_skill(i)
-                            # Update buffs manager
-                            if config.buffs_manager:
-                                config.buffs_manager.clear_buff(i)
-                    except Exception as e:
-                        print(f"  Error applying buff {i+1} settings: {e}")
-                        import traceback
-                        traceback.print_exc()
+                    else:
+                        self.clear_buff_skill(i)
+                except Exception as e:
+                    print(f"  Error applying buff {i+1} settings: {e}")
+                    traceback.print_exc()
+            if buffs_manager:
+                buffs_manager.set_bulk(buff_paths)
             
             # Apply skill sequence settings
-            if hasattr(self, 'skill_sequence_vars') and hasattr(self, 'skill_sequence_canvases'):
-                for i in range(8):
-                    try:
-                        # Update enabled state
-                        self.skill_sequence_vars[i].set(config.skill_sequence_config[i]['enabled'])
-                        # Load image if exists - resolve relative path
-                        if config.skill_sequence_config[i].get('image_path'):
-                            image_path = self.convert_to_absolute_path(config.skill_sequence_config[i]['image_path'])
-                            if image_path and os.path.exists(image_path):
+            skill_sequence_manager = config.skill_sequence_manager
+            built = bool(self.skill_sequence_canvases)
+            skill_paths = [None] * 8  # Synced to the skill sequence manager in one call after the loop
+            for i in range(8):
+                try:
+                    # Read the slot's fields once (clear_skill_sequence_skill may reset image_path below)
+                    skill = config.skill_sequence_config[i]
+                    relative_path = skill.get('image_path')
+                    # Load image if exists - resolve relative path
+                    if relative_path:
+                        image_path = self.convert_to_absolute_path(relative_path)
+                        if image_path:  # None when the file is missing
+                            # The tab builds its canvases from config when first opened
+                            if built:
                                 # Keep relative path in config, use absolute for loading
-                                self.skill_sequence_state[i]['image_path'] = config.skill_sequence_config[i]['image_path']
-                                # Load and display the image
-                                self.load_skill_sequence_image(i, image_path)
-                                # Sync with skill sequence manager (use relative path)
-                                if config.skill_sequence_manager:
-                                    if config.skill_sequence_config[i]['enabled']:
-                                        config.skill_sequence_manager.set_skill(i, config.skill_sequence_config[i]['image_path'])
-                                    else:
-                                        config.skill_sequence_manager.clear_skill(i)
-                                print(f"  Applied skill sequence {i+1}: enabled={config.skill_sequence_config[i]['enabled']}, key={config.skill_sequence_config[i].get('key', '')}, path={config.skill_sequence_config[i]['image_path']}")
-                            else:
-                                print(f"  Skill Sequence {i+1} image path not found: {config.skill_sequence_config[i]['image_path']}")
-                                self.clear_skill_sequence_skill(i)
+                                self.skill_sequence_state[i]['image_path'] = relative_path
+                                # Decode in the background and display once ready
+                                self._load_slot_image_async(self.load_skill_sequence_image, self.clear_skill_sequence_skill, i, image_path)
+                            # Sync with skill sequence manager (use relative path)
+                            if skill['enabled']:
+                                skill_paths[i] = relative_path
+                            if debug:
+                                debug_utils.debug_print(f"Applied skill sequence {i+1}: enabled={skill['enabled']}, key={skill.get('key', '')}, path={relative_path}", "Settings")
                         else:
+                            print(f"  Skill Sequence {i+1} image path not found: {relative_path}")
                             self.clear_skill_sequence_skill(i)
-                            # Update skill sequence manager
-                            if config.skill_sequence_manager:
-                                config.skill_sequence_manager.clear_skill(i)
-                    except Exception as e:
-                        print(f"  Error applying skill sequence {i+1} settings: {e}")
-                        import traceback
-                        traceback.print_exc()
+                    else:
+                        self.clear_skill_sequence_skill(i)
+                except Exception as e:
+                    print(f"  Error applying skill sequence {i+1} settings: {e}")
+                    traceback.print_exc()
+            if skill_sequence_manager:
+                skill_sequence_manager.set_bulk(skill_paths)
             
-            # Apply target list
+            # Apply target list (left untouched when the textbox already shows it)
             target_text = '\n'.join(config.mob_target_list)
-            self.target_list_text.delete("1.0", tk.END)
-            self.target_list_text.insert("1.0", target_text)
+            if self.target_list_text.get("1.0", "end-1c") != target_text:
+                self.target_list_text.delete("1.0", tk.END)
+                self.target_list_text.insert("1.0", target_text)
             
             # Apply selected window
             if config.selected_window:
@@ -961,7 +1093,10 @@ class BotGUI:
             print(f"Error applying settings to GUI: {e}")
     
     def __init__(self):
-        if hasattr(self, '_initialized'):
+        # BotGUI() returns the same instance every time; only build the GUI once.
+        # The flag is set up front so re-entrant BotGUI() calls made while the
+        # tabs are being built also return immediately.
+        if self._initialized:
             return
         self._initialized = True
         
@@ -971,6 +1106,10 @@ class BotGUI:
         
         # Initialize root window with customtkinter
         self.root = ctk.CTk()
+        fonts = _fonts()  # Create shared fonts now that Tk is initialized
+        # Screen size is used for centering dialogs; query it once
+        self._screen_w = self.root.winfo_screenwidth()
+        self._screen_h = self.root.winfo_screenheight()
         self.root.title("Kathana Helper v2.1.2")
         self.root.geometry("655x800")
         self.root.resizable(True, True)
@@ -988,6 +1127,8 @@ class BotGUI:
             
             icon_path = os.path.join(base_path, 'icon.ico')
             if os.path.exists(icon_path):
+                # Remember it so extra windows reuse the path without another lookup
+                BotGUI._icon_path = icon_path
                 # Set icon for Windows taskbar, window, and desktop
                 self.root.iconbitmap(icon_path)
                 print(f'✅ Application icon set: {icon_path}')
@@ -996,21 +1137,68 @@ class BotGUI:
         except Exception as e:
             print(f'❌ Error setting application icon: {e}')
         
+        # Set once all tabs are built; guards refresh callbacks that can fire earlier
+        self._gui_ready = False
+        
+        # Pending after() ids for debounced status refreshes (None = nothing queued)
+        self._license_refresh_pending = None
+        self._ocr_refresh_pending = None
+        
+        # Last license display applied by the periodic check (compared by value)
+        self._last_license_display = None
+        
+        # Pending status-label clears from _flash_status, keyed by id(label)
+        self._status_clears = {}
+        self._debounce_ids = {}  # Pending entry updates by key, see _debounce
+        
+        # Cached license info (re-read only after a license change or periodic check)
+        self._license_info_cache = None
+        self._license_info_dirty = True
+        self._license_display_cache = None  # (license_info, LicenseDisplay)
+        
         # Track minimized state
         self.is_minimized = False
         self.minimized_window = None
         self.saved_window_position = None  # Store window position when minimizing
         
+        # Status widgets read by update_status (None until created)
+        self.enemy_hp_progress_bar = None
+        self.enemy_hp_percent_label = None
+        self.current_mob_label = None
+        self.unstuck_countdown_label = None
+        self._clear_minimized_widgets()
+        
+        # Last values written to status widgets (skip redundant Tk redraws)
+        self._last_ui = {}
+        
+        # Resolved absolute paths (None = missing) for slot image paths from settings,
+        # and the mtime of each job folder when its entries were last checked
+        self._resolved_paths = {}
+        self._resolved_folder_mtimes = {}
+        
+        # Recent GUI tick durations (seconds) for adaptive pacing
+        self._tick_durations = deque(maxlen=50)
+        self._tick_count = 0
+        
         # Track last active tab in skill selector
         self.last_skill_selector_tab = None
         
         # Debug window for click coordinate debugging
         self.debug_window = None
         self.debug_text = None
+        # Formatted lines waiting for _flush_debug_messages; capped like the window's 1000-line log
+        self._debug_messages = deque(maxlen=1000)
         
         # Preload skill images cache
         self.skill_images_cache = {}  # {job_key: [(image_path, image_obj, img_file), ...]}
         
+        # Shared worker pool for short background jobs (OCR checks, slot image decoding)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='bot-gui')
+        atexit.register(self._executor.shutdown, wait=False)
+        self._ocr_future = None  # Last OCR re-check, to ignore repeated clicks
+        self._load_settings_future = None  # Set until the running Load Settings is applied
+        self._slot_image_generation = 0  # Bumped per apply_settings_to_gui run
+        
         # Check OCR availability on startup
         self.check_ocr_on_startup()
         
@@ -1039,13 +1227,14 @@ class BotGUI:
         # Window selection frame
         window_frame = ctk.CTkFrame(main_frame, corner_radius=8)
         window_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=10, padx=10)
-        window_frame_label = ctk.CTkLabel(window_frame, text="Window Selection", font=ctk.CTkFont(size=14, weight="bold"))
+        window_frame_label = ctk.CTkLabel(window_frame, text="Window Selection", font=fonts['section'])
         window_frame_label.grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(8, 5))
         
         # Window dropdown
         self.window_var = tk.StringVar()
         self.window_var.trace('w', self.on_window_change)  # Reset connection when window changes
         self.window_combo = ctk.CTkComboBox(window_frame, variable=self.window_var, state="readonly", width=400, height=32)
+        self._window_titles = None  # Titles currently in the dropdown, see _update_window_titles
         self.window_combo.grid(row=1, column=0, sticky="ew", padx=(10, 5), pady=(0, 8))
         
         # Refresh button
@@ -1064,15 +1253,15 @@ class BotGUI:
         status_info_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(0, 10), padx=10)
         
         # Status label
-        self.status_label = ctk.CTkLabel(status_info_frame, text="Status: Stopped", font=ctk.CTkFont(size=12, weight="bold"))
+        self.status_label = ctk.CTkLabel(status_info_frame, text="Status: Stopped", font=fonts['label'])
         self.status_label.grid(row=0, column=0, padx=10, pady=6)
         
         # Connection status label
-        self.connection_label = ctk.CTkLabel(status_info_frame, text="Window: Not Connected", font=ctk.CTkFont(size=11))
+        self.connection_label = ctk.CTkLabel(status_info_frame, text="Window: Not Connected", font=fonts['small'])
         self.connection_label.grid(row=0, column=1, padx=(10, 10), pady=6)
         
         # Minimize/Maximize button
-        self.minimize_button = ctk.CTkButton(status_info_frame, text="−", command=self.toggle_minimize, width=30, height=25, font=ctk.CTkFont(size=16, weight="bold"))
+        self.minimize_button = ctk.CTkButton(status_info_frame, text="−", command=self.toggle_minimize, width=30, height=25, font=fonts['heading'])
         self.minimize_button.grid(row=0, column=2, padx=(10, 10), pady=6)
         
         # Bot control frame - fixed height to prevent fluid expansion
@@ -1109,7 +1298,8 @@ class BotGUI:
         self.load_settings_button.grid(row=0, column=6, padx=(5, 10), pady=5)
         
         # Create tabview for all sections
-        tabview = ctk.CTkTabview(main_frame, corner_radius=8)
+        tabview = ctk.CTkTabview(main_frame, corner_radius=8, command=self._on_tab_changed)
+        self.tabview = tabview
         tabview.grid(row=3, column=0, columnspan=2, sticky="nsew", pady=(0, 10), padx=10)
         
         # Configure tabview to expand
@@ -1136,47 +1326,47 @@ class BotGUI:
         hp_bar_frame = ctk.CTkFrame(status_frame, fg_color="transparent")
         hp_bar_frame.grid(row=0, column=0, sticky="w", padx=15, pady=(15, 5))
         
-        hp_label = ctk.CTkLabel(hp_bar_frame, text="HP:", width=70, anchor='w', font=ctk.CTkFont(size=11))
+        hp_label = ctk.CTkLabel(hp_bar_frame, text="HP:", width=70, anchor='w', font=fonts['small'])
         hp_label.grid(row=0, column=0, padx=(0, 10))
         self.hp_progress_bar = ctk.CTkProgressBar(hp_bar_frame, width=200, height=20, progress_color="red", corner_radius=0)
         self.hp_progress_bar.set(0)
         self.hp_progress_bar.grid(row=0, column=1, padx=(0, 10))
-        self.hp_percent_label = ctk.CTkLabel(hp_bar_frame, text="---%", font=ctk.CTkFont(size=11, weight="bold"), text_color="white")
+        self.hp_percent_label = ctk.CTkLabel(hp_bar_frame, text="---%", font=fonts['small_bold'], text_color="white")
         self.hp_percent_label.grid(row=0, column=2)
         
         # MP Progress Bar
         mp_bar_frame = ctk.CTkFrame(status_frame, fg_color="transparent")
         mp_bar_frame.grid(row=1, column=0, sticky="w", padx=15, pady=5)
         
-        mp_label = ctk.CTkLabel(mp_bar_frame, text="MP:", width=70, anchor='w', font=ctk.CTkFont(size=11))
+        mp_label = ctk.CTkLabel(mp_bar_frame, text="MP:", width=70, anchor='w', font=fonts['small'])
         mp_label.grid(row=0, column=0, padx=(0, 10))
         self.mp_progress_bar = ctk.CTkProgressBar(mp_bar_frame, width=200, height=20, progress_color="#0b58b0", corner_radius=0)
         self.mp_progress_bar.set(0)
         self.mp_progress_bar.grid(row=0, column=1, padx=(0, 10))
-        self.mp_percent_label = ctk.CTkLabel(mp_bar_frame, text="---%", font=ctk.CTkFont(size=11, weight="bold"), text_color="white")
+        self.mp_percent_label = ctk.CTkLabel(mp_bar_frame, text="---%", font=fonts['small_bold'], text_color="white")
         self.mp_percent_label.grid(row=0, column=2)
         
         # Enemy HP Progress Bar
         enemy_hp_bar_frame = ctk.CTkFrame(status_frame, fg_color="transparent")
         enemy_hp_bar_frame.grid(row=2, column=0, sticky="w", padx=15, pady=5)
         
-        enemy_hp_label = ctk.CTkLabel(enemy_hp_bar_frame, text="Enemy HP:", width=70, anchor='w', font=ctk.CTkFont(size=11))
+        enemy_hp_label = ctk.CTkLabel(enemy_hp_bar_frame, text="Enemy HP:", width=70, anchor='w', font=fonts['small'])
         enemy_hp_label.grid(row=0, column=0, padx=(0, 10))
         self.enemy_hp_progress_bar = ctk.CTkProgressBar(enemy_hp_bar_frame, width=200, height=20, progress_color="green", corner_radius=0)
         self.enemy_hp_progress_bar.set(0)
         self.enemy_hp_progress_bar.grid(row=0, column=1, padx=(0, 10))
-        self.enemy_hp_percent_label = ctk.CTkLabel(enemy_hp_bar_frame, text="---%", font=ctk.CTkFont(size=11, weight="bold"), text_color="white")
+        self.enemy_hp_percent_label = ctk.CTkLabel(enemy_hp_bar_frame, text="---%", font=fonts['small_bold'], text_color="white")
         self.enemy_hp_percent_label.grid(row=0, column=2)
         
         # Enemy Name display
         enemy_name_frame = ctk.CTkFrame(status_frame, fg_color="transparent")
         enemy_name_frame.grid(row=3, column=0, sticky="w", padx=15, pady=(5, 5))
         
-        enemy_name_label = ctk.CTkLabel(enemy_name_frame, text="Enemy Name:", width=70, anchor='w', font=ctk.CTkFont(size=11))
+        enemy_name_label = ctk.CTkLabel(enemy_name_frame, text="Enemy Name:", width=70, anchor='w', font=fonts['small'])
         enemy_name_label.grid(row=0, column=0, padx=(0, 10))
-        self.current_mob_label = ctk.CTkLabel(enemy_name_frame, text="None", width=170, anchor='w', font=ctk.CTkFont(size=11), text_color="red")
+        self.current_mob_label = ctk.CTkLabel(enemy_name_frame, text="None", width=170, anchor='w', font=fonts['small'], text_color="red")
         self.current_mob_label.grid(row=0, column=1, sticky="w", padx=(0, 10))
-        self.unstuck_countdown_label = ctk.CTkLabel(enemy_name_frame, text="Unstuck: ---", font=ctk.CTkFont(size=10), text_color="gray")
+        self.unstuck_countdown_label = ctk.CTkLabel(enemy_name_frame, text="Unstuck: ---", font=fonts['tiny'], text_color="gray")
         self.unstuck_countdown_label.grid(row=0, column=2)
         
         # License Info card (styled like OCR status frame)
@@ -1194,7 +1384,7 @@ class BotGUI:
         license_header = ctk.CTkLabel(
             license_info_frame,
             text="License Info",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=fonts['label'],
         )
         license_header.grid(row=0, column=0, sticky="w", padx=(12, 8), pady=(10, 6))
 
@@ -1210,58 +1400,7 @@ class BotGUI:
         create_tooltip(activate_license_btn, "Activate or change your license key")
         
         # License status (enhanced display)
-        license_manager = get_license_manager()
-        license_info = license_manager.get_license_info()
-
-        if license_info and license_info.get('valid'):
-            status_color = "green"
-            user_name = license_info['data'].get('user_name', 'Unknown')
-            expires = license_info['data'].get('expires', 'Never')
-            issued = license_info['data'].get('issued', 'Unknown')
-            machine_bound = license_info['data'].get('machine_bound', False)
-            
-            # Calculate days left if expiration exists
-            if expires != 'Never':
-                from datetime import datetime
-                try:
-                    expires_date = datetime.fromisoformat(expires)
-                    expires_str = expires_date.strftime('%B %d, %Y')
-                    days_left = (expires_date - datetime.now()).days
-                    if days_left < 0:
-                        status_color = "red"
-                        status_indicator = "●"
-                        expiry_info = f"Expired: {expires_str}"
-                    elif days_left <= 7:
-                        status_color = "orange"
-                        status_indicator = "●"
-                        expiry_info = f"{expires_str} ({days_left} day{'s' if days_left != 1 else ''} left)"
-                    elif days_left <= 30:
-                        status_color = "yellow"
-                        status_indicator = "●"
-                        expiry_info = f"{expires_str} ({days_left} days left)"
-                    else:
-                        expiry_info = f"{expires_str}"
-                except:
-                    expiry_info = f"{expires}"
-            else:
-                expiry_info = "No expiration"
-            
-            # Format issued date
-            if issued != 'Unknown':
-                try:
-                    from datetime import datetime
-                    issued_date = datetime.fromisoformat(issued)
-                    issued_str = issued_date.strftime('%B %d, %Y')
-                except:
-                    issued_str = issued
-            else:
-                issued_str = "Unknown"
-        else:
-            status_color = "red"
-            user_name = "N/A"
-            expiry_info = "No valid license found"
-            issued_str = "N/A"
-            machine_bound = False
+        display = self._format_license_dates(self._get_license_info())
         
         # License details
         details_frame = ctk.CTkFrame(license_info_frame, fg_color="transparent")
@@ -1269,30 +1408,30 @@ class BotGUI:
         details_frame.columnconfigure(1, weight=1)
         
         # User name
-        ctk.CTkLabel(details_frame, text="User:", font=ctk.CTkFont(size=10, weight="bold")).grid(row=0, column=0, sticky="w", padx=(0, 10), pady=(0, 2))
-        self.license_user_value = ctk.CTkLabel(details_frame, text=user_name, font=ctk.CTkFont(size=10), text_color="white")
+        ctk.CTkLabel(details_frame, text="User:", font=fonts['tiny_bold']).grid(row=0, column=0, sticky="w", padx=(0, 10), pady=(0, 2))
+        self.license_user_value = ctk.CTkLabel(details_frame, text=display.user_name, font=fonts['tiny'], text_color="white")
         self.license_user_value.grid(row=0, column=1, sticky="w", pady=(0, 2))
         
         # Expiration
-        ctk.CTkLabel(details_frame, text="Expiration:", font=ctk.CTkFont(size=10, weight="bold")).grid(row=1, column=0, sticky="w", padx=(0, 10), pady=2)
+        ctk.CTkLabel(details_frame, text="Expiration:", font=fonts['tiny_bold']).grid(row=1, column=0, sticky="w", padx=(0, 10), pady=2)
         self.license_expiry_label = ctk.CTkLabel(
             details_frame,
-            text=expiry_info,
-            font=ctk.CTkFont(size=10),
-            text_color=status_color if license_info and license_info.get('valid') else "gray"
+            text=display.expiry_info,
+            font=fonts['tiny'],
+            text_color=display.status_color if display.valid else "gray"
         )
         self.license_expiry_label.grid(row=1, column=1, sticky="w", pady=2)
         
         # Issued date
-        ctk.CTkLabel(details_frame, text="Issued:", font=ctk.CTkFont(size=10, weight="bold")).grid(row=2, column=0, sticky="w", padx=(0, 10), pady=2)
-        self.license_issued_value = ctk.CTkLabel(details_frame, text=issued_str, font=ctk.CTkFont(size=10), text_color="gray")
+        ctk.CTkLabel(details_frame, text="Issued:", font=fonts['tiny_bold']).grid(row=2, column=0, sticky="w", padx=(0, 10), pady=2)
+        self.license_issued_value = ctk.CTkLabel(details_frame, text=display.issued_str, font=fonts['tiny'], text_color="gray")
         self.license_issued_value.grid(row=2, column=1, sticky="w", pady=2)
 
         # Binding indicator (compact)
-        ctk.CTkLabel(details_frame, text="Binding:", font=ctk.CTkFont(size=10, weight="bold")).grid(row=3, column=0, sticky="w", padx=(0, 10), pady=(2, 0))
-        binding_text = "Machine Bound" if machine_bound else "—"
-        binding_color = "orange" if machine_bound else "gray"
-        self.license_binding_value = ctk.CTkLabel(details_frame, text=binding_text, font=ctk.CTkFont(size=10), text_color=binding_color)
+        ctk.CTkLabel(details_frame, text="Binding:", font=fonts['tiny_bold']).grid(row=3, column=0, sticky="w", padx=(0, 10), pady=(2, 0))
+        binding_text = "Machine Bound" if display.machine_bound else "—"
+        binding_color = "orange" if display.machine_bound else "gray"
+        self.license_binding_value = ctk.CTkLabel(details_frame, text=binding_text, font=fonts['tiny'], text_color=binding_color)
         self.license_binding_value.grid(row=3, column=1, sticky="w", pady=(2, 0))
         
         # Configure status frame grid
@@ -1303,20 +1442,15 @@ class BotGUI:
         settings_scroll.pack(fill="both", expand=True)
         settings_frame = settings_scroll
         
-        # Configure settings frame for 2 columns with padding
+        # Configure settings frame for 2 columns with padding (rows keep Tk's default weight of 0)
         settings_frame.columnconfigure(0, weight=1)
         settings_frame.columnconfigure(1, weight=1)
-        settings_frame.rowconfigure(0, weight=0)
-        settings_frame.rowconfigure(1, weight=0)
-        settings_frame.rowconfigure(2, weight=0)
-        settings_frame.rowconfigure(3, weight=0)
-        settings_frame.rowconfigure(4, weight=0)
         
         # Debug Tools frame (at the top)
         debug_frame = ctk.CTkFrame(settings_frame, fg_color="transparent")
         debug_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=15, pady=(10, 5))
         
-        debug_label = ctk.CTkLabel(debug_frame, text="Debug Tools:", font=ctk.CTkFont(size=12, weight="bold"))
+        debug_label = ctk.CTkLabel(debug_frame, text="Debug Tools:", font=fonts['label'])
         debug_label.grid(row=0, column=0, sticky="w", padx=(0, 10))
         
         self.debug_var = tk.BooleanVar(value=debug_utils.get_debug_enabled())
@@ -1343,10 +1477,7 @@ class BotGUI:
         
         # Auto Attack checkbox
         self.auto_attack_var = tk.BooleanVar()
-        self.auto_attack_checkbox = ctk.CTkCheckBox(auto_attack_frame, text="Auto Attack", 
-                                         variable=self.auto_attack_var,
-                                         command=self.update_auto_attack,
-                                         font=ctk.CTkFont(size=11))
+        self.auto_attack_checkbox = self._make_checkbox(auto_attack_frame, "Auto Attack", self.auto_attack_var, self.update_auto_attack)
         self.auto_attack_checkbox.grid(row=0, column=0, sticky="w", pady=5)
         create_tooltip(self.auto_attack_checkbox, "Automatically targets and attacks enemies. Requires enemy HP bar calibration.")
         
@@ -1356,20 +1487,17 @@ class BotGUI:
         
         # Auto Loot checkbox
         self.action_vars['pick'] = tk.BooleanVar(value=config.action_slots['pick']['enabled'])
-        auto_loot_checkbox = ctk.CTkCheckBox(auto_loot_frame, text="Auto Loot", 
-                                         variable=self.action_vars['pick'],
-                                         command=lambda: self.update_action_slot('pick'),
-                                         font=ctk.CTkFont(size=11))
+        auto_loot_checkbox = self._make_checkbox(auto_loot_frame, "Auto Loot", self.action_vars['pick'], lambda: self.update_action_slot('pick'))
         auto_loot_checkbox.grid(row=0, column=0, sticky="w", pady=5)
         create_tooltip(auto_loot_checkbox, "Automatically picks up items after killing enemies. Uses the 'pick' action key (default: F).")
         
         # Looting duration input (seconds)
         self.looting_duration_var = tk.StringVar(value=str(config.LOOTING_DURATION))
-        looting_duration_entry = ctk.CTkEntry(auto_loot_frame, textvariable=self.looting_duration_var, width=50, font=ctk.CTkFont(size=11))
+        looting_duration_entry = ctk.CTkEntry(auto_loot_frame, textvariable=self.looting_duration_var, width=50, font=fonts['small'])
         looting_duration_entry.grid(row=0, column=1, padx=(10, 5))
-        looting_duration_entry.bind('<KeyRelease>', lambda event: self.update_looting_duration())
-        looting_duration_entry.bind('<FocusOut>', lambda event: self.update_looting_duration())
-        looting_seconds_label = ctk.CTkLabel(auto_loot_frame, text="s", font=ctk.CTkFont(size=11))
+        looting_duration_entry.bind('<KeyRelease>', lambda event: self._debounce('loot', self.update_looting_duration))
+        looting_duration_entry.bind('<FocusOut>', lambda event: self._flush_debounce('loot', self.update_looting_duration))
+        looting_seconds_label = ctk.CTkLabel(auto_loot_frame, text="s", font=fonts['small'])
         looting_seconds_label.grid(row=0, column=2, sticky="w")
         create_tooltip(looting_duration_entry, "Input: Looting duration in seconds. This is how long the bot prevents auto-targeting after looting starts. Lower values allow faster retargeting to the next enemy.")
         
@@ -1379,10 +1507,7 @@ class BotGUI:
         
         # Auto Repair checkbox
         self.auto_repair_var = tk.BooleanVar(value=config.auto_repair_enabled)
-        auto_repair_checkbox = ctk.CTkCheckBox(auto_repair_frame, text="Auto Repair", 
-                                         variable=self.auto_repair_var,
-                                         command=self.update_auto_repair,
-                                         font=ctk.CTkFont(size=11))
+        auto_repair_checkbox = self._make_checkbox(auto_repair_frame, "Auto Repair", self.auto_repair_var, self.update_auto_repair)
         auto_repair_checkbox.grid(row=0, column=0, sticky="w", pady=5)
         create_tooltip(auto_repair_checkbox, "Automatically repairs items when 'is about to break' warning appears. Requires system message area calibration and OCR. Check interval is fixed at 3 seconds for optimal performance.")
         
@@ -1392,10 +1517,7 @@ class BotGUI:
         
         # Mage checkbox
         self.is_mage_var = tk.BooleanVar(value=config.is_mage)
-        mage_checkbox = ctk.CTkCheckBox(mage_frame, text="Mage?", 
-                                         variable=self.is_mage_var,
-                                         command=self.update_is_mage,
-                                         font=ctk.CTkFont(size=11))
+        mage_checkbox = self._make_checkbox(mage_frame, "Mage?", self.is_mage_var, self.update_is_mage)
         mage_checkbox.grid(row=0, column=0, sticky="w", pady=5)
         create_tooltip(mage_checkbox, "Enable if playing as a mage. Prevents attack action from triggering after targeting (mages use skills instead).")
         
@@ -1405,10 +1527,7 @@ class BotGUI:
         
         # Assist Only checkbox
         self.assist_only_var = tk.BooleanVar(value=config.assist_only_enabled)
-        self.assist_only_checkbox = ctk.CTkCheckBox(assist_only_frame, text="Assist Mode", 
-                                         variable=self.assist_only_var,
-                                         command=self.update_assist_only,
-                                         font=ctk.CTkFont(size=11))
+        self.assist_only_checkbox = self._make_checkbox(assist_only_frame, "Assist Mode", self.assist_only_var, self.update_assist_only)
         self.assist_only_checkbox.grid(row=0, column=0, sticky="w", pady=5)
         create_tooltip(self.assist_only_checkbox, "Enable assist mode: Party leader determines target. Bot only attacks when enemy HP decreases (indicating leader has started attacking). Disables Auto Attack, Mob Filter, and Auto Unstuck.")
         
@@ -1426,9 +1545,7 @@ class BotGUI:
             config.auto_attack_enabled = False
             config.mob_detection_enabled = False
             config.auto_change_target_enabled = False
-            
-            # Disable checkboxes in GUI (will be set after widgets are created)
-            self.root.after(100, lambda: self._set_assist_only_dependent_widgets_state('disabled'))
+            # The dependent checkboxes are disabled once the Mob Filter section is built
         
         # Column 1: Auto HP, Auto MP, Auto Unstuck
         # Auto HP frame
@@ -1437,121 +1554,83 @@ class BotGUI:
         
         # Auto HP checkbox
         self.auto_hp_var = tk.BooleanVar()
-        auto_hp_checkbox = ctk.CTkCheckBox(auto_hp_frame, text="Auto HP", 
-                                         variable=self.auto_hp_var,
-                                         command=self.update_auto_hp,
-                                         font=ctk.CTkFont(size=11))
+        auto_hp_checkbox = self._make_checkbox(auto_hp_frame, "Auto HP", self.auto_hp_var, self.update_auto_hp)
         auto_hp_checkbox.grid(row=0, column=0, sticky="w", pady=5)
         create_tooltip(auto_hp_checkbox, "Automatically uses HP potions when HP drops below configured thresholds. Requires HP bar calibration.")
         
         # Ellipsis button for multiple HP thresholds configuration
         hp_thresholds_button = ctk.CTkButton(auto_hp_frame, text="⋯", width=28, height=28,
                                             command=self.configure_hp_thresholds,
-                                            font=ctk.CTkFont(size=16), corner_radius=4)
+                                            font=fonts['icon'], corner_radius=4)
         hp_thresholds_button.grid(row=0, column=1, padx=(10, 0), pady=5)
         create_tooltip(hp_thresholds_button, "Configure multiple HP thresholds with different keys. Example: 80% = key 0, 50% = key 3")
         
-        # HP bar area input (x, y, width, height) - hidden, only used internally
-        self.hp_x_var = tk.StringVar(value=str(config.hp_bar_area['x']))
-        self.hp_y_var = tk.StringVar(value=str(config.hp_bar_area['y']))
-        self.hp_width_var = tk.StringVar(value=str(config.hp_bar_area['width']))
-        self.hp_height_var = tk.StringVar(value=str(config.hp_bar_area['height']))
-        self.hp_coords_var = tk.StringVar(value=f"{config.hp_bar_area['x']},{config.hp_bar_area['y']}")
-        
         # Auto MP frame
         auto_mp_frame = ctk.CTkFrame(settings_frame, fg_color="transparent")
         auto_mp_frame.grid(row=2, column=1, sticky="ew", padx=(5, 15), pady=(0, 0))
         
         # Auto MP checkbox
         self.auto_mp_var = tk.BooleanVar()
-        auto_mp_checkbox = ctk.CTkCheckBox(auto_mp_frame, text="Auto MP", 
-                                         variable=self.auto_mp_var,
-                                         command=self.update_auto_mp,
-                                         font=ctk.CTkFont(size=11))
+        auto_mp_checkbox = self._make_checkbox(auto_mp_frame, "Auto MP", self.auto_mp_var, self.update_auto_mp)
         auto_mp_checkbox.grid(row=0, column=0, sticky="w", pady=5)
         create_tooltip(auto_mp_checkbox, "Automatically uses MP potions when MP drops below the threshold. Requires MP bar calibration.")
         
         # MP threshold input (percentage)
         self.mp_threshold_var = tk.StringVar(value=str(config.mp_threshold))
-        mp_threshold_entry = ctk.CTkEntry(auto_mp_frame, textvariable=self.mp_threshold_var, width=50, font=ctk.CTkFont(size=11))
+        mp_threshold_entry = ctk.CTkEntry(auto_mp_frame, textvariable=self.mp_threshold_var, width=50, font=fonts['small'])
         mp_threshold_entry.grid(row=0, column=1, padx=(10, 5))
-        mp_threshold_entry.bind('<KeyRelease>', lambda event: self.update_mp_threshold())
-        mp_threshold_entry.bind('<FocusOut>', lambda event: self.update_mp_threshold())
-        mp_percent_label = ctk.CTkLabel(auto_mp_frame, text="%", font=ctk.CTkFont(size=11))
+        mp_threshold_entry.bind('<KeyRelease>', lambda event: self._debounce('mp_threshold', self.update_mp_threshold))
+        mp_threshold_entry.bind('<FocusOut>', lambda event: self._flush_debounce('mp_threshold', self.update_mp_threshold))
+        mp_percent_label = ctk.CTkLabel(auto_mp_frame, text="%", font=fonts['small'])
         mp_percent_label.grid(row=0, column=2, sticky="w")
         create_tooltip(mp_threshold_entry, "Input: MP percentage threshold (0-100). Enter the MP percentage below which the bot will automatically use MP potions. Example: 50 means potion is used when MP drops below 50%.")
         
         # MP key registration
         self.mp_key_var = tk.StringVar(value=config.mp_key)
-        def update_mp_key_button_text(var=self.mp_key_var, btn=None):
-            if var.get():
-                btn.configure(text=var.get().upper())
-            else:
-                btn.configure(text="Set Key")
         mp_key_button = ctk.CTkButton(auto_mp_frame, width=60, height=28,
                                       command=self.register_mp_key,
-                                      font=ctk.CTkFont(size=10), corner_radius=4)
+                                      font=fonts['tiny'], corner_radius=4)
         mp_key_button.grid(row=0, column=3, padx=(10, 0), pady=5)
-        update_mp_key_button_text(btn=mp_key_button)
-        self.mp_key_var.trace_add('write', lambda *args: update_mp_key_button_text(btn=mp_key_button))
+        self.mp_key_button = mp_key_button
+        self._refresh_mp_key_button()
         mp_key_button.bind('<Button-3>', lambda e: self.clear_mp_key())
         create_tooltip(mp_key_button, "Click to register the hotkey for MP potion. Right-click to clear.")
         
-        # MP bar area input (x, y, width, height) - hidden, only used internally
-        self.mp_x_var = tk.StringVar(value=str(config.mp_bar_area['x']))
-        self.mp_y_var = tk.StringVar(value=str(config.mp_bar_area['y']))
-        self.mp_width_var = tk.StringVar(value=str(config.mp_bar_area['width']))
-        self.mp_height_var = tk.StringVar(value=str(config.mp_bar_area['height']))
-        self.mp_coords_var = tk.StringVar(value=f"{config.mp_bar_area['x']},{config.mp_bar_area['y']}")
-        
         # Auto Unstuck frame
         auto_change_target_frame = ctk.CTkFrame(settings_frame, fg_color="transparent")
         auto_change_target_frame.grid(row=3, column=1, sticky="ew", padx=(5, 15), pady=(0, 0))
         
         # Auto Unstuck checkbox
         self.auto_change_target_var = tk.BooleanVar(value=config.auto_change_target_enabled)
-        self.auto_change_target_checkbox = ctk.CTkCheckBox(auto_change_target_frame, text="Auto Unstuck", 
-                                         variable=self.auto_change_target_var,
-                                         command=self.update_auto_change_target,
-                                         font=ctk.CTkFont(size=11))
+        self.auto_change_target_checkbox = self._make_checkbox(auto_change_target_frame, "Auto Unstuck", self.auto_change_target_var, self.update_auto_change_target)
         self.auto_change_target_checkbox.grid(row=0, column=0, sticky="w", pady=5)
         create_tooltip(self.auto_change_target_checkbox, "Automatically changes target when enemy HP becomes stagnant (stuck). Detects when enemy HP doesn't decrease for the timeout duration.")
         
         # Unstuck timeout input (seconds)
         self.unstuck_timeout_var = tk.StringVar(value=str(config.unstuck_timeout))
-        unstuck_timeout_entry = ctk.CTkEntry(auto_change_target_frame, textvariable=self.unstuck_timeout_var, width=50, font=ctk.CTkFont(size=11))
+        unstuck_timeout_entry = ctk.CTkEntry(auto_change_target_frame, textvariable=self.unstuck_timeout_var, width=50, font=fonts['small'])
         unstuck_timeout_entry.grid(row=0, column=1, padx=(10, 5))
-        unstuck_timeout_entry.bind('<KeyRelease>', lambda event: self.update_unstuck_timeout())
-        unstuck_timeout_entry.bind('<FocusOut>', lambda event: self.update_unstuck_timeout())
-        unstuck_seconds_label = ctk.CTkLabel(auto_change_target_frame, text="s", font=ctk.CTkFont(size=11))
+        unstuck_timeout_entry.bind('<KeyRelease>', lambda event: self._debounce('unstuck', self.update_unstuck_timeout))
+        unstuck_timeout_entry.bind('<FocusOut>', lambda event: self._flush_debounce('unstuck', self.update_unstuck_timeout))
+        unstuck_seconds_label = ctk.CTkLabel(auto_change_target_frame, text="s", font=fonts['small'])
         unstuck_seconds_label.grid(row=0, column=2, sticky="w")
         create_tooltip(unstuck_timeout_entry, "Input: Unstuck timeout in seconds. Time to wait before considering enemy HP stagnant (stuck). If enemy HP doesn't decrease for this duration, bot will switch targets. Lower values = faster target switching. Default: 8 seconds.")
         
-        # Configure options frame rows for proper visibility
-        settings_frame.rowconfigure(1, weight=0)
-        settings_frame.rowconfigure(2, weight=0)
-        settings_frame.rowconfigure(3, weight=0)
-        settings_frame.rowconfigure(4, weight=0)
-        settings_frame.rowconfigure(5, weight=0)
-        
         # Add Mob Filter to Settings tab (moved to row 6 to avoid overlap with Assist Only)
         mob_separator = ctk.CTkFrame(settings_frame, height=1, fg_color="gray50")
         
-        mob_label = ctk.CTkLabel(settings_frame, text="Mob Filter", font=ctk.CTkFont(size=12, weight="bold"))
+        mob_label = ctk.CTkLabel(settings_frame, text="Mob Filter", font=fonts['label'])
         mob_label.grid(row=6, column=0, columnspan=2, sticky="w", padx=15, pady=(10, 5))
         
         # Mob detection checkbox
         self.mob_detection_var = tk.BooleanVar()
-        self.mob_checkbox = ctk.CTkCheckBox(settings_frame, text="Enable", 
-                                     variable=self.mob_detection_var,
-                                     command=self.update_mob_detection,
-                                     font=ctk.CTkFont(size=11))
+        self.mob_checkbox = self._make_checkbox(settings_frame, "Enable", self.mob_detection_var, self.update_mob_detection)
         self.mob_checkbox.grid(row=7, column=0, columnspan=2, sticky="w", padx=15, pady=(0, 5))
         create_tooltip(self.mob_checkbox, "Enable mob filtering. Bot will only attack mobs in the target list. Uses OCR to read enemy names. Requires calibration.")
         
         # Target list
-        ctk.CTkLabel(settings_frame, text="Target List (one per line, only attack mobs in this list):", font=ctk.CTkFont(size=11)).grid(row=8, column=0, columnspan=2, sticky="w", padx=15, pady=(5, 5))
-        self.target_list_text = ctk.CTkTextbox(settings_frame, height=150, width=400, font=ctk.CTkFont(size=11))
+        ctk.CTkLabel(settings_frame, text="Target List (one per line, only attack mobs in this list):", font=fonts['small']).grid(row=8, column=0, columnspan=2, sticky="w", padx=15, pady=(5, 5))
+        self.target_list_text = ctk.CTkTextbox(settings_frame, height=150, width=400, font=fonts['small'])
         self.target_list_text.grid(row=9, column=0, columnspan=2, sticky="ew", padx=15, pady=(0, 5))
         
         # Mob filter buttons
@@ -1565,369 +1644,62 @@ class BotGUI:
         test_btn.grid(row=0, column=1, padx=(0, 10))
         
         # Record button - captures current enemy name automatically
-        is_calibrated = config.calibrator is not None and config.calibrator.mp_position is not None and config.connected_window is not None
+        is_calibrated = config.is_calibrated() and config.connected_window is not None
         self.record_target_btn = ctk.CTkButton(mob_btn_frame, text="Record", command=self.record_target_mob, width=100, corner_radius=6, 
                                   state="normal" if is_calibrated else "disabled")
         self.record_target_btn.grid(row=0, column=2)
         create_tooltip(self.record_target_btn, "Records the currently targeted enemy name and adds it to the mob target list. Requires calibration and an active target.")
         
+        # All assist-only dependent checkboxes exist now; disable them right away
+        if config.assist_only_enabled:
+            self._set_assist_only_dependent_widgets_state('disabled')
         
-        settings_frame.columnconfigure(0, weight=1)
-        settings_frame.columnconfigure(1, weight=1)
-        settings_frame.rowconfigure(9, weight=0)
-        
-        # Hidden variables for mob detection (only used internally)
-        self.mob_coords_var = tk.StringVar(value=f"{config.target_name_area['x']},{config.target_name_area['y']}")
-        self.enemy_hp_coords_var = tk.StringVar(value=f"{config.target_hp_bar_area['x']},{config.target_hp_bar_area['y']}")
-        self.enemy_hp_x_var = tk.StringVar(value=str(config.target_hp_bar_area['x']))
-        self.enemy_hp_y_var = tk.StringVar(value=str(config.target_hp_bar_area['y']))
-        self.enemy_hp_width_var = tk.StringVar(value=str(config.target_hp_bar_area['width']))
-        self.enemy_hp_height_var = tk.StringVar(value=str(config.target_hp_bar_area['height']))
-        self.mob_width_var = tk.StringVar(value=str(config.target_name_area['width']))
-        self.mob_height_var = tk.StringVar(value=str(config.target_name_area['height']))
-        
-        # Skill Sequence frame - moved to Skill Sequence tab
-        # Wrap skill sequence tab in scrollable frame
-        skill_sequence_scroll = ctk.CTkScrollableFrame(skill_sequence_tab)
-        skill_sequence_scroll.pack(fill="both", expand=True)
-        skill_sequence_frame = skill_sequence_scroll
-        
-        # Info section for Skill Sequence
-        info_frame = ctk.CTkFrame(skill_sequence_frame, corner_radius=6, fg_color=("gray18", "gray14"), 
-                                 border_width=1, border_color="gray25")
-        info_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=10, pady=(10, 15))
-        info_frame.columnconfigure(0, weight=1)
-        
-        info_title = ctk.CTkLabel(info_frame, text="How to use:", 
-                                  font=ctk.CTkFont(size=12, weight="bold"))
-        info_title.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
-        
-        info_text = ctk.CTkLabel(info_frame, 
-                                text="1. Click the skill image to select a skill\n"
-                                     "2. Enable the checkbox to activate the skill\n"
-                                     "3. Skills execute automatically in sequence when enemy is found",
-                                font=ctk.CTkFont(size=12),
-                                justify="left", anchor="w")
-        info_text.grid(row=1, column=0, sticky="w", padx=10, pady=(0, 10))
-        
-        # Initialize skill sequence variables
+        # Every tab after Settings is built the first time it is opened
+        self._tab_builders = {
+            "Skill Sequence": lambda: self._build_skill_sequence_tab(skill_sequence_tab),
+            "Skill Interval": lambda: self._build_skills_tab(skills_tab),
+            "Buffs": lambda: self._build_buffs_tab(buffs_tab),
+            "Mouse Clicker": lambda: self._build_mouse_clicker_tab(mouse_clicker_tab),
+        }
         self.skill_sequence_vars = {}
         self.skill_sequence_canvases = []
         self.skill_sequence_state = []
-        
-        # Create skill sequence slots in a compact grid (2 columns, 4 rows)
-        for i in range(8):
-            if i < 4:
-                # First column: slots 1-4
-                row = i + 1  # +1 because info_frame is at row 0
-                col = 0
-            else:
-                # Second column: slots 5-8
-                row = i - 3  # -3 because info_frame is at row 0, and we want slots 5-8 to start at row 2
-                col = 1
-            
-            # Create compact frame for each skill sequence slot (horizontal layout)
-            skill_slot_frame = ctk.CTkFrame(skill_sequence_frame, corner_radius=6, fg_color=("gray18", "gray14"))
-            padx_left = 10 if col == 0 else 5
-            padx_right = 5 if col == 0 else 10
-            skill_slot_frame.grid(row=row, column=col, sticky="ew", padx=(padx_left, padx_right), pady=3)
-            skill_slot_frame.columnconfigure(3, weight=1)
-            
-            # Enable checkbox (no text, just the box)
-            self.skill_sequence_vars[i] = tk.BooleanVar(value=config.skill_sequence_config[i]['enabled'])
-            checkbox = ctk.CTkCheckBox(skill_slot_frame, text="", 
-                                      variable=self.skill_sequence_vars[i],
-                                      command=lambda idx=i: self.update_skill_sequence_enabled(idx),
-                                      font=ctk.CTkFont(size=10), width=20)
-            checkbox.grid(row=0, column=0, padx=(8, 5), pady=6, sticky="w")
-            
-            # Label for slot info
-            slot_label = ctk.CTkLabel(skill_slot_frame, text=f"Skill {i+1}", 
-                                     font=ctk.CTkFont(size=11, weight="bold"), width=60)
-            slot_label.grid(row=0, column=1, padx=(0, 5), pady=6, sticky="w")
-            
-            # Skill image canvas (clickable to select skill) - smaller size
-            canvas = tk.Canvas(skill_slot_frame, width=40, height=40, bg='gray20', 
-                             highlightthickness=1, highlightbackground='gray50', cursor='hand2')
-            canvas.grid(row=0, column=2, padx=5, pady=6)
-            canvas.bind('<Button-1>', lambda e, idx=i: self.show_skill_sequence_selector(idx))
-            canvas.bind('<Button-3>', lambda e, idx=i: self.clear_skill_sequence_skill(idx))
-            self.skill_sequence_canvases.append(canvas)
-            
-            # Initialize skill sequence state
-            self.skill_sequence_state.append({
-                'image_path': config.skill_sequence_config[i].get('image_path'),
-                'enabled': config.skill_sequence_config[i]['enabled']
-            })
-            
-            # Load skill image if exists - convert relative paths to absolute
-            if config.skill_sequence_config[i].get('image_path'):
-                image_path = self.convert_to_absolute_path(config.skill_sequence_config[i]['image_path'])
-                if image_path and os.path.exists(image_path):
-                    # load_skill_sequence_image will convert to relative and store in config
-                    self.load_skill_sequence_image(i, image_path)
-                else:
-                    print(f"Skill Sequence {i+1} image path not found: {config.skill_sequence_config[i]['image_path']}")
-                    config.skill_sequence_config[i]['image_path'] = None
-                    self.skill_sequence_state[i]['image_path'] = None
-        
-        # Configure skill sequence frame grid
-        skill_sequence_frame.columnconfigure(0, weight=1)
-        skill_sequence_frame.columnconfigure(1, weight=1)
+        self.skill_vars = {}
+        self.skill_intervals = {}
+        self.skill_checkboxes = {}
+        self.skill_entries = {}
+        # Skill interval slots must exist in config before their tab is built
+        config.skill_slots.update({
+            slot: {'enabled': False, 'interval': 1, 'last_used': 0}
+            for slot, _, _, _ in _NUMERIC_SLOT_SPECS + _FUNCTION_SLOT_SPECS
+            if slot not in config.skill_slots
+        })
         
         # Initialize skill sequence manager
-        import skill_sequence_manager
         config.skill_sequence_manager = skill_sequence_manager.SkillSequenceManager(num_skills=8)
         config.skill_sequence_manager.set_ui_reference(self)
         
-        # Skill slots frame - moved to Skill Interval tab (wrap in scrollable frame)
-        skill_scroll = ctk.CTkScrollableFrame(skills_tab)
-        skill_scroll.pack(fill="both", expand=True)
-        skill_frame = skill_scroll
-        
-        # Create skill slot controls in a grid
-        self.skill_vars = {}
-        self.skill_intervals = {}
-        
-        # Helper function to create a slot control
-        def create_slot_control(parent, slot, row, col):
-            """Helper function to create a skill slot control"""
-            # Initialize slot if it doesn't exist
-            if slot not in config.skill_slots:
-                config.skill_slots[slot] = {'enabled': False, 'interval': 1, 'last_used': 0}
-            
-            # Create frame for each slot
-            slot_frame = ctk.CTkFrame(parent, fg_color="transparent")
-            padx_left = 15 if col == 0 else 5
-            padx_right = 5 if col == 0 else 15
-            slot_frame.grid(row=row, column=col, sticky="ew", padx=(padx_left, padx_right), pady=2)
-            
-            # Checkbox
-            self.skill_vars[slot] = tk.BooleanVar(value=config.skill_slots[slot]['enabled'])
-            checkbox = ctk.CTkCheckBox(slot_frame, variable=self.skill_vars[slot], 
-                                     command=lambda s=slot: self.update_skill_slot(s),
-                                     text="", width=20)
-            checkbox.grid(row=0, column=0, padx=(0, 5))
-            
-            # Slot label
-            slot_label_text = f"S{slot}" if isinstance(slot, int) else slot.upper()
-            slot_label = ctk.CTkLabel(slot_frame, text=slot_label_text, font=ctk.CTkFont(size=11), width=40)
-            slot_label.grid(row=0, column=1, padx=(0, 5))
-            
-            # Interval input
-            self.skill_intervals[slot] = tk.StringVar(value=str(config.skill_slots[slot]['interval']))
-            interval_entry = ctk.CTkEntry(slot_frame, textvariable=self.skill_intervals[slot], width=60, font=ctk.CTkFont(size=11))
-            interval_entry.grid(row=0, column=2, padx=(0, 5))
-            interval_entry.bind('<KeyRelease>', lambda event, s=slot: self.update_skill_interval(s))
-            interval_entry.bind('<FocusOut>', lambda event, s=slot: self.update_skill_interval(s))
-            # Seconds label
-            seconds_label = ctk.CTkLabel(slot_frame, text="s", font=ctk.CTkFont(size=11))
-            seconds_label.grid(row=0, column=3, sticky="w")
-            # Tooltip for skill interval
-            slot_name = f"S{slot}" if isinstance(slot, int) else slot.upper()
-            create_tooltip(interval_entry, f"Input: {slot_name} cooldown interval in seconds. Enter the minimum time (in seconds) that must pass before this skill can be used again. Skill will only trigger if this cooldown has elapsed since last use. Example: 10 means skill can be used every 10 seconds.")
-        
-        # Section 1: Numeric slots (1-9, 0) - 5 rows x 2 columns
-        numeric_label = ctk.CTkLabel(skill_frame, text="Number Keys (1-9, 0):", font=ctk.CTkFont(size=12, weight="bold"))
-        numeric_label.grid(row=0, column=0, columnspan=2, sticky="w", padx=15, pady=(15, 10))
-        
-        # Numeric slots layout: 5 rows x 2 columns
-        numeric_row = 1
-        # First create slots 1-9
-        for i in range(1, 10):
-            if i <= 5:
-                # First column: slots 1-5
-                row = numeric_row + (i - 1)
-                col = 0
-            else:
-                # Second column: slots 6-9
-                row = numeric_row + (i - 6)
-                col = 1
-            create_slot_control(skill_frame, i, row, col)
-        
-        # Then add slot 0 after 9 (in the second column, last row)
-        create_slot_control(skill_frame, 0, numeric_row + 4, 1)
-        
-        # Separator between numeric and function key sections
-        separator_row = numeric_row + 5
-        separator = ctk.CTkFrame(skill_frame, height=2, fg_color="gray50")
-        separator.grid(row=separator_row, column=0, columnspan=2, sticky="ew", padx=15, pady=15)
-        
-        # Section 2: Function key slots (F1-F10) - 5 rows x 2 columns
-        function_label = ctk.CTkLabel(skill_frame, text="Function Keys (F1-F10):", font=ctk.CTkFont(size=12, weight="bold"))
-        function_label.grid(row=separator_row + 1, column=0, columnspan=2, sticky="w", padx=15, pady=(5, 10))
-        
-        # Function key slots layout: 5 rows x 2 columns
-        function_row = separator_row + 2
-        for i in range(1, 11):
-            f_key = f'f{i}'
-            if i <= 5:
-                # First column: F1-F5
-                row = function_row + (i - 1)
-                col = 0
-            else:
-                # Second column: F6-F10
-                row = function_row + (i - 6)
-                col = 1
-            create_slot_control(skill_frame, f_key, row, col)
-        
-        # Configure skill frame grid
-        skill_frame.columnconfigure(0, weight=1)
-        skill_frame.columnconfigure(1, weight=1)
-        
-        # Buffs frame - moved to Buffs tab
-        # Wrap buffs tab in scrollable frame
-        buffs_scroll = ctk.CTkScrollableFrame(buffs_tab)
-        buffs_scroll.pack(fill="both", expand=True)
-        buffs_frame = buffs_scroll
-        
-        # Info section for Buffs
-        buffs_info_frame = ctk.CTkFrame(buffs_frame, corner_radius=6, fg_color=("gray18", "gray14"), 
-                                        border_width=1, border_color="gray25")
-        buffs_info_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=10, pady=(10, 15))
-        buffs_info_frame.columnconfigure(0, weight=1)
-        
-        buffs_info_title = ctk.CTkLabel(buffs_info_frame, text="How to use:", 
-                                        font=ctk.CTkFont(size=12, weight="bold"))
-        buffs_info_title.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
-        
-        buffs_info_text = ctk.CTkLabel(buffs_info_frame, 
-                                      text="1. Click the skill image to select a buff skill\n"
-                                           "2. Enable the checkbox to activate the buff\n"
-                                           "3. Important: Place buff icons above the system message for detection",
-                                      font=ctk.CTkFont(size=12),
-                                      justify="left", anchor="w")
-        buffs_info_text.grid(row=1, column=0, sticky="w", padx=10, pady=(0, 10))
-        
-        # Initialize buffs variables
-        self.buffs_vars = {}
-        self.buffs_canvases = []
-        self.buffs_state = []
-        
-        # Create buff slots in a compact grid (2 columns, 4 rows)
-        for i in range(8):
-            if i < 4:
-                # First column: slots 1-4
-                row = i + 1  # +1 because buffs_info_frame is at row 0
-                col = 0
-            else:
-                # Second column: slots 5-8
-                row = i - 3  # -3 because buffs_info_frame is at row 0, and we want slots 5-8 to start at row 2
-                col = 1
-            
-            # Create compact frame for each buff slot (horizontal layout)
-            buff_slot_frame = ctk.CTkFrame(buffs_frame, corner_radius=6, fg_color=("gray18", "gray14"))
-            padx_left = 10 if col == 0 else 5
-            padx_right = 5 if col == 0 else 10
-            buff_slot_frame.grid(row=row, column=col, sticky="ew", padx=(padx_left, padx_right), pady=3)
-            buff_slot_frame.columnconfigure(3, weight=1)
-            
-            # Enable checkbox (no text, just the box)
-            self.buffs_vars[i] = tk.BooleanVar(value=config.buffs_config[i]['enabled'])
-            checkbox = ctk.CTkCheckBox(buff_slot_frame, text="", 
-                                      variable=self.buffs_vars[i],
-                                      command=lambda idx=i: self.update_buff_enabled(idx),
-                                      font=ctk.CTkFont(size=10), width=20)
-            checkbox.grid(row=0, column=0, padx=(8, 5), pady=6, sticky="w")
-            
-            # Label for slot info
-            slot_label = ctk.CTkLabel(buff_slot_frame, text=f"Buff {i+1}", 
-                                     font=ctk.CTkFont(size=11, weight="bold"), width=60)
-            slot_label.grid(row=0, column=1, padx=(0, 5), pady=6, sticky="w")
-            
-            # Skill image canvas (clickable to select skill) - smaller size
-            canvas = tk.Canvas(buff_slot_frame, width=40, height=40, bg='gray20', 
-                             highlightthickness=1, highlightbackground='gray50', cursor='hand2')
-            canvas.grid(row=0, column=2, padx=5, pady=6)
-            canvas.bind('<Button-1>', lambda e, idx=i: self.show_buff_skill_selector(idx))
-            canvas.bind('<Button-3>', lambda e, idx=i: self.clear_buff_skill(idx))
-            self.buffs_canvases.append(canvas)
-            
-            # Initialize buff state
-            self.buffs_state.append({
-                'image_path': config.buffs_config[i]['image_path'],
-                'enabled': config.buffs_config[i]['enabled']
-            })
-            
-            # Load buff image if exists - convert relative paths to absolute
-            if config.buffs_config[i]['image_path']:
-                image_path = self.convert_to_absolute_path(config.buffs_config[i]['image_path'])
-                if image_path and os.path.exists(image_path):
-                    # load_buff_image will convert to relative and store in config
-                    self.load_buff_image(i, image_path)
-                else:
-                    print(f"Buff {i+1} image path not found: {config.buffs_config[i]['image_path']}")
-                    config.buffs_config[i]['image_path'] = None
-                    self.buffs_state[i]['image_path'] = None
-        
-        # Configure buffs frame grid
-        buffs_frame.columnconfigure(0, weight=1)
-        buffs_frame.columnconfigure(1, weight=1)
-        
-        # Initialize buffs manager
-        import buffs_manager
-        config.buffs_manager = buffs_manager.BuffsManager(num_buffs=8)
-        config.buffs_manager.set_ui_reference(self)
-        
-        # Mouse Clicker frame - moved to Mouse Clicker tab
-        # Wrap mouse clicker tab in scrollable frame
-        mouse_clicker_scroll = ctk.CTkScrollableFrame(mouse_clicker_tab)
-        mouse_clicker_scroll.pack(fill="both", expand=True)
-        mouse_clicker_frame = mouse_clicker_scroll
-        
-        # First row: Checkbox and Interval
-        row1_frame = ctk.CTkFrame(mouse_clicker_frame, fg_color="transparent")
-        row1_frame.grid(row=0, column=0, sticky="ew", padx=15, pady=(15, 10))
-        
-        # Mouse clicker checkbox
-        self.mouse_clicker_var = tk.BooleanVar(value=config.mouse_clicker_enabled)
-        mouse_clicker_checkbox = ctk.CTkCheckBox(row1_frame, text="Enable", 
-                                                 variable=self.mouse_clicker_var,
-                                                 command=self.update_mouse_clicker,
-                                                 font=ctk.CTkFont(size=11))
-        mouse_clicker_checkbox.grid(row=0, column=0, sticky="w", padx=(0, 10))
-        
-        # Interval input
-        self.mouse_clicker_interval_var = tk.StringVar(value=str(config.mouse_clicker_interval))
-        mouse_clicker_interval_entry = ctk.CTkEntry(row1_frame, textvariable=self.mouse_clicker_interval_var, width=80, font=ctk.CTkFont(size=11))
-        mouse_clicker_interval_entry.grid(row=0, column=1, padx=(0, 0))
-        mouse_clicker_interval_entry.bind('<KeyRelease>', lambda event: self.update_mouse_clicker_interval())
-        mouse_clicker_interval_entry.bind('<FocusOut>', lambda event: self.update_mouse_clicker_interval())
-        
-        # Second row: Mode selection and coordinates
-        row2_frame = ctk.CTkFrame(mouse_clicker_frame, fg_color="transparent")
-        row2_frame.grid(row=1, column=0, sticky="ew", padx=15, pady=(0, 15))
-        
-        # Click mode selection (cursor position or specific coords)
-        ctk.CTkLabel(row2_frame, text="Mode:", font=ctk.CTkFont(size=11)).grid(row=0, column=0, padx=(0, 10), sticky="w")
-        self.mouse_clicker_mode_var = tk.StringVar(value="cursor" if config.mouse_clicker_use_cursor else "coords")
-        mouse_clicker_mode_frame = ctk.CTkFrame(row2_frame, fg_color="transparent")
-        mouse_clicker_mode_frame.grid(row=0, column=1, padx=(0, 10), sticky="w")
+        # Buffs tab variables; the slots themselves are built with the tab
+        self.buffs_vars = {}
+        self.buffs_canvases = []
+        self.buffs_state = []
+        config.update_buffs_configured()
         
-        ctk.CTkRadioButton(mouse_clicker_mode_frame, text="Cursor", variable=self.mouse_clicker_mode_var, 
-                       value="cursor", command=self.update_mouse_clicker_mode, font=ctk.CTkFont(size=11)).grid(row=0, column=0, padx=(0, 10))
-        ctk.CTkRadioButton(mouse_clicker_mode_frame, text="Coords", variable=self.mouse_clicker_mode_var, 
-                       value="coords", command=self.update_mouse_clicker_mode, font=ctk.CTkFont(size=11)).grid(row=0, column=1)
+        # Initialize buffs manager
+        config.buffs_manager = buffs_manager.BuffsManager(num_buffs=8)
+        config.buffs_manager.set_ui_reference(self)
         
-        # Coordinate input (only visible when coords mode is selected)
+        # Mouse clicker variables (read by Load/Save Settings before the tab is built)
+        self.mouse_clicker_var = tk.BooleanVar(value=config.mouse_clicker_enabled)
+        self.mouse_clicker_interval_var = tk.StringVar(value=str(config.mouse_clicker_interval))
+        self.mouse_clicker_mode_var = tk.StringVar(value="cursor" if config.mouse_clicker_use_cursor else "coords")
         # Hidden variables for coordinates (only used internally)
         self.mouse_clicker_x_var = tk.StringVar(value=str(config.mouse_clicker_coords['x']))
         self.mouse_clicker_y_var = tk.StringVar(value=str(config.mouse_clicker_coords['y']))
+        self.mouse_clicker_coords_frame = None  # Created with the tab
         
-        # Coordinate picker frame (only visible when coords mode is selected)
-        self.mouse_clicker_coords_frame = ctk.CTkFrame(row2_frame, fg_color="transparent")
-        self.mouse_clicker_coords_frame.grid(row=0, column=2, sticky="w")
-        
-        # Coordinate picker button
-        mouse_clicker_picker_btn = ctk.CTkButton(self.mouse_clicker_coords_frame, text="...", command=self.pick_mouse_clicker_coordinates, width=30, corner_radius=6)
-        mouse_clicker_picker_btn.grid(row=0, column=0, padx=(0, 0))
-        
-        # Initially hide/show coords frame based on mode
-        self.update_mouse_clicker_mode()
-        
-        # Configure mouse clicker frame
-        mouse_clicker_frame.columnconfigure(0, weight=1)
-        
+        # All eagerly built tabs (and their status widgets) now exist
+        self._gui_ready = True
         
         # Load initial window list
         self.refresh_windows()
@@ -1940,13 +1712,19 @@ class BotGUI:
         # Update Start/Stop button state based on calibration
         self.update_toggle_bot_button_state()
         
+    def _update_window_titles(self, windows):
+        """Show the titles of windows in the dropdown, skipping the reconfigure when unchanged"""
+        window_titles = tuple(title for hwnd, title in windows)
+        if window_titles != self._window_titles:
+            self._window_titles = window_titles
+            # CTkComboBox uses configure() method to update values
+            self.window_combo.configure(values=list(window_titles))
+        return window_titles
+    
     def refresh_windows(self):
         """Refresh the list of open windows"""
         try:
-            windows = window_utils.get_open_windows()
-            window_titles = [title for hwnd, title in windows]
-            # CTkComboBox uses configure() method to update values
-            self.window_combo.configure(values=window_titles)
+            window_titles = self._update_window_titles(window_utils.get_open_windows())
             
             # Select first window if available
             if window_titles:
@@ -1962,10 +1740,7 @@ class BotGUI:
     def refresh_windows_with_selection(self, target_window_name):
         """Refresh the list of open windows and select a specific window"""
         try:
-            windows = window_utils.get_open_windows()
-            window_titles = [title for hwnd, title in windows]
-            # CTkComboBox uses configure() method to update values
-            self.window_combo.configure(values=window_titles)
+            window_titles = self._update_window_titles(window_utils.get_open_windows())
             
             # Try to select the target window
             if target_window_name in window_titles:
@@ -2126,18 +1901,6 @@ class BotGUI:
                     # Update GUI with calibrated values
                     def update_gui():
                         try:
-                            self.hp_x_var.set(str(config.hp_bar_area['x']))
-                            self.hp_y_var.set(str(config.hp_bar_area['y']))
-                            self.hp_width_var.set(str(config.hp_bar_area['width']))
-                            self.hp_height_var.set(str(config.hp_bar_area['height']))
-                            self.hp_coords_var.set(f"{config.hp_bar_area['x']},{config.hp_bar_area['y']}")
-                            
-                            self.mp_x_var.set(str(config.mp_bar_area['x']))
-                            self.mp_y_var.set(str(config.mp_bar_area['y']))
-                            self.mp_width_var.set(str(config.mp_bar_area['width']))
-                            self.mp_height_var.set(str(config.mp_bar_area['height']))
-                            self.mp_coords_var.set(f"{config.mp_bar_area['x']},{config.mp_bar_area['y']}")
-                            
                             self.calibrate_button.configure(state="normal", text="Calibrate")
                             # Enable record button if calibration successful
                             if hasattr(self, 'record_target_btn'):
@@ -2171,7 +1934,6 @@ class BotGUI:
                     
             except Exception as e:
                 print(f"[Calibration] Error during calibration: {e}")
-                import traceback
                 traceback.print_exc()
                 
                 def show_error():
@@ -2202,11 +1964,14 @@ class BotGUI:
             debug_utils.debug_print("Debug mode ENABLED - all debug messages will be shown here", "DebugSystem")
         else:
             self.debug_button.configure(text="Debug Mode: OFF", fg_color=("gray70", "gray30"))
-            if hasattr(self, 'debug_window') and self.debug_window:
-                try:
-                    self.debug_window.destroy()
-                except:
-                    pass
+            self._hide_debug_window()
+    
+    def _hide_debug_window(self):
+        """Hide the debug window; it is kept so reopening does not rebuild it"""
+        if hasattr(self, 'debug_window') and self.debug_window:
+            try:
+                self.debug_window.withdraw()
+            except tk.TclError:
                 self.debug_window = None
     
     def show_debug_window(self):
@@ -2215,14 +1980,14 @@ class BotGUI:
         window_exists = False
         if hasattr(self, 'debug_window') and self.debug_window is not None:
             try:
-                self.debug_window.winfo_exists()
-                window_exists = True
-            except:
+                window_exists = bool(self.debug_window.winfo_exists())
+            except tk.TclError:
                 window_exists = False
         
         if not window_exists:
             self.debug_window = ctk.CTkToplevel(self.root)
             self.debug_window.title("Debug Window - All Module Messages")
+            self._apply_icon(self.debug_window)
             self.debug_window.geometry("800x500")
             self.debug_window.resizable(True, True)
             
@@ -2275,34 +2040,46 @@ class BotGUI:
             # Handle window close
             self.debug_window.protocol("WM_DELETE_WINDOW", self.close_debug_window)
         else:
-            # Bring existing window to front
+            # Show the hidden window again and bring it to front
+            self.debug_window.deiconify()
             self.debug_window.lift()
             self.debug_window.focus()
     
     def add_debug_message(self, message):
-        """Add a debug message to the debug window (thread-safe)"""
-        # Schedule update in main thread to avoid threading issues
+        """Add a debug message to the debug window (thread-safe)
+        
+        Messages are buffered and written by one flush per GUI tick, so a burst
+        from the bot threads costs a single insert instead of one per message.
+        """
         if hasattr(self, 'root') and self.root:
-            self.root.after(0, lambda: self._add_debug_message_sync(message))
+            self._debug_messages.append(f"[{time.strftime('%H:%M:%S')}] {message}\n")
+            config.safe_update_gui(self._flush_debug_messages, dedup_key='debug_messages')
         else:
             # Fallback if root doesn't exist
             print(f"[Click Debug] {message}")
     
-    def _add_debug_message_sync(self, message):
-        """Internal method to add debug message (must be called from main thread)"""
+    def _flush_debug_messages(self):
+        """Write all buffered debug messages to the debug window (must be called from main thread)"""
+        batch = []
+        while self._debug_messages:
+            batch.append(self._debug_messages.popleft())
+        if batch:
+            self._add_debug_message_sync("".join(batch))
+    
+    def _add_debug_message_sync(self, formatted_messages):
+        """Internal method to add formatted debug lines (must be called from main thread)"""
         if hasattr(self, 'debug_text') and self.debug_text:
             try:
-                timestamp = time.strftime("%H:%M:%S")
-                formatted_message = f"[{timestamp}] {message}\n"
-                self.debug_text.insert(tk.END, formatted_message)
+                self.debug_text.insert(tk.END, formatted_messages)
                 self.debug_text.see(tk.END)  # Auto-scroll to bottom
-                # Limit to last 1000 lines to prevent memory issues
-                lines = self.debug_text.get("1.0", tk.END).split('\n')
-                if len(lines) > 1000:
-                    self.debug_text.delete("1.0", f"{len(lines) - 1000}.0")
+                # Limit to last 1000 lines to prevent memory issues; the line
+                # count comes from the end index, without copying the text out
+                line_count = int(self.debug_text.index("end-1c").split('.')[0])
+                if line_count > 1000:
+                    self.debug_text.delete("1.0", f"{line_count - 1000}.0")
             except Exception as e:
                 # Fallback to print if text widget fails
-                print(f"[Click Debug] {message}")
+                print(f"[Click Debug] {formatted_messages}", end="")
     
     def clear_debug_messages(self):
         """Clear all debug messages from the window"""
@@ -2311,12 +2088,7 @@ class BotGUI:
     
     def close_debug_window(self):
         """Close the debug window and disable debug mode"""
-        if hasattr(self, 'debug_window') and self.debug_window:
-            try:
-                self.debug_window.destroy()
-            except:
-                pass
-            self.debug_window = None
+        self._hide_debug_window()
         # Disable debug mode
         debug_utils.set_debug_enabled(False, callback=None)
         self.debug_var.set(False)
@@ -2338,11 +2110,14 @@ class BotGUI:
             config.bot_thread = threading.Thread(target=bot_logic.bot_loop, daemon=True)
             config.bot_thread.start()
             
+            config.buff_thread = threading.Thread(target=bot_logic.buff_loop, daemon=True)
+            config.buff_thread.start()
+            
             # Update button to show Stop state
             self.toggle_bot_button.configure(text="Stop", command=self.toggle_bot, fg_color="red", hover_color="darkred")
             self.status_label.configure(text="Status: Running")
             
-            # Start periodic status updates
+            # Show status immediately; _tick keeps it refreshed while running
             self.update_status()
         else:
             print("Bot is already running")
@@ -2358,6 +2133,299 @@ class BotGUI:
         self.status_label.configure(text="Status: Stopped")
         # Keep connection status - don't reset to "Not Connected"
     
+    def _on_tab_changed(self):
+        """Build a deferred tab the first time it is selected"""
+        builder = self._tab_builders.pop(self.tabview.get(), None)
+        if builder:
+            builder()
+    
+    def _build_buffs_tab(self, buffs_tab):
+        """Build the Buffs tab contents"""
+        fonts = _fonts()
+        # Wrap buffs tab in scrollable frame
+        buffs_scroll = ctk.CTkScrollableFrame(buffs_tab)
+        buffs_scroll.pack(fill="both", expand=True)
+        buffs_frame = buffs_scroll
+        
+        # Info section for Buffs
+        buffs_info_frame = ctk.CTkFrame(buffs_frame, corner_radius=6, fg_color=("gray18", "gray14"), 
+                                        border_width=1, border_color="gray25")
+        buffs_info_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=10, pady=(10, 15))
+        buffs_info_frame.columnconfigure(0, weight=1)
+        
+        buffs_info_title = ctk.CTkLabel(buffs_info_frame, text="How to use:", 
+                                        font=fonts['label'])
+        buffs_info_title.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
+        
+        buffs_info_text = ctk.CTkLabel(buffs_info_frame, 
+                                      text="1. Click the skill image to select a buff skill\n"
+                                           "2. Enable the checkbox to activate the buff\n"
+                                           "3. Important: Place buff icons above the system message for detection",
+                                      font=fonts['body'],
+                                      justify="left", anchor="w")
+        buffs_info_text.grid(row=1, column=0, sticky="w", padx=10, pady=(0, 10))
+        
+        # Check all buff image files up front, one listing per job folder
+        self._prime_resolved_paths([buff['image_path'] for buff in config.buffs_config.values()])
+        
+        # Create buff slots in a compact grid (2 columns, 4 rows)
+        for i, (row, col) in enumerate(_SLOT_CARD_GRID):
+            
+            # Create compact frame for each buff slot (horizontal layout)
+            buff_slot_frame = ctk.CTkFrame(buffs_frame, corner_radius=6, fg_color=("gray18", "gray14"))
+            buff_slot_frame.grid(row=row, column=col, sticky="ew", padx=_SLOT_CARD_PADX[col], pady=3)
+            buff_slot_frame.columnconfigure(3, weight=1)
+            
+            # Enable checkbox (no text, just the box)
+            self.buffs_vars[i] = tk.BooleanVar(value=config.buffs_config[i]['enabled'])
+            checkbox = ctk.CTkCheckBox(buff_slot_frame, text="", 
+                                      variable=self.buffs_vars[i],
+                                      command=partial(self.update_buff_enabled, i),
+                                      font=fonts['tiny'], width=20)
+            checkbox.grid(row=0, column=0, padx=(8, 5), pady=6, sticky="w")
+            
+            # Label for slot info
+            slot_label = ctk.CTkLabel(buff_slot_frame, text=f"Buff {i+1}", 
+                                     font=fonts['small_bold'], width=60)
+            slot_label.grid(row=0, column=1, padx=(0, 5), pady=6, sticky="w")
+            
+            # Skill image canvas (clickable to select skill) - smaller size
+            canvas = tk.Canvas(buff_slot_frame, width=40, height=40, bg='gray20', 
+                             highlightthickness=1, highlightbackground='gray50', cursor='hand2')
+            canvas.grid(row=0, column=2, padx=5, pady=6)
+            canvas.bind('<Button-1>', self._on_buff_canvas_click)
+            canvas.bind('<Button-3>', self._on_buff_canvas_clear)
+            self.buffs_canvases.append(canvas)
+            
+            # Initialize buff state
+            buff = config.buffs_config[i]
+            relative_path = buff['image_path']
+            self.buffs_state.append({
+                'image_path': relative_path,
+                'enabled': buff['enabled']
+            })
+            
+            # Load buff image if exists - convert relative paths to absolute
+            if relative_path:
+                image_path = self.convert_to_absolute_path(relative_path)
+                if image_path:  # None when the file is missing
+                    # Decoded on the worker pool; load_buff_image then converts to relative and stores in config
+                    self._load_slot_image_async(self.load_buff_image, self.clear_buff_skill, i, image_path)
+                else:
+                    print(f"Buff {i+1} image path not found: {relative_path}")
+                    buff['image_path'] = None
+                    self.buffs_state[i]['image_path'] = None
+        config.update_buffs_configured()
+        
+        # Configure buffs frame grid
+        buffs_frame.columnconfigure(0, weight=1)
+        buffs_frame.columnconfigure(1, weight=1)
+    
+    def _build_mouse_clicker_tab(self, mouse_clicker_tab):
+        """Build the Mouse Clicker tab contents"""
+        fonts = _fonts()
+        # Wrap mouse clicker tab in scrollable frame
+        mouse_clicker_scroll = ctk.CTkScrollableFrame(mouse_clicker_tab)
+        mouse_clicker_scroll.pack(fill="both", expand=True)
+        mouse_clicker_frame = mouse_clicker_scroll
+        
+        # First row: Checkbox and Interval
+        row1_frame = ctk.CTkFrame(mouse_clicker_frame, fg_color="transparent")
+        row1_frame.grid(row=0, column=0, sticky="ew", padx=15, pady=(15, 10))
+        
+        # Mouse clicker checkbox
+        mouse_clicker_checkbox = self._make_checkbox(row1_frame, "Enable", self.mouse_clicker_var, self.update_mouse_clicker)
+        mouse_clicker_checkbox.grid(row=0, column=0, sticky="w", padx=(0, 10))
+        
+        # Interval input
+        mouse_clicker_interval_entry = ctk.CTkEntry(row1_frame, textvariable=self.mouse_clicker_interval_var, width=80, font=fonts['small'])
+        mouse_clicker_interval_entry.grid(row=0, column=1, padx=(0, 0))
+        mouse_clicker_interval_entry.bind('<KeyRelease>', lambda event: self._debounce('mouse_clicker', self.update_mouse_clicker_interval))
+        mouse_clicker_interval_entry.bind('<FocusOut>', lambda event: self._flush_debounce('mouse_clicker', self.update_mouse_clicker_interval))
+        
+        # Second row: Mode selection and coordinates
+        row2_frame = ctk.CTkFrame(mouse_clicker_frame, fg_color="transparent")
+        row2_frame.grid(row=1, column=0, sticky="ew", padx=15, pady=(0, 15))
+        
+        # Click mode selection (cursor position or specific coords)
+        ctk.CTkLabel(row2_frame, text="Mode:", font=fonts['small']).grid(row=0, column=0, padx=(0, 10), sticky="w")
+        mouse_clicker_mode_frame = ctk.CTkFrame(row2_frame, fg_color="transparent")
+        mouse_clicker_mode_frame.grid(row=0, column=1, padx=(0, 10), sticky="w")
+        
+        ctk.CTkRadioButton(mouse_clicker_mode_frame, text="Cursor", variable=self.mouse_clicker_mode_var, 
+                       value="cursor", command=self.update_mouse_clicker_mode, font=fonts['small']).grid(row=0, column=0, padx=(0, 10))
+        ctk.CTkRadioButton(mouse_clicker_mode_frame, text="Coords", variable=self.mouse_clicker_mode_var, 
+                       value="coords", command=self.update_mouse_clicker_mode, font=fonts['small']).grid(row=0, column=1)
+        
+        # Coordinate picker frame (only visible when coords mode is selected)
+        self.mouse_clicker_coords_frame = ctk.CTkFrame(row2_frame, fg_color="transparent")
+        self.mouse_clicker_coords_frame.grid(row=0, column=2, sticky="w")
+        
+        # Coordinate picker button
+        mouse_clicker_picker_btn = ctk.CTkButton(self.mouse_clicker_coords_frame, text="...", command=self.pick_mouse_clicker_coordinates, width=30, corner_radius=6)
+        mouse_clicker_picker_btn.grid(row=0, column=0, padx=(0, 0))
+        
+        # Initially hide/show coords frame based on mode
+        self.update_mouse_clicker_mode()
+        
+        # Configure mouse clicker frame
+        mouse_clicker_frame.columnconfigure(0, weight=1)
+    
+    def _build_skill_sequence_tab(self, skill_sequence_tab):
+        """Build the Skill Sequence tab contents"""
+        fonts = _fonts()
+        # Wrap skill sequence tab in scrollable frame
+        skill_sequence_scroll = ctk.CTkScrollableFrame(skill_sequence_tab)
+        skill_sequence_scroll.pack(fill="both", expand=True)
+        skill_sequence_frame = skill_sequence_scroll
+        
+        # Info section for Skill Sequence
+        info_frame = ctk.CTkFrame(skill_sequence_frame, corner_radius=6, fg_color=("gray18", "gray14"), 
+                                 border_width=1, border_color="gray25")
+        info_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=10, pady=(10, 15))
+        info_frame.columnconfigure(0, weight=1)
+        
+        info_title = ctk.CTkLabel(info_frame, text="How to use:", 
+                                  font=fonts['label'])
+        info_title.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
+        
+        info_text = ctk.CTkLabel(info_frame, 
+                                text="1. Click the skill image to select a skill\n"
+                                     "2. Enable the checkbox to activate the skill\n"
+                                     "3. Skills execute automatically in sequence when enemy is found",
+                                font=fonts['body'],
+                                justify="left", anchor="w")
+        info_text.grid(row=1, column=0, sticky="w", padx=10, pady=(0, 10))
+        
+        # Check all skill image files up front, one listing per job folder
+        self._prime_resolved_paths([skill.get('image_path') for skill in config.skill_sequence_config.values()])
+        
+        # Create skill sequence slots in a compact grid (2 columns, 4 rows)
+        for i, (row, col) in enumerate(_SLOT_CARD_GRID):
+            
+            # Create compact frame for each skill sequence slot (horizontal layout)
+            skill_slot_frame = ctk.CTkFrame(skill_sequence_frame, corner_radius=6, fg_color=("gray18", "gray14"))
+            skill_slot_frame.grid(row=row, column=col, sticky="ew", padx=_SLOT_CARD_PADX[col], pady=3)
+            skill_slot_frame.columnconfigure(3, weight=1)
+            
+            # Enable checkbox (no text, just the box)
+            self.skill_sequence_vars[i] = tk.BooleanVar(value=config.skill_sequence_config[i]['enabled'])
+            checkbox = ctk.CTkCheckBox(skill_slot_frame, text="", 
+                                      variable=self.skill_sequence_vars[i],
+                                      command=partial(self.update_skill_sequence_enabled, i),
+                                      font=fonts['tiny'], width=20)
+            checkbox.grid(row=0, column=0, padx=(8, 5), pady=6, sticky="w")
+            
+            # Label for slot info
+            slot_label = ctk.CTkLabel(skill_slot_frame, text=f"Skill {i+1}", 
+                                     font=fonts['small_bold'], width=60)
+            slot_label.grid(row=0, column=1, padx=(0, 5), pady=6, sticky="w")
+            
+            # Skill image canvas (clickable to select skill) - smaller size
+            canvas = tk.Canvas(skill_slot_frame, width=40, height=40, bg='gray20', 
+                             highlightthickness=1, highlightbackground='gray50', cursor='hand2')
+            canvas.grid(row=0, column=2, padx=5, pady=6)
+            canvas.bind('<Button-1>', self._on_skill_sequence_canvas_click)
+            canvas.bind('<Button-3>', self._on_skill_sequence_canvas_clear)
+            self.skill_sequence_canvases.append(canvas)
+            
+            # Initialize skill sequence state
+            skill = config.skill_sequence_config[i]
+            relative_path = skill.get('image_path')
+            self.skill_sequence_state.append({
+                'image_path': relative_path,
+                'enabled': skill['enabled']
+            })
+            
+            # Load skill image if exists - convert relative paths to absolute
+            if relative_path:
+                image_path = self.convert_to_absolute_path(relative_path)
+                if image_path:  # None when the file is missing
+                    # Decoded on the worker pool; load_skill_sequence_image then converts to relative and stores in config
+                    self._load_slot_image_async(self.load_skill_sequence_image, self.clear_skill_sequence_skill, i, image_path)
+                else:
+                    print(f"Skill Sequence {i+1} image path not found: {relative_path}")
+                    skill['image_path'] = None
+                    self.skill_sequence_state[i]['image_path'] = None
+        
+        # Configure skill sequence frame grid
+        skill_sequence_frame.columnconfigure(0, weight=1)
+        skill_sequence_frame.columnconfigure(1, weight=1)
+    
+    def _build_skills_tab(self, skills_tab):
+        """Build the Skill Interval tab contents"""
+        fonts = _fonts()
+        # Wrap skill interval tab in scrollable frame
+        skill_scroll = ctk.CTkScrollableFrame(skills_tab)
+        skill_scroll.pack(fill="both", expand=True)
+        skill_frame = skill_scroll
+        
+        # Helper function to create a slot control
+        def create_slot_control(parent, slot, row, col, label):
+            """Helper function to create a skill slot control"""
+            slot_config = config.skill_slots[slot]
+            
+            # Create frame for each slot
+            slot_frame = ctk.CTkFrame(parent, fg_color="transparent")
+            slot_frame.grid(row=row, column=col, sticky="ew", padx=_SKILL_SLOT_PADX[col], pady=2)
+            
+            # Checkbox
+            enabled_var = tk.BooleanVar(value=slot_config['enabled'])
+            self.skill_vars[slot] = enabled_var
+            checkbox = ctk.CTkCheckBox(slot_frame, variable=enabled_var, 
+                                     command=partial(self.update_skill_slot, slot),
+                                     text="", width=20)
+            checkbox.grid(row=0, column=0, padx=(0, 5))
+            self.skill_checkboxes[slot] = checkbox
+            
+            # Slot label
+            slot_label = ctk.CTkLabel(slot_frame, text=label, font=slot_font, width=40)
+            slot_label.grid(row=0, column=1, padx=(0, 5))
+            
+            # Interval input
+            interval_var = tk.StringVar(value=str(slot_config['interval']))
+            self.skill_intervals[slot] = interval_var
+            interval_entry = ctk.CTkEntry(slot_frame, textvariable=interval_var, width=60, font=slot_font)
+            interval_entry.grid(row=0, column=2, padx=(0, 5))
+            update_interval = partial(self.update_skill_interval, slot)
+            interval_entry.bind('<KeyRelease>', lambda event, s=slot, u=update_interval: self._debounce(('skill_interval', s), u))
+            interval_entry.bind('<FocusOut>', lambda event, s=slot, u=update_interval: self._flush_debounce(('skill_interval', s), u))
+            self.skill_entries[slot] = interval_entry
+            # Seconds label
+            seconds_label = ctk.CTkLabel(slot_frame, text="s", font=slot_font)
+            seconds_label.grid(row=0, column=3, sticky="w")
+            # Tooltip for skill interval
+            create_tooltip(interval_entry, f"Input: {label} cooldown interval in seconds. Enter the minimum time (in seconds) that must pass before this skill can be used again. Skill will only trigger if this cooldown has elapsed since last use. Example: 10 means skill can be used every 10 seconds.")
+        
+        slot_font = fonts['small']
+        
+        # Section 1: Numeric slots (1-9, 0) - 5 rows x 2 columns
+        numeric_label = ctk.CTkLabel(skill_frame, text="Number Keys (1-9, 0):", font=fonts['label'])
+        numeric_label.grid(row=0, column=0, columnspan=2, sticky="w", padx=15, pady=(15, 10))
+        
+        # Slots 1-5 fill the first column, 6-9 and then 0 the second
+        numeric_row = 1
+        for slot, row, col, label in _NUMERIC_SLOT_SPECS:
+            create_slot_control(skill_frame, slot, numeric_row + row, col, label)
+        
+        # Separator between numeric and function key sections
+        separator_row = numeric_row + 5
+        separator = ctk.CTkFrame(skill_frame, height=2, fg_color="gray50")
+        separator.grid(row=separator_row, column=0, columnspan=2, sticky="ew", padx=15, pady=15)
+        
+        # Section 2: Function key slots (F1-F10) - 5 rows x 2 columns
+        function_label = ctk.CTkLabel(skill_frame, text="Function Keys (F1-F10):", font=fonts['label'])
+        function_label.grid(row=separator_row + 1, column=0, columnspan=2, sticky="w", padx=15, pady=(5, 10))
+        
+        # F1-F5 fill the first column, F6-F10 the second
+        function_row = separator_row + 2
+        for slot, row, col, label in _FUNCTION_SLOT_SPECS:
+            create_slot_control(skill_frame, slot, function_row + row, col, label)
+        
+        # Configure skill frame grid
+        skill_frame.columnconfigure(0, weight=1)
+        skill_frame.columnconfigure(1, weight=1)
+    
     def update_skill_slot(self, slot_num):
         """Update skill slot enabled status"""
 
@@ -2384,15 +2452,19 @@ class BotGUI:
                 config.buffs_manager.set_buff(idx, config.buffs_config[idx]['image_path'])
             else:
                 config.buffs_manager.clear_buff(idx)
+        config.update_buffs_configured()
         status = "enabled" if config.buffs_config[idx]['enabled'] else "disabled"
         print(f"Buff {idx + 1} {status}")
     
-    def load_buff_image(self, idx, image_path):
-        """Load and display buff image (image_path should be absolute for loading)"""
+    def load_buff_image(self, idx, image_path, pil_image=None):
+        """Load and display buff image (image_path should be absolute for loading)
+        
+        pil_image may be passed in when it was already decoded off the GUI thread.
+        """
         try:
-            from PIL import Image, ImageTk
-            pil_image = Image.open(image_path)
-            pil_image = pil_image.resize((40, 40), Image.Resampling.LANCZOS)
+            from PIL import ImageTk
+            if pil_image is None:
+                pil_image = _decode_slot_image(image_path)
             image = ImageTk.PhotoImage(pil_image)
             canvas = self.buffs_canvases[idx]
             canvas.delete('all')
@@ -2404,24 +2476,67 @@ class BotGUI:
             relative_path = self.convert_to_relative_path(image_path)
             self.buffs_state[idx]['image_path'] = relative_path
             config.buffs_config[idx]['image_path'] = relative_path
+            config.update_buffs_configured()
             
-            # Sync with buffs_manager (use relative path)
-            if config.buffs_manager:
+            # Sync with buffs_manager (use relative path); disabled slots stay cleared
+            # there, matching update_buff_enabled
+            if config.buffs_manager and config.buffs_config[idx]['enabled']:
                 config.buffs_manager.set_buff(idx, relative_path)
                 print(f"[Buffs] Buff {idx + 1} synced with buffs_manager: {relative_path}")
         except Exception as e:
             print(f"Error loading buff image: {e}")
-            import traceback
             traceback.print_exc()
     
+    def _load_slot_image_async(self, load_func, clear_func, idx, image_path):
+        """Decode a slot image on the worker pool, then show it via load_func on the GUI thread
+        
+        clear_func empties the slot instead when the file has gone missing since it was resolved.
+        """
+        generation = self._slot_image_generation
+        
+        def decode():
+            try:
+                pil_image = _decode_slot_image(image_path)
+            except FileNotFoundError:
+                print(f"  Slot image no longer exists: {image_path}")
+                
+                def clear():
+                    # clear_func also drops the stale cached resolution
+                    if generation == self._slot_image_generation:
+                        clear_func(idx)
+                config.gui_update_queue.put((None, clear))
+                return
+            except Exception as e:
+                print(f"Error loading slot image {image_path}: {e}")
+                return
+            
+            def apply():
+                # A newer Load Settings has run since; its own loads win
+                if generation == self._slot_image_generation:
+                    load_func(idx, image_path, pil_image)
+            config.gui_update_queue.put((None, apply))
+        
+        self._executor.submit(decode)
+    
+    def _on_buff_canvas_click(self, event):
+        """Left-click on a buff slot canvas: pick its skill"""
+        self.show_buff_skill_selector(self.buffs_canvases.index(event.widget))
+    
+    def _on_buff_canvas_clear(self, event):
+        """Right-click on a buff slot canvas: clear its skill"""
+        self.clear_buff_skill(self.buffs_canvases.index(event.widget))
+    
     def clear_buff_skill(self, idx):
         """Clear buff skill image"""
-        canvas = self.buffs_canvases[idx]
-        canvas.delete('all')
-        canvas.image = None
-        canvas.image_path = None
-        self.buffs_state[idx]['image_path'] = None
+        self._forget_resolved_path(config.buffs_config[idx]['image_path'])
+        if self.buffs_canvases:  # Tab not opened yet otherwise
+            canvas = self.buffs_canvases[idx]
+            canvas.delete('all')
+            canvas.image = None
+            canvas.image_path = None
+            self.buffs_state[idx]['image_path'] = None
         config.buffs_config[idx]['image_path'] = None
+        config.update_buffs_configured()
         if config.buffs_manager:
             config.buffs_manager.clear_buff(idx)
         print(f"Buff {idx + 1} skill cleared")
@@ -2488,7 +2603,6 @@ class BotGUI:
             print(f"✅ Preloaded skill images for {len(self.skill_images_cache)} jobs")
         except Exception as e:
             print(f"Error in _preload_skill_images: {e}")
-            import traceback
             traceback.print_exc()
     
     def show_skill_selector(self, callback_func, callback_arg, title="Choose Skill"):
@@ -2518,7 +2632,7 @@ class BotGUI:
             popup = ctk.CTkToplevel(self.root)
             popup.title(title)
             popup.transient(self.root)
-            popup.grab_set()
+            _safe_grab_set(popup)
             
             # Position popup relative to main window's current position
             self.root.update_idletasks()  # Ensure root window position is updated
@@ -2709,7 +2823,6 @@ class BotGUI:
             
         except Exception as e:
             print(f"Error showing skill selector: {e}")
-            import traceback
             traceback.print_exc()
             if 'popup' in locals():
                 popup.destroy()
@@ -2721,6 +2834,7 @@ class BotGUI:
     def select_buff_skill(self, buff_index, image_path, popup):
         """Select a skill image for a buff"""
         self.load_buff_image(buff_index, image_path)
+        self._forget_resolved_path(config.buffs_config[buff_index]['image_path'])
         popup.destroy()
         print(f"Buff {buff_index + 1} skill selected: {image_path}")
     
@@ -2731,15 +2845,19 @@ class BotGUI:
     def select_skill_sequence_skill(self, skill_index, image_path, popup):
         """Select a skill image for skill sequence"""
         self.load_skill_sequence_image(skill_index, image_path)
+        self._forget_resolved_path(config.skill_sequence_config[skill_index]['image_path'])
         popup.destroy()
         print(f"Skill Sequence {skill_index + 1} skill selected: {image_path}")
     
-    def load_skill_sequence_image(self, idx, image_path):
-        """Load and display skill sequence image (image_path should be absolute for loading)"""
+    def load_skill_sequence_image(self, idx, image_path, pil_image=None):
+        """Load and display skill sequence image (image_path should be absolute for loading)
+        
+        pil_image may be passed in when it was already decoded off the GUI thread.
+        """
         try:
-            from PIL import Image, ImageTk
-            pil_image = Image.open(image_path)
-            pil_image = pil_image.resize((40, 40), Image.Resampling.LANCZOS)
+            from PIL import ImageTk
+            if pil_image is None:
+                pil_image = _decode_slot_image(image_path)
             image = ImageTk.PhotoImage(pil_image)
             canvas = self.skill_sequence_canvases[idx]
             canvas.delete('all')
@@ -2752,22 +2870,32 @@ class BotGUI:
             self.skill_sequence_state[idx]['image_path'] = relative_path
             config.skill_sequence_config[idx]['image_path'] = relative_path
             
-            # Sync with skill sequence manager (use relative path)
-            if config.skill_sequence_manager:
+            # Sync with skill sequence manager (use relative path); disabled slots
+            # stay cleared there, matching update_skill_sequence_enabled
+            if config.skill_sequence_manager and config.skill_sequence_config[idx]['enabled']:
                 config.skill_sequence_manager.set_skill(idx, relative_path)
                 print(f"[SkillSequence] Skill {idx + 1} synced with skill_sequence_manager: {relative_path}")
         except Exception as e:
             print(f"Error loading skill sequence image: {e}")
-            import traceback
             traceback.print_exc()
     
+    def _on_skill_sequence_canvas_click(self, event):
+        """Left-click on a skill sequence slot canvas: pick its skill"""
+        self.show_skill_sequence_selector(self.skill_sequence_canvases.index(event.widget))
+    
+    def _on_skill_sequence_canvas_clear(self, event):
+        """Right-click on a skill sequence slot canvas: clear its skill"""
+        self.clear_skill_sequence_skill(self.skill_sequence_canvases.index(event.widget))
+    
     def clear_skill_sequence_skill(self, idx):
         """Clear skill sequence skill image"""
-        canvas = self.skill_sequence_canvases[idx]
-        canvas.delete('all')
-        canvas.image = None
-        canvas.image_path = None
-        self.skill_sequence_state[idx]['image_path'] = None
+        self._forget_resolved_path(config.skill_sequence_config[idx].get('image_path'))
+        if self.skill_sequence_canvases:  # Tab not opened yet otherwise
+            canvas = self.skill_sequence_canvases[idx]
+            canvas.delete('all')
+            canvas.image = None
+            canvas.image_path = None
+            self.skill_sequence_state[idx]['image_path'] = None
         config.skill_sequence_config[idx]['image_path'] = None
         if config.skill_sequence_manager:
             config.skill_sequence_manager.clear_skill(idx)
@@ -2787,11 +2915,12 @@ class BotGUI:
     
     def configure_hp_thresholds(self):
         """Open dialog to configure multiple HP thresholds"""
+        fonts = _fonts()
         dialog = ctk.CTkToplevel(self.root)
         dialog.title("Configure HP Thresholds")
         dialog.geometry("500x400")
         dialog.transient(self.root)
-        dialog.grab_set()
+        _safe_grab_set(dialog)
         
         root_x = self.root.winfo_x()
         root_y = self.root.winfo_y()
@@ -2803,13 +2932,13 @@ class BotGUI:
         
         # Title
         title_label = ctk.CTkLabel(main_frame, text="HP Thresholds Configuration",
-                                  font=ctk.CTkFont(size=16, weight="bold"))
+                                  font=fonts['heading'])
         title_label.pack(pady=(0, 10))
         
         # Instructions
         instructions = ctk.CTkLabel(main_frame, 
                                    text="Configure multiple thresholds. When HP drops below a threshold,\nthe corresponding key will be pressed. Thresholds are checked from highest to lowest.",
-                                   font=ctk.CTkFont(size=11),
+                                   font=fonts['small'],
                                    justify="left")
         instructions.pack(pady=(0, 15))
         
@@ -2853,7 +2982,7 @@ class BotGUI:
             
             key_button = ctk.CTkButton(row_frame, width=60, height=28,
                                       command=lambda: self.register_key_in_dialog(key_var, dialog),
-                                      font=ctk.CTkFont(size=10), corner_radius=4)
+                                      font=fonts['tiny'], corner_radius=4)
             key_button.grid(row=0, column=4, padx=5, pady=5)
             update_key_button_text(btn=key_button)
             key_var.trace_add('write', lambda *args: update_key_button_text(btn=key_button))
@@ -2861,7 +2990,7 @@ class BotGUI:
             # Delete button
             delete_button = ctk.CTkButton(row_frame, text="×", width=30, height=28,
                                          command=lambda: remove_threshold_row(row_frame, widget_data),
-                                         font=ctk.CTkFont(size=16), corner_radius=4)
+                                         font=fonts['icon'], corner_radius=4)
             delete_button.grid(row=0, column=5, padx=5, pady=5)
             
             widget_data = {
@@ -2947,18 +3076,19 @@ class BotGUI:
     
     def register_key_in_dialog(self, key_var, parent_dialog):
         """Register a key for HP threshold in the dialog"""
+        fonts = _fonts()
         popup = ctk.CTkToplevel(parent_dialog)
         popup.title("Press a key")
         popup.geometry("300x150")
         popup.transient(parent_dialog)
-        popup.grab_set()
+        _safe_grab_set(popup)
         
         parent_x = parent_dialog.winfo_x()
         parent_y = parent_dialog.winfo_y()
         popup.geometry(f'+{parent_x + 50}+{parent_y + 50}')
         
         label = ctk.CTkLabel(popup, text="Press any key to register...", 
-                            font=ctk.CTkFont(size=12))
+                            font=fonts['body'])
         label.pack(pady=30)
         
         def on_key_press(event):
@@ -2992,18 +3122,19 @@ class BotGUI:
     
     def register_mp_key(self):
         """Register a key for MP potion by capturing keyboard input"""
+        fonts = _fonts()
         popup = ctk.CTkToplevel(self.root)
         popup.title("Press a key")
         popup.geometry("300x150")
         popup.transient(self.root)
-        popup.grab_set()
+        _safe_grab_set(popup)
         
         root_x = self.root.winfo_x()
         root_y = self.root.winfo_y()
         popup.geometry(f'+{root_x + 50}+{root_y + 50}')
         
         label = ctk.CTkLabel(popup, text="Press any key to register...", 
-                            font=ctk.CTkFont(size=12))
+                            font=fonts['body'])
         label.pack(pady=30)
         
         def on_key_press(event):
@@ -3011,11 +3142,13 @@ class BotGUI:
             
             if len(key) == 1:
                 self.mp_key_var.set(key)
+                self._refresh_mp_key_button()
                 config.mp_key = key.lower()
                 print(f"MP key registered: {key}")
                 popup.destroy()
             elif key in ['F1', 'F2', 'F3', 'F4', 'F5', 'F6', 'F7', 'F8', 'F9', 'F10', 'F11', 'F12']:
                 self.mp_key_var.set(key)
+                self._refresh_mp_key_button()
                 config.mp_key = key.lower()
                 print(f"MP key registered: {key}")
                 popup.destroy()
@@ -3028,6 +3161,7 @@ class BotGUI:
                 }
                 mapped_key = key_map.get(key, key)
                 self.mp_key_var.set(mapped_key)
+                self._refresh_mp_key_button()
                 config.mp_key = mapped_key.lower()
                 print(f"MP key registered: {mapped_key}")
                 popup.destroy()
@@ -3038,9 +3172,15 @@ class BotGUI:
         cancel_btn = ctk.CTkButton(popup, text="Cancel", command=popup.destroy, width=100)
         cancel_btn.pack(pady=10)
     
+    def _refresh_mp_key_button(self):
+        """Show the registered MP key on its button"""
+        key = self.mp_key_var.get()
+        self.mp_key_button.configure(text=key.upper() if key else "Set Key")
+    
     def clear_mp_key(self):
         """Clear MP key"""
         self.mp_key_var.set('')
+        self._refresh_mp_key_button()
         config.mp_key = '9'  # Reset to default
         print("MP key cleared, reset to default: 9")
     
@@ -3058,8 +3198,58 @@ class BotGUI:
         if not relative_path:
             return None
         
-        # Use the config helper function to resolve relative paths
-        return config.resolve_resource_path(relative_path)
+        # Resolve (and existence-check) each path once; slot edits drop their entry
+        try:
+            return self._resolved_paths[relative_path]
+        except KeyError:
+            # Use the config helper function to resolve relative paths
+            resolved = config.resolve_resource_path(relative_path)
+            self._resolved_paths[relative_path] = resolved
+            return resolved
+    
+    def _prime_resolved_paths(self, relative_paths):
+        """Resolve many uncached paths with one directory listing per folder instead of a stat each
+        
+        Each folder is stat'ed once; if its mtime moved (a file was added, removed or
+        renamed) its cached entries are dropped and checked again.
+        """
+        by_folder = {}
+        for relative_path in relative_paths:
+            if relative_path:
+                full_path = config.resource_path(relative_path)
+                by_folder.setdefault(os.path.dirname(full_path), []).append((relative_path, full_path))
+        
+        for folder in list(by_folder):
+            try:
+                mtime_ns = os.stat(folder).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if self._resolved_folder_mtimes.get(folder) != mtime_ns:
+                self._resolved_folder_mtimes[folder] = mtime_ns
+                self._resolved_paths = {
+                    relative_path: resolved for relative_path, resolved in self._resolved_paths.items()
+                    if os.path.dirname(config.resource_path(relative_path)) != folder
+                }
+            entries = [entry for entry in by_folder[folder] if entry[0] not in self._resolved_paths]
+            if entries:
+                by_folder[folder] = entries
+            else:
+                del by_folder[folder]
+        
+        for folder, entries in by_folder.items():
+            try:
+                # normcase: Windows file names are case-insensitive, like os.path.exists
+                names = {os.path.normcase(name) for name in os.listdir(folder)}
+            except OSError:
+                names = set()
+            for relative_path, full_path in entries:
+                found = os.path.normcase(os.path.basename(full_path)) in names
+                self._resolved_paths[relative_path] = full_path if found else None
+    
+    def _forget_resolved_path(self, relative_path):
+        """Drop a cached path resolution so the file is checked again next time"""
+        if relative_path:
+            self._resolved_paths.pop(relative_path, None)
     
     def convert_to_relative_path(self, absolute_path):
         """Convert an absolute path to relative path for saving in configuration"""
@@ -3269,11 +3459,12 @@ class BotGUI:
         mode = self.mouse_clicker_mode_var.get()
         config.mouse_clicker_use_cursor = (mode == "cursor")
         
-        # Show/hide coordinate inputs based on mode
-        if mode == "coords":
-            self.mouse_clicker_coords_frame.grid()
-        else:
-            self.mouse_clicker_coords_frame.grid_remove()
+        # Show/hide coordinate inputs based on mode (once the tab is built)
+        if self.mouse_clicker_coords_frame is not None:
+            if mode == "coords":
+                self.mouse_clicker_coords_frame.grid()
+            else:
+                self.mouse_clicker_coords_frame.grid_remove()
         
         mode_text = "cursor position" if config.mouse_clicker_use_cursor else "specific coordinates"
         print(f"Mouse clicker mode: {mode_text}")
@@ -3296,12 +3487,13 @@ class BotGUI:
         
         try:
             # Check if window is connected
-            if not config.connected_window:
+            cw = config.connected_window
+            if not cw:
                 messagebox.showwarning("No Window", "Please connect to a game window first!")
                 return
             
             # Get window handle
-            hwnd = config.connected_window.handle
+            hwnd = cw.handle
             
             # Hide the main window temporarily
             self.root.withdraw()
@@ -3309,6 +3501,9 @@ class BotGUI:
             # Show instruction message
             print("Click on the game window to set mouse clicker coordinates. Press ESC to cancel.")
             
+            # Cache window position for the motion preview
+            window_rect = win32gui.GetWindowRect(hwnd)
+            
             # Create a fullscreen window to capture clicks
             picker_window = tk.Toplevel()
             picker_window.attributes('-fullscreen', True)
@@ -3370,23 +3565,19 @@ class BotGUI:
                 print("Mouse clicker coordinate picking cancelled")
             
             def on_motion(event):
-                try:
-                    click_x = event.x_root
-                    click_y = event.y_root
-                    
-                    # Get window position
-                    rect = win32gui.GetWindowRect(hwnd)
-                    window_x = rect[0]
-                    window_y = rect[1]
-                    
-                    # Calculate window-relative coordinates
-                    rel_x = click_x - window_x
-                    rel_y = click_y - window_y
-                    
-                    # Update info label
-                    info_label.configure(text=f"Position: ({rel_x}, {rel_y})")
-                except:
-                    pass
+                click_x = event.x_root
+                click_y = event.y_root
+                
+                # Use window position cached at picker start
+                window_x = window_rect[0]
+                window_y = window_rect[1]
+                
+                # Calculate window-relative coordinates
+                rel_x = click_x - window_x
+                rel_y = click_y - window_y
+                
+                # Update info label
+                info_label.configure(text=f"Position: ({rel_x}, {rel_y})")
             
             # Bind events
             picker_window.bind('<Button-1>', on_click)
@@ -3404,12 +3595,13 @@ class BotGUI:
         
         try:
             # Check if window is connected
-            if not config.connected_window:
+            cw = config.connected_window
+            if not cw:
                 messagebox.showwarning("No Window", "Please connect to a game window first!")
                 return
             
             # Get window handle
-            hwnd = config.connected_window.handle
+            hwnd = cw.handle
             
             # Hide the main window temporarily
             self.root.withdraw()
@@ -3449,9 +3641,18 @@ class BotGUI:
             start_x = None
             start_y = None
             dragging = False
+            window_rect = None
             
             def on_button_press(event):
-                nonlocal start_x, start_y, dragging, rect_id
+                nonlocal start_x, start_y, dragging, rect_id, window_rect
+                # Cache window position once per drag instead of per motion event
+                try:
+                    window_rect = win32gui.GetWindowRect(hwnd)
+                except Exception as e:
+                    # Game window is gone; close the picker like Escape does
+                    print(f"Error reading game window position: {e}")
+                    on_escape(event)
+                    return
                 start_x = event.x_root
                 start_y = event.y_root
                 dragging = True
@@ -3465,40 +3666,36 @@ class BotGUI:
                 if not dragging or start_x is None or start_y is None:
                     return
                 
-                try:
-                    current_x = event.x_root
-                    current_y = event.y_root
-                    
-                    # Get window position
-                    rect = win32gui.GetWindowRect(hwnd)
-                    window_x = rect[0]
-                    window_y = rect[1]
-                    
-                    # Calculate rectangle bounds (ensure top-left is min, bottom-right is max)
-                    min_x = min(start_x, current_x)
-                    max_x = max(start_x, current_x)
-                    min_y = min(start_y, current_y)
-                    max_y = max(start_y, current_y)
-                    
-                    # Calculate window-relative coordinates
-                    rel_x = min_x - window_x
-                    rel_y = min_y - window_y
-                    width = max_x - min_x
-                    height = max_y - min_y
-                    
-                    # Update info label
-                    info_label.configure(text=f"Position: ({rel_x}, {rel_y}) | Size: {width}x{height} pixels")
-                    
-                    # Draw preview rectangle
-                    if rect_id:
-                        canvas.delete(rect_id)
-                    
-                    rect_id = canvas.create_rectangle(
-                        min_x, min_y, max_x, max_y,
-                        outline='red', width=2
-                    )
-                except:
-                    pass
+                current_x = event.x_root
+                current_y = event.y_root
+                
+                # Use window position cached at button press
+                window_x = window_rect[0]
+                window_y = window_rect[1]
+                
+                # Calculate rectangle bounds (ensure top-left is min, bottom-right is max)
+                min_x = min(start_x, current_x)
+                max_x = max(start_x, current_x)
+                min_y = min(start_y, current_y)
+                max_y = max(start_y, current_y)
+                
+                # Calculate window-relative coordinates
+                rel_x = min_x - window_x
+                rel_y = min_y - window_y
+                width = max_x - min_x
+                height = max_y - min_y
+                
+                # Update info label
+                info_label.configure(text=f"Position: ({rel_x}, {rel_y}) | Size: {width}x{height} pixels")
+                
+                # Draw preview rectangle
+                if rect_id:
+                    canvas.delete(rect_id)
+                
+                rect_id = canvas.create_rectangle(
+                    min_x, min_y, max_x, max_y,
+                    outline='red', width=2
+                )
             
             def on_button_release(event):
                 nonlocal start_x, start_y, dragging, rect_id
@@ -3532,13 +3729,6 @@ class BotGUI:
                     if height < 5:
                         height = 5
                     
-                    # Update the variables
-                    self.hp_x_var.set(str(rel_x))
-                    self.hp_y_var.set(str(rel_y))
-                    self.hp_width_var.set(str(width))
-                    self.hp_height_var.set(str(height))
-                    self.hp_coords_var.set(f"{rel_x},{rel_y}")
-                    
                     # Update global variable
                     config.hp_bar_area['x'] = rel_x
                     config.hp_bar_area['y'] = rel_y
@@ -3586,12 +3776,13 @@ class BotGUI:
         
         try:
             # Check if window is connected
-            if not config.connected_window:
+            cw = config.connected_window
+            if not cw:
                 messagebox.showwarning("No Window", "Please connect to a game window first!")
                 return
             
             # Get window handle
-            hwnd = config.connected_window.handle
+            hwnd = cw.handle
             
             # Hide the main window temporarily
             self.root.withdraw()
@@ -3631,9 +3822,18 @@ class BotGUI:
             start_x = None
             start_y = None
             dragging = False
+            window_rect = None
             
             def on_button_press(event):
-                nonlocal start_x, start_y, dragging, rect_id
+                nonlocal start_x, start_y, dragging, rect_id, window_rect
+                # Cache window position once per drag instead of per motion event
+                try:
+                    window_rect = win32gui.GetWindowRect(hwnd)
+                except Exception as e:
+                    # Game window is gone; close the picker like Escape does
+                    print(f"Error reading game window position: {e}")
+                    on_escape(event)
+                    return
                 start_x = event.x_root
                 start_y = event.y_root
                 dragging = True
@@ -3647,40 +3847,36 @@ class BotGUI:
                 if not dragging or start_x is None or start_y is None:
                     return
                 
-                try:
-                    current_x = event.x_root
-                    current_y = event.y_root
-                    
-                    # Get window position
-                    rect = win32gui.GetWindowRect(hwnd)
-                    window_x = rect[0]
-                    window_y = rect[1]
-                    
-                    # Calculate rectangle bounds (ensure top-left is min, bottom-right is max)
-                    min_x = min(start_x, current_x)
-                    max_x = max(start_x, current_x)
-                    min_y = min(start_y, current_y)
-                    max_y = max(start_y, current_y)
-                    
-                    # Calculate window-relative coordinates
-                    rel_x = min_x - window_x
-                    rel_y = min_y - window_y
-                    width = max_x - min_x
-                    height = max_y - min_y
-                    
-                    # Update info label
-                    info_label.configure(text=f"Position: ({rel_x}, {rel_y}) | Size: {width}x{height} pixels")
-                    
-                    # Draw preview rectangle
-                    if rect_id:
-                        canvas.delete(rect_id)
-                    
-                    rect_id = canvas.create_rectangle(
-                        min_x, min_y, max_x, max_y,
-                        outline='blue', width=2
-                    )
-                except:
-                    pass
+                current_x = event.x_root
+                current_y = event.y_root
+                
+                # Use window position cached at button press
+                window_x = window_rect[0]
+                window_y = window_rect[1]
+                
+                # Calculate rectangle bounds (ensure top-left is min, bottom-right is max)
+                min_x = min(start_x, current_x)
+                max_x = max(start_x, current_x)
+                min_y = min(start_y, current_y)
+                max_y = max(start_y, current_y)
+                
+                # Calculate window-relative coordinates
+                rel_x = min_x - window_x
+                rel_y = min_y - window_y
+                width = max_x - min_x
+                height = max_y - min_y
+                
+                # Update info label
+                info_label.configure(text=f"Position: ({rel_x}, {rel_y}) | Size: {width}x{height} pixels")
+                
+                # Draw preview rectangle
+                if rect_id:
+                    canvas.delete(rect_id)
+                
+                rect_id = canvas.create_rectangle(
+                    min_x, min_y, max_x, max_y,
+                    outline='blue', width=2
+                )
             
             def on_button_release(event):
                 nonlocal start_x, start_y, dragging, rect_id
@@ -3714,13 +3910,6 @@ class BotGUI:
                     if height < 5:
                         height = 5
                     
-                    # Update the variables
-                    self.mp_x_var.set(str(rel_x))
-                    self.mp_y_var.set(str(rel_y))
-                    self.mp_width_var.set(str(width))
-                    self.mp_height_var.set(str(height))
-                    self.mp_coords_var.set(f"{rel_x},{rel_y}")
-                    
                     # Update global variable
                     config.mp_bar_area['x'] = rel_x
                     config.mp_bar_area['y'] = rel_y
@@ -3768,12 +3957,13 @@ class BotGUI:
         
         try:
             # Check if window is connected
-            if not config.connected_window:
+            cw = config.connected_window
+            if not cw:
                 messagebox.showwarning("No Window", "Please connect to a game window first!")
                 return
             
             # Get window handle
-            hwnd = config.connected_window.handle
+            hwnd = cw.handle
             
             # Hide the main window temporarily
             self.root.withdraw()
@@ -3813,9 +4003,18 @@ class BotGUI:
             start_x = None
             start_y = None
             dragging = False
+            window_rect = None
             
             def on_button_press(event):
-                nonlocal start_x, start_y, dragging, rect_id
+                nonlocal start_x, start_y, dragging, rect_id, window_rect
+                # Cache window position once per drag instead of per motion event
+                try:
+                    window_rect = win32gui.GetWindowRect(hwnd)
+                except Exception as e:
+                    # Game window is gone; close the picker like Escape does
+                    print(f"Error reading game window position: {e}")
+                    on_escape(event)
+                    return
                 start_x = event.x_root
                 start_y = event.y_root
                 dragging = True
@@ -3829,40 +4028,36 @@ class BotGUI:
                 if not dragging or start_x is None or start_y is None:
                     return
                 
-                try:
-                    current_x = event.x_root
-                    current_y = event.y_root
-                    
-                    # Get window position
-                    rect = win32gui.GetWindowRect(hwnd)
-                    window_x = rect[0]
-                    window_y = rect[1]
-                    
-                    # Calculate rectangle bounds (ensure top-left is min, bottom-right is max)
-                    min_x = min(start_x, current_x)
-                    max_x = max(start_x, current_x)
-                    min_y = min(start_y, current_y)
-                    max_y = max(start_y, current_y)
-                    
-                    # Calculate window-relative coordinates
-                    rel_x = min_x - window_x
-                    rel_y = min_y - window_y
-                    width = max_x - min_x
-                    height = max_y - min_y
-                    
-                    # Update info label
-                    info_label.configure(text=f"Position: ({rel_x}, {rel_y}) | Size: {width}x{height} pixels")
-                    
-                    # Draw preview rectangle
-                    if rect_id:
-                        canvas.delete(rect_id)
-                    
-                    rect_id = canvas.create_rectangle(
-                        min_x, min_y, max_x, max_y,
-                        outline='white', width=2
-                    )
-                except:
-                    pass
+                current_x = event.x_root
+                current_y = event.y_root
+                
+                # Use window position cached at button press
+                window_x = window_rect[0]
+                window_y = window_rect[1]
+                
+                # Calculate rectangle bounds (ensure top-left is min, bottom-right is max)
+                min_x = min(start_x, current_x)
+                max_x = max(start_x, current_x)
+                min_y = min(start_y, current_y)
+                max_y = max(start_y, current_y)
+                
+                # Calculate window-relative coordinates
+                rel_x = min_x - window_x
+                rel_y = min_y - window_y
+                width = max_x - min_x
+                height = max_y - min_y
+                
+                # Update info label
+                info_label.configure(text=f"Position: ({rel_x}, {rel_y}) | Size: {width}x{height} pixels")
+                
+                # Draw preview rectangle
+                if rect_id:
+                    canvas.delete(rect_id)
+                
+                rect_id = canvas.create_rectangle(
+                    min_x, min_y, max_x, max_y,
+                    outline='white', width=2
+                )
             
             def on_button_release(event):
                 nonlocal start_x, start_y, dragging, rect_id
@@ -3896,14 +4091,9 @@ class BotGUI:
                     if height < 5:
                         height = 5
                     
-                    # Update the coordinate variables (center point for display)
+                    # Center point of the selected area
                     center_x = rel_x + (width // 2)
                     center_y = rel_y + (height // 2)
-                    self.mob_coords_var.set(f"{center_x},{center_y}")
-                    
-                    # Update width and height variables
-                    self.mob_width_var.set(str(width))
-                    self.mob_height_var.set(str(height))
                     
                     # Update global variable (using center point for x,y as before)
                     config.target_name_area['x'] = center_x
@@ -3954,12 +4144,13 @@ class BotGUI:
         
         try:
             # Check if window is connected
-            if not config.connected_window:
+            cw = config.connected_window
+            if not cw:
                 messagebox.showwarning("No Window", "Please connect to a game window first!")
                 return
             
             # Get window handle
-            hwnd = config.connected_window.handle
+            hwnd = cw.handle
             
             # Hide the main window temporarily
             self.root.withdraw()
@@ -3999,9 +4190,18 @@ class BotGUI:
             start_x = None
             start_y = None
             dragging = False
+            window_rect = None
             
             def on_button_press(event):
-                nonlocal start_x, start_y, dragging, rect_id
+                nonlocal start_x, start_y, dragging, rect_id, window_rect
+                # Cache window position once per drag instead of per motion event
+                try:
+                    window_rect = win32gui.GetWindowRect(hwnd)
+                except Exception as e:
+                    # Game window is gone; close the picker like Escape does
+                    print(f"Error reading game window position: {e}")
+                    on_escape(event)
+                    return
                 start_x = event.x_root
                 start_y = event.y_root
                 dragging = True
@@ -4015,40 +4215,36 @@ class BotGUI:
                 if not dragging or start_x is None or start_y is None:
                     return
                 
-                try:
-                    current_x = event.x_root
-                    current_y = event.y_root
-                    
-                    # Get window position
-                    rect = win32gui.GetWindowRect(hwnd)
-                    window_x = rect[0]
-                    window_y = rect[1]
-                    
-                    # Calculate rectangle bounds (ensure top-left is min, bottom-right is max)
-                    min_x = min(start_x, current_x)
-                    max_x = max(start_x, current_x)
-                    min_y = min(start_y, current_y)
-                    max_y = max(start_y, current_y)
-                    
-                    # Calculate window-relative coordinates
-                    rel_x = min_x - window_x
-                    rel_y = min_y - window_y
-                    width = max_x - min_x
-                    height = max_y - min_y
-                    
-                    # Update info label
-                    info_label.configure(text=f"Position: ({rel_x}, {rel_y}) | Size: {width}x{height} pixels")
-                    
-                    # Draw preview rectangle
-                    if rect_id:
-                        canvas.delete(rect_id)
-                    
-                    rect_id = canvas.create_rectangle(
-                        min_x, min_y, max_x, max_y,
-                        outline='orange', width=2
-                    )
-                except:
-                    pass
+                current_x = event.x_root
+                current_y = event.y_root
+                
+                # Use window position cached at button press
+                window_x = window_rect[0]
+                window_y = window_rect[1]
+                
+                # Calculate rectangle bounds (ensure top-left is min, bottom-right is max)
+                min_x = min(start_x, current_x)
+                max_x = max(start_x, current_x)
+                min_y = min(start_y, current_y)
+                max_y = max(start_y, current_y)
+                
+                # Calculate window-relative coordinates
+                rel_x = min_x - window_x
+                rel_y = min_y - window_y
+                width = max_x - min_x
+                height = max_y - min_y
+                
+                # Update info label
+                info_label.configure(text=f"Position: ({rel_x}, {rel_y}) | Size: {width}x{height} pixels")
+                
+                # Draw preview rectangle
+                if rect_id:
+                    canvas.delete(rect_id)
+                
+                rect_id = canvas.create_rectangle(
+                    min_x, min_y, max_x, max_y,
+                    outline='orange', width=2
+                )
             
             def on_button_release(event):
                 nonlocal start_x, start_y, dragging, rect_id
@@ -4082,13 +4278,6 @@ class BotGUI:
                     if height < 5:
                         height = 5
                     
-                    # Update the variables
-                    self.enemy_hp_x_var.set(str(rel_x))
-                    self.enemy_hp_y_var.set(str(rel_y))
-                    self.enemy_hp_width_var.set(str(width))
-                    self.enemy_hp_height_var.set(str(height))
-                    self.enemy_hp_coords_var.set(f"{rel_x},{rel_y}")
-                    
                     # Update global variable
                     config.target_hp_bar_area['x'] = rel_x
                     config.target_hp_bar_area['y'] = rel_y
@@ -4136,12 +4325,13 @@ class BotGUI:
         
         try:
             # Check if window is connected
-            if not config.connected_window:
+            cw = config.connected_window
+            if not cw:
                 messagebox.showwarning("No Window", "Please connect to a game window first!")
                 return
             
             # Get window handle
-            hwnd = config.connected_window.handle
+            hwnd = cw.handle
             
             # Hide the main window temporarily
             self.root.withdraw()
@@ -4193,31 +4383,28 @@ class BotGUI:
                 if not dragging or start_x is None or start_y is None:
                     return
                 
-                try:
-                    end_x = event.x_root
-                    end_y = event.y_root
-                    
-                    min_x = min(start_x, end_x)
-                    max_x = max(start_x, end_x)
-                    min_y = min(start_y, end_y)
-                    max_y = max(start_y, end_y)
-                    
-                    width = max_x - min_x
-                    height = max_y - min_y
-                    
-                    # Update info label
-                    info_label.configure(text=f"Size: {width}x{height} pixels")
-                    
-                    # Draw preview rectangle
-                    if rect_id:
-                        canvas.delete(rect_id)
-                    
-                    rect_id = canvas.create_rectangle(
-                        min_x, min_y, max_x, max_y,
-                        outline='orange', width=2
-                    )
-                except:
-                    pass
+                end_x = event.x_root
+                end_y = event.y_root
+                
+                min_x = min(start_x, end_x)
+                max_x = max(start_x, end_x)
+                min_y = min(start_y, end_y)
+                max_y = max(start_y, end_y)
+                
+                width = max_x - min_x
+                height = max_y - min_y
+                
+                # Update info label
+                info_label.configure(text=f"Size: {width}x{height} pixels")
+                
+                # Draw preview rectangle
+                if rect_id:
+                    canvas.delete(rect_id)
+                
+                rect_id = canvas.create_rectangle(
+                    min_x, min_y, max_x, max_y,
+                    outline='orange', width=2
+                )
             
             def on_button_release(event):
                 nonlocal start_x, start_y, dragging, rect_id
@@ -4318,7 +4505,7 @@ class BotGUI:
         # Button should be enabled only if:
         # 1. Window is connected
         # 2. Calibration has been completed (calibrator exists)
-        is_calibrated = config.calibrator is not None and config.calibrator.mp_position is not None
+        is_calibrated = config.is_calibrated()
         
         if config.connected_window and is_calibrated and not config.bot_running:
             self.toggle_bot_button.configure(state="normal", text="Start", fg_color="green", hover_color="darkgreen", command=self.toggle_bot)
@@ -4328,38 +4515,26 @@ class BotGUI:
         else:
             self.toggle_bot_button.configure(state="disabled")
     
-    def update_mob_coordinates(self):
-        """Update mob name detection coordinates"""
-
-        try:
-            # Parse coordinates from the display string
-            coords_str = self.mob_coords_var.get()
-            x, y = map(int, coords_str.split(','))
-            
-            config.target_name_area['x'] = x
-            config.target_name_area['y'] = y
-            config.target_name_area['width'] = int(self.mob_width_var.get())
-            config.target_name_area['height'] = int(self.mob_height_var.get())
-            
-            print(f"Updated mob coordinates: {config.target_name_area}")
-        except (ValueError, AttributeError) as e:
-            print(f"Invalid coordinates - please enter numbers only: {e}")
-    
     def update_target_list(self):
         """Update mob target list"""
 
         target_text = self.target_list_text.get("1.0", tk.END).strip()
-        config.mob_target_list = [line.strip() for line in target_text.split('\n') if line.strip()]
+        config.mob_target_list = [s for s in map(str.strip, target_text.splitlines()) if s]
+        config._mob_target_list_lower = {t.lower() for t in config.mob_target_list}
         print(f"Updated target list: {config.mob_target_list}")
     
     def test_mob_detection(self):
         """Test mob detection and display result"""
-        if not config.connected_window or not config.calibrator or config.calibrator.mp_position is None:
+        # Label is written directly below, so invalidate the status loop's cached value
+        self._last_ui.pop('current_mob', None)
+        cw = config.connected_window
+        calib = config.calibrator
+        if not cw or not calib or calib.mp_position is None:
             print("TEST: Calibration required for mob detection")
             self.current_mob_label.configure(text="Calibration Required", text_color="red")
             return
         
-        hwnd = config.connected_window.handle
+        hwnd = cw.handle
         result = auto_attack.detect_enemy_for_auto_attack(hwnd, targets=None)
         mob_name = result.get('name')
         
@@ -4377,16 +4552,18 @@ class BotGUI:
     
     def record_target_mob(self):
         """Record current enemy name automatically and add to target list"""
-        if not config.connected_window:
+        cw = config.connected_window
+        calib = config.calibrator
+        if not cw:
             print("[Record] No window connected")
             return
         
-        if not config.calibrator or config.calibrator.mp_position is None:
+        if not calib or calib.mp_position is None:
             print("[Record] Calibration required. Please calibrate first.")
             return
         
         try:
-            hwnd = config.connected_window.handle
+            hwnd = cw.handle
             
             # Detect enemy using calibration-based method (without target filtering)
             result = auto_attack.detect_enemy_for_auto_attack(hwnd, targets=None)
@@ -4396,15 +4573,16 @@ class BotGUI:
                 if detected_name:
                     detected_name_lower = detected_name.lower()
                     # Check if already in target list
-                    if not any(t.lower() == detected_name_lower for t in config.mob_target_list):
+                    if detected_name_lower not in config._mob_target_list_lower:
                         config.mob_target_list.append(detected_name)
+                        config._mob_target_list_lower.add(detected_name_lower)
                         # Update GUI textbox - ensure it exists and update it
                         if hasattr(self, 'target_list_text'):
-                            target_text = '\n'.join(config.mob_target_list)
-                            self.target_list_text.delete("1.0", tk.END)
-                            self.target_list_text.insert("1.0", target_text)
-                            # Force GUI update to show the change
-                            self.target_list_text.update_idletasks()
+                            # Append only the new line instead of rewriting the whole list
+                            last_char = self.target_list_text.get("end-2c")
+                            separator = "\n" if last_char not in ("", "\n") else ""
+                            self.target_list_text.insert(tk.END, f"{separator}{detected_name}")
+                            # Redraw happens on the next mainloop idle pass
                         print(f"[Record] Added target: {detected_name}")
                     else:
                         print(f"[Record] Target '{detected_name}' already in list")
@@ -4414,7 +4592,6 @@ class BotGUI:
                 print("[Record] No enemy detected. Make sure you have a target selected.")
         except Exception as e:
             print(f"[Record] Error recording target: {str(e)}")
-            import traceback
             traceback.print_exc()
     
     def update_status(self):
@@ -4424,12 +4601,6 @@ class BotGUI:
             hp_percent = config.current_hp_percentage
             mp_percent = config.current_mp_percentage
             
-            # Update GUI progress bars and labels (maximized view)
-            self.hp_progress_bar.set(hp_percent / 100.0)
-            self.hp_percent_label.configure(text=f"{int(hp_percent)}%")
-            self.mp_progress_bar.set(mp_percent / 100.0)
-            self.mp_percent_label.configure(text=f"{int(mp_percent)}%")
-            
             # Read enemy HP percentage from config (updated by auto_attack in separate thread)
             # Reset enemy HP bar when auto attack is disabled
             if not config.auto_attack_enabled:
@@ -4439,101 +4610,151 @@ class BotGUI:
                 enemy_hp_percent = config.current_enemy_hp_percentage
                 enemy_name = config.current_enemy_name
             
-            if hasattr(self, 'enemy_hp_progress_bar'):
-                self.enemy_hp_progress_bar.set(enemy_hp_percent / 100.0)
-            if hasattr(self, 'enemy_hp_percent_label'):
-                self.enemy_hp_percent_label.configure(text=f"{int(enemy_hp_percent)}%" if enemy_hp_percent > 0 else "---%")
-            
-            # Read enemy name from config (updated by auto_attack/bot_logic in separate thread)
-            if hasattr(self, 'current_mob_label'):
-                if enemy_name:
-                    # Check if mob should be targeted (for color coding)
-                    if config.mob_detection_enabled and not auto_attack.should_target_current_mob():
-                        self.current_mob_label.configure(text=enemy_name, text_color="orange")
-                    else:
-                        self.current_mob_label.configure(text=enemy_name, text_color="green")
+            # Enemy name color: orange if mob would be skipped, green if targeted, red if none
+            if enemy_name:
+                if config.mob_detection_enabled and not auto_attack.should_target_current_mob():
+                    mob_color = "orange"
                 else:
-                    self.current_mob_label.configure(text="None", text_color="red")
+                    mob_color = "green"
+            else:
+                enemy_name = "None"
+                mob_color = "red"
             
-            # Update unstuck countdown when enemy HP is displayed
-            if hasattr(self, 'unstuck_countdown_label'):
-                import auto_unstuck
-                auto_unstuck.update_unstuck_countdown_display(time.time())
+            # Unstuck countdown is computed once and shared by both views
+            unstuck_text, unstuck_color = auto_unstuck.get_unstuck_countdown_display()
             
-            # Update minimized window if it exists
-            if self.is_minimized and self.minimized_window:
-                try:
-                    # Update minimized progress bars
-                    if hasattr(self, 'minimized_hp_progress_bar'):
-                        self.minimized_hp_progress_bar.set(hp_percent / 100.0)
-                        self.minimized_hp_percent_label.configure(text=f"{int(hp_percent)}%")
-                    if hasattr(self, 'minimized_mp_progress_bar'):
-                        self.minimized_mp_progress_bar.set(mp_percent / 100.0)
-                        self.minimized_mp_percent_label.configure(text=f"{int(mp_percent)}%")
-                    if hasattr(self, 'minimized_enemy_hp_progress_bar'):
-                        self.minimized_enemy_hp_progress_bar.set(enemy_hp_percent / 100.0)
-                        self.minimized_enemy_hp_percent_label.configure(text=f"{int(enemy_hp_percent)}%" if enemy_hp_percent > 0 else "---%")
-                    
-                    # Update minimized enemy name
-                    if hasattr(self, 'minimized_current_mob_label'):
-                        enemy_name = config.current_enemy_name
-                        if enemy_name:
-                            if config.mob_detection_enabled and not auto_attack.should_target_current_mob():
-                                self.minimized_current_mob_label.configure(text=enemy_name, text_color="orange")
-                            else:
-                                self.minimized_current_mob_label.configure(text=enemy_name, text_color="green")
-                        else:
-                            self.minimized_current_mob_label.configure(text="None", text_color="red")
-                    
-                    # Update minimized unstuck countdown
-                    if hasattr(self, 'minimized_unstuck_countdown_label'):
-                        import auto_unstuck
-                        current_time = time.time()
-                        _, remaining_time = auto_unstuck.get_unstuck_remaining_time(config.unstuck_timeout)
-                        if config.enemy_hp_stagnant_time == 0 or config.last_enemy_hp_before_stagnant is None:
-                            self.minimized_unstuck_countdown_label.configure(text="Unstuck: ---", text_color="gray")
-                        else:
-                            import math
-                            display_seconds = math.ceil(remaining_time)
-                            if remaining_time > config.unstuck_timeout * 0.5:
-                                color = "green"
-                            elif remaining_time > config.unstuck_timeout * 0.25:
-                                color = "yellow"
-                            else:
-                                color = "red"
-                            target_indicator = " (no target)" if config.enemy_target_time == 0 else ""
-                            self.minimized_unstuck_countdown_label.configure(
-                                text=f"Unstuck: {display_seconds}s{target_indicator}",
-                                text_color=color
-                            )
-                except Exception as e:
-                    # Ignore errors if minimized window was closed
-                    pass
-        
-        # Schedule next update (every 100ms for smooth display)
-        if config.bot_running:
-            self.root.after(100, self.update_status)
+            # Only the visible view is updated; the other one is hidden
+            if self.is_minimized:
+                if self.minimized_window:
+                    self._update_minimized_widgets(hp_percent, mp_percent, enemy_hp_percent, enemy_name, mob_color,
+                                                   unstuck_text, unstuck_color)
+            else:
+                self._update_maximized_widgets(hp_percent, mp_percent, enemy_hp_percent, enemy_name, mob_color,
+                                               unstuck_text, unstuck_color)
+    
+    def _update_maximized_widgets(self, hp_percent, mp_percent, enemy_hp_percent, enemy_name, mob_color,
+                                  unstuck_text, unstuck_color):
+        """Update progress bars and labels in the main window"""
+        self._set_ui('hp_bar', self.hp_progress_bar, 'set', hp_percent / 100.0)
+        self._set_ui('hp_percent', self.hp_percent_label, 'configure', _pct_text(hp_percent))
+        self._set_ui('mp_bar', self.mp_progress_bar, 'set', mp_percent / 100.0)
+        self._set_ui('mp_percent', self.mp_percent_label, 'configure', _pct_text(mp_percent))
+        
+        if self.enemy_hp_progress_bar is not None:
+            self._set_ui('enemy_hp_bar', self.enemy_hp_progress_bar, 'set', enemy_hp_percent / 100.0)
+        if self.enemy_hp_percent_label is not None:
+            self._set_ui('enemy_hp_percent', self.enemy_hp_percent_label, 'configure',
+                         _pct_text(enemy_hp_percent) if enemy_hp_percent > 0 else "---%")
+        
+        if self.current_mob_label is not None:
+            self._set_ui('current_mob', self.current_mob_label, 'configure', enemy_name, text_color=mob_color)
+        
+        # Update unstuck countdown when enemy HP is displayed
+        if self.unstuck_countdown_label is not None:
+            self._set_ui('unstuck', self.unstuck_countdown_label, 'configure', unstuck_text, text_color=unstuck_color)
+    
+    def _update_minimized_widgets(self, hp_percent, mp_percent, enemy_hp_percent, enemy_name, mob_color,
+                                  unstuck_text, unstuck_color):
+        """Update progress bars and labels in the minimized window"""
+        # Update minimized progress bars
+        if self.minimized_hp_progress_bar is not None:
+            self._set_ui('minimized_hp_bar', self.minimized_hp_progress_bar, 'set', hp_percent / 100.0)
+            self._set_ui('minimized_hp_percent', self.minimized_hp_percent_label, 'configure', _pct_text(hp_percent))
+        if self.minimized_mp_progress_bar is not None:
+            self._set_ui('minimized_mp_bar', self.minimized_mp_progress_bar, 'set', mp_percent / 100.0)
+            self._set_ui('minimized_mp_percent', self.minimized_mp_percent_label, 'configure', _pct_text(mp_percent))
+        if self.minimized_enemy_hp_progress_bar is not None:
+            self._set_ui('minimized_enemy_hp_bar', self.minimized_enemy_hp_progress_bar, 'set', enemy_hp_percent / 100.0)
+            self._set_ui('minimized_enemy_hp_percent', self.minimized_enemy_hp_percent_label, 'configure',
+                         _pct_text(enemy_hp_percent) if enemy_hp_percent > 0 else "---%")
+        
+        # Update minimized enemy name
+        if self.minimized_current_mob_label is not None:
+            self._set_ui('minimized_current_mob', self.minimized_current_mob_label, 'configure', enemy_name, text_color=mob_color)
+        
+        # Update minimized unstuck countdown
+        if self.minimized_unstuck_countdown_label is not None:
+            self._set_ui('minimized_unstuck', self.minimized_unstuck_countdown_label, 'configure',
+                         unstuck_text, text_color=unstuck_color)
+    
+    def _set_ui(self, key, widget, kind, value, **kwargs):
+        """Write a status widget only when its value changed since the last write"""
+        state = (value, kwargs)
+        last = self._last_ui.get(key)
+        if last == state:
+            return
+        self._last_ui[key] = state
+        if kind == 'set':
+            widget.set(value)
+        elif last is None:
+            widget.configure(text=value, **kwargs)
+        else:
+            # Only pass options that changed, e.g. skip text_color while the color bucket is the same
+            options = {name: v for name, v in kwargs.items() if last[1].get(name) != v}
+            if last[0] != value:
+                options['text'] = value
+            widget.configure(**options)
     
     def process_gui_updates(self):
         """Process queued GUI updates from background threads (thread-safe)"""
+        # Drain the whole (bounded) queue at once; updates with the same
+        # dedup_key collapse to the most recent one
+        pending = {}
         try:
-            # Process up to 100 updates per cycle to prevent blocking
-            for _ in range(100):
-                update_func = config.gui_update_queue.get_nowait()
-                update_func()  # Execute the queued GUI update
+            while True:
+                key, update_func = config.gui_update_queue.get_nowait()
+                if key is None:
+                    key = object()  # Unkeyed updates never coalesce
+                pending.pop(key, None)
+                pending[key] = update_func
         except queue.Empty:
             pass  # No more updates to process
         
-        # Schedule next check (every 50ms for responsive UI)
-        self.root.after(50, self.process_gui_updates)
+        if pending:
+            for update_func in pending.values():
+                try:
+                    update_func()  # Execute the queued GUI update
+                except Exception as e:
+                    print(f"Error in queued GUI update: {e}")
+            # Single redraw pass for the whole batch
+            self.root.update_idletasks()
+    
+    def _tick(self):
+        """Single GUI scheduler: drain queued updates, then refresh status at its own rate"""
+        tick_start = time.perf_counter()
+        
+        # Queue is drained first so the status read sees the latest state.
+        # Each step contains its own errors: this is the only GUI timer, so
+        # an exception escaping here would stop both for the rest of the session
+        try:
+            self.process_gui_updates()
+        except Exception as e:
+            print(f"Error processing GUI updates: {e}")
+            traceback.print_exc()
+        
+        self._tick_count += 1
+        if config.bot_running:
+            target_hz = STATUS_TARGET_HZ_MINIMIZED if self.is_minimized else STATUS_TARGET_HZ
+            if self._tick_count % max(1, GUI_TICK_HZ // target_hz) == 0:
+                try:
+                    self.update_status()
+                except Exception as e:
+                    print(f"Error updating status: {e}")
+                    traceback.print_exc()
+        
+        # Schedule next tick, subtracting the average tick cost so the
+        # effective rate stays close to the target
+        self._tick_durations.append(time.perf_counter() - tick_start)
+        mean_tick = sum(self._tick_durations) / len(self._tick_durations)
+        next_delay = max(10, int(1000 / GUI_TICK_HZ - mean_tick * 1000))
+        self.root.after(next_delay, self._tick)
     
     def toggle_minimize(self):
         """Toggle between minimized and maximized UI"""
         if self.is_minimized:
-            # Restore to maximized view
+            # Restore to maximized view (minimized window is kept for reuse)
             if self.minimized_window:
-                self.minimized_window.destroy()
-                self.minimized_window = None
+                self.minimized_window.withdraw()
             self.root.deiconify()
             # Restore saved window position and size
             if self.saved_window_position:
@@ -4549,21 +4770,24 @@ class BotGUI:
                 self.saved_window_position = geometry
             except:
                 self.saved_window_position = "655x800+100+100"
-            # Create minimized window at the same position
+            # Show minimized window at the same position (built on first use)
             self.create_minimized_window()
             self.minimize_button.configure(text="+")
             self.is_minimized = True
     
-    def create_minimized_window(self):
-        """Create a minimized window showing only progress bars"""
-        if self.minimized_window:
-            return
-        
-        # Create new window for minimized view
-        self.minimized_window = ctk.CTkToplevel(self.root)
-        self.minimized_window.title("Kathana Helper v2.1.2")
-        
-        # Position minimized window at the same location as main window
+    def _clear_minimized_widgets(self):
+        """Reset minimized status widget references"""
+        self.minimized_hp_progress_bar = None
+        self.minimized_hp_percent_label = None
+        self.minimized_mp_progress_bar = None
+        self.minimized_mp_percent_label = None
+        self.minimized_enemy_hp_progress_bar = None
+        self.minimized_enemy_hp_percent_label = None
+        self.minimized_current_mob_label = None
+        self.minimized_unstuck_countdown_label = None
+    
+    def _position_minimized_window(self):
+        """Position minimized window at the same location as main window"""
         if self.saved_window_position:
             # Extract position from geometry string (format: "WxH+X+Y")
             try:
@@ -4578,6 +4802,22 @@ class BotGUI:
                 self.minimized_window.geometry("350x180")
         else:
             self.minimized_window.geometry("350x180")
+    
+    def create_minimized_window(self):
+        """Create a minimized window showing only progress bars"""
+        fonts = _fonts()
+        if self.minimized_window:
+            # Reuse the existing window instead of rebuilding all widgets
+            self._position_minimized_window()
+            self.minimized_window.deiconify()
+            self.root.withdraw()
+            return
+        
+        # Create new window for minimized view
+        self.minimized_window = ctk.CTkToplevel(self.root)
+        self.minimized_window.title("Kathana Helper v2.1.2")
+        self._apply_icon(self.minimized_window)
+        self._position_minimized_window()
         
         self.minimized_window.resizable(False, False)
         self.minimized_window.overrideredirect(False)  # Keep window controls
@@ -4598,47 +4838,47 @@ class BotGUI:
         hp_bar_frame = ctk.CTkFrame(minimized_frame, fg_color="transparent")
         hp_bar_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=10, pady=(10, 5))
         
-        hp_label = ctk.CTkLabel(hp_bar_frame, text="HP:", width=70, anchor='w', font=ctk.CTkFont(size=11))
+        hp_label = ctk.CTkLabel(hp_bar_frame, text="HP:", width=70, anchor='w', font=fonts['small'])
         hp_label.grid(row=0, column=0, padx=(0, 10))
         self.minimized_hp_progress_bar = ctk.CTkProgressBar(hp_bar_frame, width=200, height=20, progress_color="red", corner_radius=0)
         self.minimized_hp_progress_bar.set(0)
         self.minimized_hp_progress_bar.grid(row=0, column=1, padx=(0, 10))
-        self.minimized_hp_percent_label = ctk.CTkLabel(hp_bar_frame, text="---%", font=ctk.CTkFont(size=11, weight="bold"), text_color="white")
+        self.minimized_hp_percent_label = ctk.CTkLabel(hp_bar_frame, text="---%", font=fonts['small_bold'], text_color="white")
         self.minimized_hp_percent_label.grid(row=0, column=2)
         
         # MP Progress Bar
         mp_bar_frame = ctk.CTkFrame(minimized_frame, fg_color="transparent")
         mp_bar_frame.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         
-        mp_label = ctk.CTkLabel(mp_bar_frame, text="MP:", width=70, anchor='w', font=ctk.CTkFont(size=11))
+        mp_label = ctk.CTkLabel(mp_bar_frame, text="MP:", width=70, anchor='w', font=fonts['small'])
         mp_label.grid(row=0, column=0, padx=(0, 10))
         self.minimized_mp_progress_bar = ctk.CTkProgressBar(mp_bar_frame, width=200, height=20, progress_color="#0b58b0", corner_radius=0)
         self.minimized_mp_progress_bar.set(0)
         self.minimized_mp_progress_bar.grid(row=0, column=1, padx=(0, 10))
-        self.minimized_mp_percent_label = ctk.CTkLabel(mp_bar_frame, text="---%", font=ctk.CTkFont(size=11, weight="bold"), text_color="white")
+        self.minimized_mp_percent_label = ctk.CTkLabel(mp_bar_frame, text="---%", font=fonts['small_bold'], text_color="white")
         self.minimized_mp_percent_label.grid(row=0, column=2)
         
         # Enemy HP Progress Bar
         enemy_hp_bar_frame = ctk.CTkFrame(minimized_frame, fg_color="transparent")
         enemy_hp_bar_frame.grid(row=2, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         
-        enemy_hp_label = ctk.CTkLabel(enemy_hp_bar_frame, text="Enemy HP:", width=70, anchor='w', font=ctk.CTkFont(size=11))
+        enemy_hp_label = ctk.CTkLabel(enemy_hp_bar_frame, text="Enemy HP:", width=70, anchor='w', font=fonts['small'])
         enemy_hp_label.grid(row=0, column=0, padx=(0, 10))
         self.minimized_enemy_hp_progress_bar = ctk.CTkProgressBar(enemy_hp_bar_frame, width=200, height=20, progress_color="green", corner_radius=0)
         self.minimized_enemy_hp_progress_bar.set(0)
         self.minimized_enemy_hp_progress_bar.grid(row=0, column=1, padx=(0, 10))
-        self.minimized_enemy_hp_percent_label = ctk.CTkLabel(enemy_hp_bar_frame, text="---%", font=ctk.CTkFont(size=11, weight="bold"), text_color="white")
+        self.minimized_enemy_hp_percent_label = ctk.CTkLabel(enemy_hp_bar_frame, text="---%", font=fonts['small_bold'], text_color="white")
         self.minimized_enemy_hp_percent_label.grid(row=0, column=2)
         
         # Enemy Name display
         enemy_name_frame = ctk.CTkFrame(minimized_frame, fg_color="transparent")
         enemy_name_frame.grid(row=3, column=0, columnspan=2, sticky="w", padx=10, pady=(5, 10))
         
-        enemy_name_label = ctk.CTkLabel(enemy_name_frame, text="Enemy Name:", width=70, anchor='w', font=ctk.CTkFont(size=11))
+        enemy_name_label = ctk.CTkLabel(enemy_name_frame, text="Enemy Name:", width=70, anchor='w', font=fonts['small'])
         enemy_name_label.grid(row=0, column=0, padx=(0, 10))
-        self.minimized_current_mob_label = ctk.CTkLabel(enemy_name_frame, text="None", width=170, anchor='w', font=ctk.CTkFont(size=11), text_color="red")
+        self.minimized_current_mob_label = ctk.CTkLabel(enemy_name_frame, text="None", width=170, anchor='w', font=fonts['small'], text_color="red")
         self.minimized_current_mob_label.grid(row=0, column=1, sticky="w", padx=(0, 10))
-        self.minimized_unstuck_countdown_label = ctk.CTkLabel(enemy_name_frame, text="Unstuck: ---", font=ctk.CTkFont(size=10), text_color="gray")
+        self.minimized_unstuck_countdown_label = ctk.CTkLabel(enemy_name_frame, text="Unstuck: ---", font=fonts['tiny'], text_color="gray")
         self.minimized_unstuck_countdown_label.grid(row=0, column=2)
         
         # Handle window close - restore to maximized
@@ -4651,29 +4891,9 @@ class BotGUI:
         # Update license status info
         self.update_license_status_info()
         
-        # Periodically update license status info (every 60 seconds) in background thread
-        def update_license_periodically():
-            """Update license status in background thread to avoid blocking UI"""
-            def check_license_thread():
-                """Background thread to check license"""
-                license_manager = get_license_manager()
-                license_info = license_manager.get_license_info()
-                
-                # Update GUI in main thread
-                def update_gui():
-                    self.refresh_license_status_display()
-                
-                # Schedule GUI update in main thread
-                self.root.after(0, update_gui)
-            
-            # Start background thread for license check
-            threading.Thread(target=check_license_thread, daemon=True).start()
-            
-            # Schedule next check
-            self.root.after(60000, update_license_periodically)  # Update every 60 seconds
-        
-        self.root.after(60000, update_license_periodically)
+        # Periodically re-check the license (every 60 seconds)
+        self.root.after(60000, self._periodic_license_tick)
         
-        # Start processing GUI updates from background threads
-        self.process_gui_updates()
+        # Start the GUI scheduler (queued updates from background threads + status display)
+        self._tick()
         self.root.mainloop()
@@ -1,6 +1,8 @@
 """
 Input handling functions for sending keys and mouse clicks to the game window
 """
+import threading
+from functools import wraps
 import win32api
 import win32con
 import win32gui
@@ -14,6 +16,21 @@ import debug_utils
 _movement_sequence_active = False
 _previous_foreground_hwnd = None
 
+# The bot loop and the buff loop both send input; every key/click down-up pair
+# (and a whole movement sequence) holds this so they never interleave.
+# Reentrant because send_input calls send_silent_key and movement sequences
+# call send_movement_key while already holding it.
+_input_lock = threading.RLock()
+
+
+def _serialized(func):
+    """Run func while holding the input lock"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with _input_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
 
 def get_virtual_key_code(key):
     """Convert key string to virtual key code"""
@@ -34,6 +51,7 @@ def get_virtual_key_code(key):
     return key_mappings.get(key.lower(), ord(key.upper()) if len(key) == 1 else 0)
 
 
+@_serialized
 def send_silent_key(hwnd, vk_code, use_scan_code=False):
     """Send a key press directly to a window handle without interfering with chat
     Supports scan codes for function keys (F1-F12) for better compatibility"""
@@ -64,6 +82,7 @@ def send_silent_key(hwnd, vk_code, use_scan_code=False):
     return True
 
 
+@_serialized
 def send_input(key):
     """Send input silently to connected window without interfering with chat
     Supports function keys (F1-F12) with scan codes for better compatibility"""
@@ -91,6 +110,8 @@ def send_input(key):
 def start_movement_sequence():
     """Start a movement sequence - sets foreground window once at the start"""
     global _movement_sequence_active, _previous_foreground_hwnd
+    # Held until end_movement_sequence so other threads can't type or click mid-sequence
+    _input_lock.acquire()
     try:
         if config.connected_window:
             hwnd = config.connected_window.handle
@@ -122,8 +143,11 @@ def end_movement_sequence():
         print(f"Error ending movement sequence: {e}")
         _movement_sequence_active = False
         _previous_foreground_hwnd = None
+    finally:
+        _input_lock.release()
 
 
+@_serialized
 def send_movement_key(key, hold_duration=0.15):
     """Send movement key with hold duration to actually move the character
     Note: Use start_movement_sequence() and end_movement_sequence() to manage
@@ -153,6 +177,7 @@ def send_movement_key(key, hold_duration=0.15):
         print(f"Error sending movement key {key}: {e}")
 
 
+@_serialized
 def perform_mouse_click():
     """Perform a left mouse click at current cursor position or specific coordinates"""
     try:
@@ -200,6 +225,7 @@ def perform_mouse_click():
             print(f"Error performing mouse click: {e2}")
 
 
+@_serialized
 def perform_mouse_click_at(screen_x, screen_y):
     """Perform a left mouse click at specific screen coordinates"""
     try:
@@ -274,6 +300,7 @@ def window_image_to_client(hwnd, window_x, window_y):
         return int(window_x), int(window_y)
 
 
+@_serialized
 def perform_mouse_click_client(hwnd, client_x, client_y):
     """Perform a left mouse click using client-area coordinates via PostMessage (works in background/alt-tab mode)."""
     try:
@@ -313,6 +340,7 @@ def perform_mouse_click_client(hwnd, client_x, client_y):
         return False
 
 
+@_serialized
 def perform_mouse_click_window_image(hwnd, window_x, window_y):
     """
     Click a point specified in 'window image' coordinates (same coordinate space as Calibrator.capture_window()).
@@ -24,31 +24,33 @@ def main():
         # License is invalid or missing - show only license dialog, hide main window
         print(f"License check failed: {message}")
         gui.root.withdraw()  # Hide main window
-        gui.show_license_dialog_blocking()  # Show blocking license dialog (waits until closed)
         
-        # After dialog closes, re-check license
-        print("License dialog closed, re-checking license...")
-        import time
-        time.sleep(0.5)  # Small delay to ensure file is fully written
-        is_valid, message, license_data = license_manager.validate_license()
-        if is_valid:
-            # License is now valid - show main app
-            print("License is now valid, showing main window...")
-            gui.root.deiconify()
-            gui.root.update_idletasks()
-            gui.root.lift()
-            gui.root.focus_force()
-            gui.root.update()
-            gui.run()
-        else:
-            # Still invalid - exit app
-            print(f"License still invalid after activation: {message}")
-            gui.root.quit()
+        def on_license_activated():
+            """Re-check the saved license and reveal the main window"""
+            print("License dialog closed, re-checking license...")
+            is_valid, message, license_data = license_manager.validate_license()
+            if is_valid:
+                # License is now valid - show main app
+                print("License is now valid, showing main window...")
+                gui.root.deiconify()
+                gui.root.lift()
+                gui.root.focus_force()
+            else:
+                # Still invalid - exit app
+                print(f"License still invalid after activation: {message}")
+                gui.root.destroy()
+        
+        def on_license_cancelled():
+            """Exit when the user closes the dialog without a valid license"""
+            gui.root.destroy()
+        
+        # The dialog runs inside the main loop; startup continues from the callbacks
+        gui.show_license_dialog_async(on_license_activated, on_license_cancelled)
     else:
         # License is valid - show main app directly
         print("License is valid, showing main window...")
-        gui.run()
-
+    
+    gui.run()
 
 if __name__ == "__main__":
     main()
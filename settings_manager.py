@@ -212,6 +212,7 @@ def load_settings():
         elif 'mob_skip_list' in settings:
             config.mob_target_list = settings['mob_skip_list']
             print("[Settings] Migrated mob_skip_list to mob_target_list (inverted logic)")
+        config._mob_target_list_lower = {t.lower() for t in config.mob_target_list}
         if 'mob_avoid_list' in settings:
             config.mob_avoid_list = settings['mob_avoid_list']
         if 'mob_detection_enabled' in settings:
@@ -309,6 +310,7 @@ def load_settings():
                         config.buffs_config[idx]['key'] = buff_data.get('key', '')
                 except (ValueError, KeyError):
                     continue
+            config.update_buffs_configured()
             print("Loaded buffs configuration")
         
         # Load skill sequence configuration
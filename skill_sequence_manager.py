@@ -35,6 +35,14 @@ class SkillSequenceManager:
             self.skills[idx] = None
             print(f'[SkillSequenceManager] Skill {idx + 1} cleared')
     
+    def set_bulk(self, image_paths):
+        """Replace all skill slots at once (one relative path or None per slot)"""
+        skills = list(image_paths[:len(self.skills)])
+        skills += [None] * (len(self.skills) - len(skills))
+        # Swap in a new list so the bot thread never iterates a half-updated one
+        self.skills = skills
+        print(f'[SkillSequenceManager] Skills set: {[i + 1 for i, path in enumerate(skills) if path]}')
+    
     def set_ui_reference(self, ui):
         """Set reference to UI (kept for compatibility; keys are no longer used)"""
         self.ui_reference = ui